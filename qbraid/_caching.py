@@ -17,12 +17,21 @@ import functools
 import hashlib
 import json
 import os
+import pickle
+import stat
+import tempfile
 import time
 from contextlib import contextmanager
-from typing import Any, Callable, Generator, Optional, TypeVar, overload
+from pathlib import Path
+from typing import Any, Callable, Generator, Optional, TypeVar, Union, overload
+
+from qbraid._logging import logger
 
 TFunc = TypeVar("TFunc", bound=Callable)
 
+DEFAULT_CACHE_MAX_BYTES = 256 * 1024**2
+
+_CACHE_FILE_SUFFIX = ".pkl"
 
 _CACHE_REGISTRY = []
 
@@ -156,3 +165,173 @@ def clear_cache():
     """
     for cache_clear in _CACHE_REGISTRY:
         cache_clear()
+
+
+def _is_private(stat_result: os.stat_result) -> bool:
+    """Return True if a file is owned by the current user and not writable by anyone else."""
+    if not hasattr(os, "getuid"):
+        return True
+    return stat_result.st_uid == os.getuid() and not stat_result.st_mode & (
+        stat.S_IWGRP | stat.S_IWOTH
+    )
+
+
+class DiskCache:
+    """Size-bounded, least-recently-used cache of pickled objects stored on disk.
+
+    Each entry is written to a temporary file and moved into place with :func:`os.replace`,
+    which makes writes atomic and safe across concurrent processes sharing the same
+    directory. Recency is tracked through file modification times, and the least-recently-used
+    entries are evicted whenever the total size of the cache exceeds ``max_bytes``.
+
+    Loading a pickle can execute arbitrary code, so entries are only read from and written to
+    a directory that, like the entries themselves, is owned by the current user and not
+    writable by group or others. New directories are created with owner-only permissions.
+
+    Args:
+        directory (str | Path): Directory in which to store cache entries.
+        max_bytes (int): Maximum total size of the cache in bytes. Defaults to 256 MiB.
+    """
+
+    def __init__(
+        self, directory: Union[str, os.PathLike], max_bytes: int = DEFAULT_CACHE_MAX_BYTES
+    ):
+        if max_bytes <= 0:
+            raise ValueError("Maximum cache size must be a positive number of bytes.")
+
+        self._directory = Path(directory).expanduser()
+        self._max_bytes = max_bytes
+
+    @property
+    def directory(self) -> Path:
+        """Return the directory in which cache entries are stored."""
+        return self._directory
+
+    @property
+    def max_bytes(self) -> int:
+        """Return the maximum total size of the cache in bytes."""
+        return self._max_bytes
+
+    def _path(self, key: str) -> Path:
+        """Return the path of the cache entry for the given key."""
+        return self._directory / f"{key}{_CACHE_FILE_SUFFIX}"
+
+    def _entries(self) -> list[os.DirEntry]:
+        """Return the cache entries currently stored on disk."""
+        try:
+            with os.scandir(self._directory) as entries:
+                return [
+                    entry
+                    for entry in entries
+                    if entry.is_file() and entry.name.endswith(_CACHE_FILE_SUFFIX)
+                ]
+        except FileNotFoundError:
+            return []
+
+    def _directory_is_private(self) -> bool:
+        """Return True if the cache directory is safe to load entries from and write to."""
+        try:
+            private = _is_private(self._directory.stat())
+        except FileNotFoundError:
+            return False
+        if not private:
+            logger.warning(
+                "Ignoring cache directory %s: it must be owned by the current user "
+                "and not writable by group or others.",
+                self._directory,
+            )
+        return private
+
+    def get(self, key: str) -> Any:
+        """Return the cached object for the given key, or None if there is no valid entry."""
+        path = self._path(key)
+        if not self._directory_is_private():
+            return None
+        try:
+            with open(path, "rb") as file:
+                if not _is_private(os.fstat(file.fileno())):
+                    logger.warning(
+                        "Ignoring cache entry %s not owned by the current user", path.name
+                    )
+                    return None
+                value = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            logger.warning("Discarding unreadable cache entry %s: %s", path.name, err)
+            self._remove(path)
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Atomically write an object to the cache and evict entries beyond the size limit."""
+        self._directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if not self._directory_is_private():
+            return
+        fd, tmp_path = tempfile.mkstemp(dir=self._directory, prefix=f".{key}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(key))
+        except Exception:
+            self._remove(Path(tmp_path))
+            raise
+
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove least-recently-used entries until the cache fits within ``max_bytes``."""
+        entries = []
+        total_size = 0
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total_size += stat.st_size
+
+        if total_size <= self._max_bytes:
+            return
+
+        entries.sort()
+        for _, size, path in entries:
+            if total_size <= self._max_bytes:
+                break
+            self._remove(Path(path))
+            total_size -= size
+
+    def size(self) -> int:
+        """Return the total size in bytes of all entries in the cache."""
+        total_size = 0
+        for entry in self._entries():
+            try:
+                total_size += entry.stat().st_size
+            except FileNotFoundError:
+                continue
+        return total_size
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        for entry in self._entries():
+            self._remove(Path(entry.path))
+
+    @staticmethod
+    def _remove(path: Path) -> None:
+        """Remove a file, ignoring the case where another process already removed it."""
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def __len__(self) -> int:
+        return len(self._entries())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(directory='{self._directory}', max_bytes={self._max_bytes})"
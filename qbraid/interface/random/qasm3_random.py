@@ -12,7 +12,8 @@
 Module for generating random OpenQASM 3 programs
 
 """
-from typing import Optional
+
+from typing import Iterator, Optional
 
 import numpy as np
 
@@ -71,6 +72,183 @@ def create_gateset_qasm(max_operands: int) -> np.ndarray:
     return gates_array
 
 
+def _validate_options(rng: np.random.Generator, **options: Optional[int]) -> dict[str, int]:
+    """Check that circuit options are positive integers, drawing missing values from rng."""
+    values = {}
+    for name, value in options.items():
+        if value is None:
+            value = int(rng.integers(1, 4))
+        elif not isinstance(value, int) or value <= 0:
+            raise ValueError(f"Invalid random circuit option. '{name}' must be a positive integer.")
+        values[name] = value
+    return values
+
+
+def _resolve_seed(seed: Optional[int]) -> int:
+    """Return the given seed, or a fresh one drawn without touching the global numpy state."""
+    if seed is None:
+        return int(np.random.default_rng().integers(0, np.iinfo(np.int32).max))
+    return seed
+
+
+def _options_rng(seed: int) -> np.random.Generator:
+    """Return a generator for unspecified circuit options, independent of the gate stream."""
+    return np.random.default_rng(np.random.SeedSequence(seed).spawn(1)[0])
+
+
+def _generate_qasm3_random(
+    num_qubits: int, depth: int, max_operands: int, seed: int, measure: bool
+) -> Iterator[str]:
+    """Yield the chunks of a random OpenQASM 3 program; see :func:`qasm3_random_stream`."""
+    rng = np.random.default_rng(seed)
+
+    yield f"""
+// Generated by qBraid v{__version__}
+OPENQASM 3.0;
+include "stdgates.inc";
+/*
+    seed = {seed}
+    num_qubits = {num_qubits}
+    depth = {depth}
+    max_operands = {max_operands}
+*/
+"""
+    max_operands = min(max_operands, num_qubits)
+    yield f"qubit[{num_qubits}] q;\n" + (f"bit[{num_qubits}] c;\n" if measure else "")
+
+    qubit_names = [f"q[{i}]" for i in range(num_qubits)]
+    qubits = np.arange(num_qubits)
+    gates = create_gateset_qasm(max_operands)
+
+    for _ in range(depth):
+        gate_specs = rng.choice(gates, size=num_qubits)
+        cumulative_qubits = np.cumsum(gate_specs["num_qubits"], dtype=np.int64)
+
+        max_index = np.searchsorted(cumulative_qubits, num_qubits, side="right")
+        gate_specs = gate_specs[:max_index]
+        slack = num_qubits - cumulative_qubits[max_index - 1]
+        if slack:
+            # Remaining layers also draw from the single-qubit gate set. This is part of the
+            # seeded output, so changing it would change every previously generated program.
+            gates = create_gateset_qasm(1)
+            slack_gates = rng.choice(gates, size=slack)
+            gate_specs = np.hstack((gate_specs, slack_gates))
+
+        q_bounds = np.zeros(len(gate_specs) + 1, dtype=np.int64)
+        p_bounds = np.zeros(len(gate_specs) + 1, dtype=np.int64)
+        np.cumsum(gate_specs["num_qubits"], out=q_bounds[1:])
+        np.cumsum(gate_specs["num_params"], out=p_bounds[1:])
+        parameters = [str(value) for value in rng.uniform(0, 2 * np.pi, size=p_bounds[-1])]
+        operands = [qubit_names[index] for index in qubits.tolist()]
+        q_bounds = q_bounds.tolist()
+        p_bounds = p_bounds.tolist()
+
+        lines = []
+        for i, gate in enumerate(gate_specs["gate"].tolist()):
+            qubit_args = ",".join(operands[q_bounds[i] : q_bounds[i + 1]])
+            if p_bounds[i] != p_bounds[i + 1]:
+                params = ",".join(parameters[p_bounds[i] : p_bounds[i + 1]])
+                lines.append(f"{gate}({params}) {qubit_args};\n")
+            else:
+                lines.append(f"{gate} {qubit_args};\n")
+        yield "".join(lines)
+
+        qubits = rng.permutation(qubits)
+
+    if measure:
+        yield "".join(f"c[{i}] = measure q[{i}];\n" for i in range(num_qubits))
+
+
+def qasm3_random_stream(
+    num_qubits: Optional[int] = None,
+    depth: Optional[int] = None,
+    max_operands: Optional[int] = None,
+    seed: Optional[int] = None,
+    measure: bool = False,
+) -> Iterator[str]:
+    """Generate a random OpenQASM 3 program as a stream of text chunks.
+
+    The header, the declarations, each layer of gates, and the measurements are yielded
+    as separate chunks, so that large programs can be written out without being held in
+    memory as a whole. Random numbers are drawn from a local ``numpy.random.Generator``
+    only, so concurrent calls do not interfere, and the joined chunks are identical to
+    the output of :func:`_qasm3_random` for the same options and seed.
+
+    Args:
+        num_qubits (int): Number of quantum wires.
+        depth (int): Layers of operations (i.e., critical path length).
+        max_operands (int): Maximum size of gate for each operation.
+        seed (int): Seed for random number generator.
+        measure (bool): Whether to include measurement gates.
+
+    Raises:
+        ValueError: When invalid random circuit options are given.
+
+    Returns:
+        Iterator[str]: Chunks of the OpenQASM 3 program.
+    """
+    seed = _resolve_seed(seed)
+    options = _validate_options(
+        _options_rng(seed), num_qubits=num_qubits, depth=depth, max_operands=max_operands
+    )
+    return _generate_qasm3_random(seed=seed, measure=measure, **options)
+
+
+def qasm3_random_batch(  # pylint: disable=too-many-arguments
+    num_circuits: int,
+    num_qubits: Optional[int] = None,
+    depth: Optional[int] = None,
+    max_operands: Optional[int] = None,
+    seed: Optional[int] = None,
+    measure: bool = False,
+) -> list[str]:
+    """Generate a batch of random OpenQASM 3 programs of the same shape.
+
+    A seed for each program is drawn at once from a generator seeded with ``seed``, and
+    unspecified circuit options are chosen once for the whole batch. Program ``i`` is
+    identical to ``_qasm3_random`` called with the same options and the ``i``-th seed,
+    which is recorded in the program header.
+
+    Args:
+        num_circuits (int): Number of programs to generate.
+        num_qubits (int): Number of quantum wires.
+        depth (int): Layers of operations (i.e., critical path length).
+        max_operands (int): Maximum size of gate for each operation.
+        seed (int): Seed for the random number generator of the batch.
+        measure (bool): Whether to include measurement gates.
+
+    Raises:
+        ValueError: When invalid random circuit options are given.
+        QbraidError: When failed to create random OpenQASM 3 programs.
+
+    Returns:
+        list[str]: The OpenQASM 3 programs.
+    """
+    if not isinstance(num_circuits, int) or num_circuits < 0:
+        raise ValueError(
+            "Invalid random circuit option. 'num_circuits' must be a non-negative integer."
+        )
+
+    try:
+        seed = _resolve_seed(seed)
+        options_rng = _options_rng(seed)
+        seeds = np.random.default_rng(seed).integers(0, np.iinfo(np.int32).max, size=num_circuits)
+    except Exception as err:
+        raise QbraidError("Failed to create random OpenQASM 3 programs") from err
+
+    options = _validate_options(
+        options_rng, num_qubits=num_qubits, depth=depth, max_operands=max_operands
+    )
+
+    try:
+        return [
+            "".join(_generate_qasm3_random(seed=child, measure=measure, **options))
+            for child in seeds.tolist()
+        ]
+    except Exception as err:
+        raise QbraidError("Failed to create random OpenQASM 3 programs") from err
+
+
 def _qasm3_random(
     num_qubits: Optional[int] = None,
     depth: Optional[int] = None,
@@ -94,82 +272,17 @@ def _qasm3_random(
     Returns:
         str: OpenQASM 3 program.
     """
-
-    def validate_and_assign(value: Optional[int], name: str) -> int:
-        if value is None:
-            return np.random.randint(1, 4)
-        if not isinstance(value, int) or value <= 0:
-            raise ValueError(f"Invalid random circuit option. '{name}' must be a positive integer.")
-        return value
-
-    num_qubits = validate_and_assign(num_qubits, "num_qubits")
-    depth = validate_and_assign(depth, "depth")
-    max_operands = validate_and_assign(max_operands, "max_operands")
-
     try:
-        if seed is None:
-            seed = np.random.randint(0, np.iinfo(np.int32).max)
-        np.random.seed(seed)
-        rng = np.random.default_rng(seed)
+        seed = _resolve_seed(seed)
+        options_rng = _options_rng(seed)
+    except Exception as err:
+        raise QbraidError("Failed to create random OpenQASM 3 program") from err
 
-        qasm_code_header = f"""
-// Generated by qBraid v{__version__}
-OPENQASM 3.0;
-include "stdgates.inc";
-/*
-    seed = {seed}
-    num_qubits = {num_qubits}
-    depth = {depth}
-    max_operands = {max_operands}
-*/
-"""
-        max_operands = min(max_operands, num_qubits)
-        rand_circuit = qasm_code_header + f"qubit[{num_qubits}] q;\n"
-        if measure:
-            rand_circuit += f"bit[{num_qubits}] c;\n"
-
-        qubits = np.arange(num_qubits)
-        gates = create_gateset_qasm(max_operands)
-
-        for _ in range(depth):
-            gate_specs = rng.choice(gates, size=num_qubits)
-            cumulative_qubits = np.cumsum(gate_specs["num_qubits"], dtype=np.int64)
-
-            max_index = np.searchsorted(cumulative_qubits, num_qubits, side="right")
-            gate_specs = gate_specs[:max_index]
-            slack = num_qubits - cumulative_qubits[max_index - 1]
-            if slack:
-                gates = create_gateset_qasm(1)
-                slack_gates = rng.choice(gates, size=slack)
-                gate_specs = np.hstack((gate_specs, slack_gates))
-
-            q_indices = np.empty(len(gate_specs) + 1, dtype=np.int64)
-            p_indices = np.empty(len(gate_specs) + 1, dtype=np.int64)
-            q_indices[0] = p_indices[0] = 0
-            np.cumsum(gate_specs["num_qubits"], out=q_indices[1:])
-            np.cumsum(gate_specs["num_params"], out=p_indices[1:])
-            parameters = rng.uniform(0, 2 * np.pi, size=p_indices[-1])
-            for i, (gate, _, p) in enumerate(gate_specs):
-                if p:
-                    params = ",".join(
-                        str(parameters[j]) for j in range(p_indices[i], p_indices[i + 1])
-                    )
-                    qubit_indices = ",".join(
-                        f"q[{qubits[j]}]" for j in range(q_indices[i], q_indices[i + 1])
-                    )
-                    rand_circuit += f"{gate}({params}) {qubit_indices};\n"
-                else:
-                    qubit_indices = ",".join(
-                        f"q[{qubits[j]}]" for j in range(q_indices[i], q_indices[i + 1])
-                    )
-                    rand_circuit += f"{gate} {qubit_indices};\n"
-            qubits = rng.permutation(qubits)
-
-        if measure:
-            for i in range(num_qubits):
-                rand_circuit += f"c[{i}] = measure q[{i}];\n"
-
-        return rand_circuit
+    options = _validate_options(
+        options_rng, num_qubits=num_qubits, depth=depth, max_operands=max_operands
+    )
 
+    try:
+        return "".join(_generate_qasm3_random(seed=seed, measure=measure, **options))
     except Exception as err:
         raise QbraidError("Failed to create random OpenQASM 3 program") from err
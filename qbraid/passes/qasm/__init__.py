@@ -34,6 +34,16 @@ Functions
     has_measurements
     remove_measurements
     remove_include_statements
+    register_qasm_pass
+    register_decomposition_rule
+
+Classes
+----------
+
+.. autosummary::
+   :toctree: ../stubs/
+
+    QasmPassManager
 
 """
 from .analyze import depth, has_measurements
@@ -47,8 +57,9 @@ from .compat import (
     remove_stdgates_include,
     replace_gate_names,
 )
-from .decompose import decompose_qasm2, decompose_qasm3, rebase
+from .decompose import decompose_qasm2, decompose_qasm3, rebase, register_decomposition_rule
 from .format import remove_unused_gates
+from .pipeline import QasmPassManager, register_qasm_pass
 from .unfold import unfold_qasm2
 
 __all__ = [
@@ -67,4 +78,7 @@ __all__ = [
     "has_measurements",
     "remove_measurements",
     "remove_include_statements",
+    "register_qasm_pass",
+    "register_decomposition_rule",
+    "QasmPassManager",
 ]
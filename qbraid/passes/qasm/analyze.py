@@ -14,8 +14,9 @@ Functions for analyzing OpenQASM programs.
 """
 from __future__ import annotations
 
-from typing import Optional, Union
+from typing import Any, Iterator, Optional, Union
 
+from openqasm3 import dumps
 from openqasm3.ast import (
     BinaryExpression,
     BitType,
@@ -24,8 +25,10 @@ from openqasm3.ast import (
     Concatenation,
     Expression,
     Identifier,
+    Include,
     IndexedIdentifier,
     IntegerLiteral,
+    IODeclaration,
     Program,
     QuantumBarrier,
     QuantumGate,
@@ -37,6 +40,8 @@ from openqasm3.ast import (
 )
 from openqasm3.parser import parse
 
+from .expressions import fold_expression
+
 
 def has_measurements(program: Union[Program, str]) -> bool:
     """Check if the program has any measurement operations."""
@@ -191,3 +196,91 @@ def depth(
 
                 max_depth = max(counts.values())
     return counts
+
+
+def _qubit_indices(
+    qubit: Union[Identifier, IndexedIdentifier], registers: dict[str, tuple[int, int]]
+) -> list[Union[int, str]]:
+    """Return the global indices of the qubits referenced by an operand, or its text if
+    the reference cannot be resolved statically."""
+    if isinstance(qubit, Identifier) and qubit.name in registers:
+        offset, size = registers[qubit.name]
+        return list(range(offset, offset + size))
+    if (
+        isinstance(qubit, IndexedIdentifier)
+        and qubit.name.name in registers
+        and len(qubit.indices) == 1
+        and isinstance(qubit.indices[0], list)
+        and len(qubit.indices[0]) == 1
+    ):
+        offset, size = registers[qubit.name.name]
+        index = fold_expression(qubit.indices[0][0])
+        if isinstance(index, int) and -size <= index < size:
+            return [offset + index % size]
+    return [dumps(qubit)]
+
+
+def _broadcast(
+    name: str, params: tuple[Any, ...], operands: list[list[Union[int, str]]]
+) -> Iterator[tuple[str, tuple[Any, ...], tuple[Union[int, str], ...]]]:
+    """Expand an operation applied to whole registers into one operation per qubit."""
+    width = max((len(operand) for operand in operands), default=1)
+    for i in range(width):
+        yield name, params, tuple(operand[i if len(operand) > 1 else 0] for operand in operands)
+
+
+def gate_signatures(
+    program: Union[Program, str]
+) -> Iterator[tuple[str, tuple[Any, ...], tuple[Union[int, str], ...]]]:
+    """Yield the name, parameters, and qubit indices of each quantum operation in a program.
+
+    Qubits are numbered across all registers in declaration order, operations applied to
+    whole registers are expanded into one operation per qubit, and constant parameter
+    expressions are evaluated. Gate definitions and classical control flow are yielded
+    by statement type with their OpenQASM text as the only parameter.
+
+    Args:
+        program (Program | str): The OpenQASM 2 or 3 program.
+
+    Returns:
+        Iterator[tuple[str, tuple, tuple]]: The (name, parameters, qubits) of each operation.
+    """
+    program = parse(program) if isinstance(program, str) else program
+    registers: dict[str, tuple[int, int]] = {}
+    num_qubits = 0
+
+    for statement in program.statements:
+        if isinstance(statement, QubitDeclaration):
+            size = expression_value_option(statement.size)
+            size = 1 if size is None else size
+            registers[statement.qubit.name] = (num_qubits, size)
+            num_qubits += size
+        elif isinstance(statement, (Include, ClassicalDeclaration, IODeclaration)):
+            continue
+        elif isinstance(statement, QuantumGate):
+            modifiers = "".join(
+                f"{modifier.modifier.name}"
+                + ("" if modifier.argument is None else f"({dumps(modifier.argument)})")
+                + "@"
+                for modifier in statement.modifiers
+            )
+            params = []
+            for argument in statement.arguments:
+                value = fold_expression(argument)
+                params.append(dumps(argument) if value is None else value)
+            operands = [_qubit_indices(qubit, registers) for qubit in statement.qubits]
+            yield from _broadcast(modifiers + statement.name.name, tuple(params), operands)
+        elif isinstance(statement, QuantumMeasurementStatement):
+            target = () if statement.target is None else (dumps(statement.target),)
+            yield from _broadcast(
+                "measure", target, [_qubit_indices(statement.measure.qubit, registers)]
+            )
+        elif isinstance(statement, QuantumReset):
+            yield from _broadcast("reset", (), [_qubit_indices(statement.qubits, registers)])
+        elif isinstance(statement, QuantumBarrier):
+            qubits = [
+                index for qubit in statement.qubits for index in _qubit_indices(qubit, registers)
+            ]
+            yield "barrier", (), tuple(qubits)
+        else:
+            yield type(statement).__name__, (dumps(statement),), ()
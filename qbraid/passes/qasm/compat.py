@@ -20,9 +20,8 @@ from typing import Union
 
 from openqasm3 import dumps, parse
 from openqasm3.ast import Include, Program, QuantumGate, QuantumMeasurementStatement, Statement
-from openqasm3.parser import QASM3ParsingError
 
-from qbraid._logging import logger
+from .expressions import evaluate_expression
 
 GATE_DEFINITIONS = {
     "iswap": """
@@ -176,9 +175,9 @@ def _evaluate_expression(match):
     """Helper function for simplifying arithmetic expressions within parentheses."""
     expr = match.group(1)
     try:
-        simplified_value = eval(expr)  # pylint: disable=eval-used
+        simplified_value = evaluate_expression(expr)
         return f"({simplified_value})"
-    except SyntaxError:
+    except ValueError:
         return match.group(0)
 
 
@@ -190,41 +189,57 @@ def simplify_arithmetic_expressions(qasm_str: str) -> str:
     return re.sub(pattern, _evaluate_expression, qasm_str)
 
 
-def convert_qasm_pi_to_decimal(qasm: str) -> str:
-    """Convert all instances of 'pi' in the QASM string to their decimal value."""
+_PI_EXPRESSION_PATTERN = re.compile(
+    r"(?<![\w.])(\d*\.?\d*\s*[*/+-]\s*)?pi(\s*[*/+-]\s*\d*\.?\d*)?(?![\w.])"
+)
 
-    pattern = r"(?<![a-zA-Z])(\d*\.?\d*\s*[*/+-]\s*)?pi(\s*[*/+-]\s*\d*\.?\d*)?(?![a-zA-Z])"
 
-    gate_defs = set()
+def _adjacent_operator(qasm: str, index: int, step: int) -> str:
+    """Return the operator nearest to index in the given direction, skipping whitespace."""
+    while 0 <= index < len(qasm) and qasm[index].isspace():
+        index += step
+    if not 0 <= index < len(qasm) or qasm[index] not in "+-*/%^":
+        return ""
+    if qasm[index] == "*" and 0 <= index + step < len(qasm) and qasm[index + step] == "*":
+        return "**"
+    return qasm[index]
 
-    try:
-        program = parse(qasm)
 
-        for statement in program.statements:
-            if isinstance(statement, QuantumGate):
-                name = statement.name.name
-                if "pi" in name:
-                    gate_defs.add(name)
-    except QASM3ParsingError as err:
-        logger.debug("Failed to parse QASM program for pi conversion: %s", err)
+def _can_fold_in_context(qasm: str, match: re.Match) -> bool:
+    """Whether folding a matched pi expression preserves operator precedence in context."""
+    prefix, suffix = match.groups()
+    if not prefix and not suffix:
+        return True
 
-    def replace_with_decimal(match: re.Match) -> str:
-        expr: str = match.group()
-        start = match.start()
-        end = match.end()
+    additive = any(op in (prefix or "") + (suffix or "") for op in "+-")
+    before = _adjacent_operator(qasm, match.start() - 1, -1)
+    after = _adjacent_operator(qasm, match.end(), 1)
 
-        for gate_def in gate_defs:
-            if gate_def in qasm[max(0, start - len(gate_def)) : end]:
-                return expr  # pragma: no cover
+    if before in {"/", "%", "^", "**"} or after in {"%", "^", "**"}:
+        return False
+    if additive and (before in {"*", "-"} or after in {"*", "/"}):
+        return False
+    return True
 
-        expr_with_pi_as_decimal = expr.replace("pi", str(math.pi))
-        try:
-            value = eval(expr_with_pi_as_decimal)  # pylint: disable=eval-used
-        except SyntaxError:
-            return expr
-        return str(value)
 
-    return re.sub(pattern, replace_with_decimal, qasm)
+def convert_qasm_pi_to_decimal(qasm: str) -> str:
+    """Convert all instances of 'pi' in the QASM string to their decimal value.
+
+    Simple arithmetic with numeric literals directly adjacent to ``pi`` (e.g. ``3*pi/4``)
+    is folded into a single decimal value, unless neighboring operators bind more tightly,
+    in which case only ``pi`` itself is replaced.
+    """
+
+    def replace_with_decimal(match: re.Match) -> str:
+        expr: str = match.group()
+        if _can_fold_in_context(qasm, match):
+            try:
+                return str(evaluate_expression(expr))
+            except ValueError:
+                pass
+        return expr.replace("pi", str(math.pi))
+
+    return _PI_EXPRESSION_PATTERN.sub(replace_with_decimal, qasm)
 
 
 def has_redundant_parentheses(qasm_str: str) -> bool:
@@ -13,7 +13,8 @@ Module for providing transforamtions with basis gates.
 across various other quantum software frameworks.
 
 """
-from typing import Optional, Union
+from copy import deepcopy
+from typing import Callable, Hashable, Optional, Union
 
 from openqasm3 import ast, dumps
 from openqasm3.parser import QASM3ParsingError, parse
@@ -304,22 +305,156 @@ def _decompose_cz(gate: ast.QuantumGate) -> list[ast.Statement]:
     return decompose(ast.Program(statements=[crz_pi, s])).statements
 
 
+DecompositionRule = Callable[[ast.QuantumGate], list[ast.Statement]]
+
+_DECOMPOSITION_RULES: dict[str, DecompositionRule] = {
+    "crx": _decompose_crx,
+    "cry": _decompose_cry,
+    "crz": _decompose_crz,
+    "cy": _decompose_cy,
+    "cz": _decompose_cz,
+}
+
+
+def register_decomposition_rule(
+    gate_name: str, rule: DecompositionRule, overwrite: bool = False
+) -> None:
+    """Register a rule used by :func:`decompose` and :func:`rebase` to decompose a gate.
+
+    Args:
+        gate_name (str): Name of the gate the rule decomposes.
+        rule (Callable[[QuantumGate], list[Statement]]): Function that returns the statements
+            equivalent to the given gate. The rule must build its output from the qubit operands
+            of the input gate, so that the decomposition can be cached as a template and reused
+            for every instance of the gate with the same parameter expressions.
+        overwrite (bool): Whether to replace an existing rule for the same gate.
+
+    Raises:
+        ValueError: If a rule for the gate already exists and overwrite is False.
+    """
+    if gate_name in _DECOMPOSITION_RULES and not overwrite:
+        raise ValueError(f"Decomposition rule for gate '{gate_name}' is already registered.")
+    _DECOMPOSITION_RULES[gate_name] = rule
+
+
+def unregister_decomposition_rule(gate_name: str) -> None:
+    """Remove the decomposition rule registered for the given gate, if any."""
+    _DECOMPOSITION_RULES.pop(gate_name, None)
+
+
+def get_decomposition_rules() -> dict[str, DecompositionRule]:
+    """Return a copy of the registry mapping gate names to decomposition rules."""
+    return dict(_DECOMPOSITION_RULES)
+
+
+def _expression_key(expression: ast.Expression) -> Hashable:
+    """Return a hashable key identifying the structure of a classical expression."""
+    if isinstance(expression, ast.Identifier):
+        return expression.name
+    if isinstance(expression, (ast.FloatLiteral, ast.IntegerLiteral)):
+        return (type(expression).__name__, expression.value)
+    if isinstance(expression, ast.UnaryExpression):
+        return (expression.op.name, _expression_key(expression.expression))
+    if isinstance(expression, ast.BinaryExpression):
+        return (
+            expression.op.name,
+            _expression_key(expression.lhs),
+            _expression_key(expression.rhs),
+        )
+    if isinstance(expression, ast.FunctionCall):
+        return (expression.name.name, *(_expression_key(arg) for arg in expression.arguments))
+    return dumps(expression)
+
+
+# (gate name, gate arguments, indices into the qubit operands of the decomposed gate)
+_GateTemplate = tuple[str, list[ast.Expression], tuple[int, ...]]
+
+
+class _DecompositionCache:
+    """Applies decomposition rules, caching results per (gate name, parameters) template.
+
+    Each rule is run once per distinct signature on a gate with placeholder qubits. Every
+    further instance with the same signature only substitutes its qubit operands into the
+    cached template.
+    """
+
+    def __init__(self, rules: dict[str, DecompositionRule]):
+        self._rules = rules
+        self._templates: dict[Hashable, Optional[list[_GateTemplate]]] = {}
+
+    def _build_template(
+        self, gate: ast.QuantumGate, rule: DecompositionRule
+    ) -> Optional[list[_GateTemplate]]:
+        """Run a rule on placeholder qubits and record which operand each output gate uses."""
+        placeholders = [ast.Identifier(name=f"__q{i}") for i in range(len(gate.qubits))]
+        placeholder_index = {id(qubit): i for i, qubit in enumerate(placeholders)}
+        template_gate = ast.QuantumGate(
+            modifiers=[],
+            name=ast.Identifier(name=gate.name.name),
+            arguments=gate.arguments,
+            qubits=placeholders,
+        )
+
+        template = []
+        for statement in rule(template_gate):
+            if not isinstance(statement, ast.QuantumGate) or statement.modifiers:
+                return None
+            try:
+                indices = tuple(placeholder_index[id(qubit)] for qubit in statement.qubits)
+            except KeyError:
+                return None
+            template.append((statement.name.name, statement.arguments, indices))
+        return template
+
+    def expand(self, gate: ast.QuantumGate) -> list[ast.Statement]:
+        """Return the decomposition of a gate for which a rule is registered."""
+        rule = self._rules[gate.name.name]
+        if gate.modifiers:
+            return rule(gate)
+
+        key = (gate.name.name, len(gate.qubits), *map(_expression_key, gate.arguments))
+        if key not in self._templates:
+            self._templates[key] = self._build_template(gate, rule)
+
+        template = self._templates[key]
+        if template is None:
+            return rule(gate)
+
+        qubits = gate.qubits
+        return [
+            ast.QuantumGate(
+                modifiers=[],
+                name=ast.Identifier(name=name),
+                arguments=deepcopy(arguments) if arguments else [],
+                qubits=[qubits[i] for i in indices],
+            )
+            for name, arguments, indices in template
+        ]
+
+
 def decompose(program: ast.Program, gateset: Optional[set[str]] = None) -> ast.Program:
-    """Decompose a program into its basic gate equivalents."""
-    decomposition_map = {
-        "crx": _decompose_crx,
-        "cry": _decompose_cry,
-        "crz": _decompose_crz,
-        "cy": _decompose_cy,
-        "cz": _decompose_cz,
-    }
+    """Decompose a program into its basic gate equivalents.
+
+    Gates with a registered decomposition rule that are not in the given gate set are
+    replaced by their decomposition. Decompositions are computed once per distinct
+    (gate name, parameter expressions) signature, so the cost is linear in program size.
+
+    Args:
+        program (ast.Program): The program to decompose.
+        gateset (set[str], optional): Gates that should be kept as-is. If None, every gate
+            with a registered decomposition rule is decomposed.
+
+    Returns:
+        ast.Program: The decomposed program.
+    """
+    cache = _DecompositionCache(_DECOMPOSITION_RULES)
 
     transformed_statements = []
     for statement in program.statements:
         if isinstance(statement, ast.QuantumGate):
             gate_name = statement.name.name
-            if gate_name in decomposition_map and (gateset is None or gate_name not in gateset):
-                transformed_statements.extend(decomposition_map[gate_name](statement))
+            if gate_name in _DECOMPOSITION_RULES and (gateset is None or gate_name not in gateset):
+                transformed_statements.extend(cache.expand(statement))
             else:
                 transformed_statements.append(statement)
         else:
@@ -420,4 +555,13 @@ def decompose_qasm3(qasm: str) -> str:
     return rebase(qasm, gateset="any", require_predicates=False)
 
 
-__all__ = ["decompose", "decompose_qasm2", "decompose_qasm3", "rebase", "assert_gates_in_basis"]
+__all__ = [
+    "decompose",
+    "decompose_qasm2",
+    "decompose_qasm3",
+    "rebase",
+    "assert_gates_in_basis",
+    "register_decomposition_rule",
+    "unregister_decomposition_rule",
+    "get_decomposition_rules",
+]
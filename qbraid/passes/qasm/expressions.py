@@ -0,0 +1,216 @@
+# Copyright (C) 2024 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Module providing safe constant folding of OpenQASM classical expressions.
+
+Expressions are evaluated by walking a syntax tree restricted to numeric literals, the
+built-in OpenQASM constants, arithmetic operators, and common math functions, so no
+arbitrary code is ever executed. Results for expression strings are memoized.
+
+"""
+import ast as pyast
+import functools
+import math
+import operator
+from typing import Callable, Optional, Union
+
+from openqasm3.ast import (
+    BinaryExpression,
+    BinaryOperator,
+    Expression,
+    FloatLiteral,
+    FunctionCall,
+    Identifier,
+    IntegerLiteral,
+    UnaryExpression,
+    UnaryOperator,
+)
+
+Number = Union[int, float]
+
+CONSTANTS: dict[str, float] = {
+    "pi": math.pi,
+    "π": math.pi,
+    "tau": math.tau,
+    "τ": math.tau,
+    "euler": math.e,
+    "ℇ": math.e,
+}
+
+# Integer exponents above this bound are evaluated in floating point, so that expressions
+# such as ``9 ** 9 ** 9`` overflow immediately instead of building huge integers.
+_MAX_INT_EXPONENT = 64
+
+
+def _power(base: Number, exponent: Number) -> Number:
+    """Raise base to exponent, refusing complex results and unbounded integer growth."""
+    if isinstance(base, int) and isinstance(exponent, int) and abs(exponent) > _MAX_INT_EXPONENT:
+        base = float(base)
+    value = base**exponent
+    if isinstance(value, complex):
+        raise ValueError("Expression evaluates to a complex number.")
+    return value
+
+
+FUNCTIONS: dict[str, Callable[..., Number]] = {
+    "sin": math.sin,
+    "cos": math.cos,
+    "tan": math.tan,
+    "arcsin": math.asin,
+    "arccos": math.acos,
+    "arctan": math.atan,
+    "exp": math.exp,
+    "log": math.log,
+    "sqrt": math.sqrt,
+    "ceiling": math.ceil,
+    "floor": math.floor,
+    "pow": _power,
+    "mod": lambda lhs, rhs: lhs % rhs,
+}
+
+_PY_BINARY_OPS: dict[type, Callable[[Number, Number], Number]] = {
+    pyast.Add: operator.add,
+    pyast.Sub: operator.sub,
+    pyast.Mult: operator.mul,
+    pyast.Div: operator.truediv,
+    pyast.Mod: operator.mod,
+    pyast.Pow: _power,
+}
+
+_PY_UNARY_OPS: dict[type, Callable[[Number], Number]] = {
+    pyast.USub: operator.neg,
+    pyast.UAdd: operator.pos,
+}
+
+_QASM_BINARY_OPS: dict[BinaryOperator, Callable[[Number, Number], Number]] = {
+    BinaryOperator["+"]: operator.add,
+    BinaryOperator["-"]: operator.sub,
+    BinaryOperator["*"]: operator.mul,
+    BinaryOperator["/"]: operator.truediv,
+    BinaryOperator["%"]: operator.mod,
+    BinaryOperator["**"]: _power,
+}
+
+
+def _evaluate_node(node: pyast.AST) -> Number:
+    """Recursively evaluate a restricted Python expression syntax tree."""
+    if isinstance(node, pyast.Expression):
+        return _evaluate_node(node.body)
+    if isinstance(node, pyast.Constant):
+        if isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
+            return node.value
+        raise ValueError(f"Unsupported literal: {node.value!r}")
+    if isinstance(node, pyast.Name):
+        if node.id in CONSTANTS:
+            return CONSTANTS[node.id]
+        raise ValueError(f"Unknown identifier: '{node.id}'")
+    if isinstance(node, pyast.BinOp) and type(node.op) in _PY_BINARY_OPS:
+        lhs = _evaluate_node(node.left)
+        rhs = _evaluate_node(node.right)
+        return _PY_BINARY_OPS[type(node.op)](lhs, rhs)
+    if isinstance(node, pyast.UnaryOp) and type(node.op) in _PY_UNARY_OPS:
+        return _PY_UNARY_OPS[type(node.op)](_evaluate_node(node.operand))
+    if (
+        isinstance(node, pyast.Call)
+        and isinstance(node.func, pyast.Name)
+        and node.func.id in FUNCTIONS
+        and not node.keywords
+    ):
+        args = [_evaluate_node(arg) for arg in node.args]
+        return FUNCTIONS[node.func.id](*args)
+    raise ValueError(f"Unsupported expression element: {type(node).__name__}")
+
+
+@functools.lru_cache(maxsize=2**14)
+def _evaluate_cached(expression: str) -> Optional[Number]:
+    """Evaluate an expression string, returning None if it is not a supported constant."""
+    try:
+        tree = pyast.parse(expression.strip(), mode="eval")
+        value = _evaluate_node(tree)
+    except (SyntaxError, ValueError, TypeError, ArithmeticError, RecursionError):
+        return None
+    return value if math.isfinite(value) else None
+
+
+def evaluate_expression(expression: str) -> Number:
+    """Evaluate a constant OpenQASM arithmetic expression string.
+
+    Supports integer and float literals, the constants ``pi``, ``tau`` and ``euler``
+    (and their unicode forms), the operators ``+``, ``-``, ``*``, ``/``, ``%`` and ``**``,
+    and the functions ``sin``, ``cos``, ``tan``, ``arcsin``, ``arccos``, ``arctan``,
+    ``exp``, ``log``, ``sqrt``, ``ceiling``, ``floor``, ``pow`` and ``mod``. Results are
+    memoized per expression string.
+
+    Args:
+        expression (str): The expression to evaluate, e.g. ``"3 * pi / 4"``.
+
+    Returns:
+        int | float: The value of the expression.
+
+    Raises:
+        ValueError: If the expression is not a supported constant expression.
+    """
+    value = _evaluate_cached(expression)
+    if value is None:
+        raise ValueError(f"Cannot evaluate expression '{expression}' to a constant.")
+    return value
+
+
+def fold_expression(expression: Expression) -> Optional[Number]:
+    """Return the numeric value of a constant ``openqasm3`` AST expression.
+
+    Args:
+        expression (openqasm3.ast.Expression): The expression to evaluate.
+
+    Returns:
+        int | float | None: The value of the expression, or None if it is not constant.
+    """
+    try:
+        value = _fold_node(expression)
+    except (ValueError, TypeError, ArithmeticError, RecursionError):
+        return None
+    return value if value is not None and math.isfinite(value) else None
+
+
+def _fold_node(node: Expression) -> Optional[Number]:
+    """Recursively evaluate a constant ``openqasm3`` AST expression."""
+    if isinstance(node, (FloatLiteral, IntegerLiteral)):
+        return node.value
+    if isinstance(node, Identifier):
+        return CONSTANTS.get(node.name)
+    if isinstance(node, UnaryExpression):
+        if node.op != UnaryOperator["-"]:
+            return None
+        value = _fold_node(node.expression)
+        return None if value is None else -value
+    if isinstance(node, BinaryExpression):
+        binary_op = _QASM_BINARY_OPS.get(node.op)
+        if binary_op is None:
+            return None
+        lhs = _fold_node(node.lhs)
+        if lhs is None:
+            return None
+        rhs = _fold_node(node.rhs)
+        if rhs is None:
+            return None
+        return binary_op(lhs, rhs)
+    if isinstance(node, FunctionCall):
+        function = FUNCTIONS.get(node.name.name)
+        if function is None:
+            return None
+        args = []
+        for arg in node.arguments:
+            value = _fold_node(arg)
+            if value is None:
+                return None
+            args.append(value)
+        return function(*args)
+    return None
@@ -0,0 +1,278 @@
+# Copyright (C) 2024 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Module providing a pass manager that parses an OpenQASM program once, runs a sequence
+of AST-level transformation passes, and dumps the result once.
+
+"""
+from __future__ import annotations
+
+import functools
+import time
+from typing import Callable, Iterable, Iterator, Optional, Union
+
+from openqasm3 import dumps, parse
+from openqasm3.ast import (
+    Box,
+    BranchingStatement,
+    CompoundStatement,
+    Expression,
+    FloatLiteral,
+    ForInLoop,
+    Include,
+    Program,
+    QuantumBarrier,
+    QuantumGate,
+    QuantumGateDefinition,
+    QuantumMeasurementStatement,
+    QuantumPhase,
+    Statement,
+    WhileLoop,
+)
+
+from qbraid._logging import logger
+
+from .compat import _replace_gate_names, declarations_to_qasm2
+from .expressions import fold_expression
+
+QasmPass = Callable[[Program], Optional[Program]]
+
+_QASM_PASSES: dict[str, QasmPass] = {}
+
+
+def register_qasm_pass(name: str, qasm_pass: QasmPass, overwrite: bool = False) -> None:
+    """Register an AST-level pass so that it can be referenced by name in a pass manager.
+
+    Args:
+        name (str): Name under which to register the pass.
+        qasm_pass (Callable[[Program], Optional[Program]]): Function that transforms an
+            ``openqasm3.ast.Program``. It may modify the program in-place and return None,
+            or return a new program.
+        overwrite (bool): Whether to replace an existing pass with the same name.
+
+    Raises:
+        ValueError: If a pass with the given name is already registered and overwrite is False.
+    """
+    if name in _QASM_PASSES and not overwrite:
+        raise ValueError(f"QASM pass '{name}' is already registered.")
+    _QASM_PASSES[name] = qasm_pass
+
+
+def get_qasm_passes() -> dict[str, QasmPass]:
+    """Return a copy of the registry of named AST-level passes."""
+    return dict(_QASM_PASSES)
+
+
+def _statement_blocks(statements: list[Statement]) -> Iterator[list[Statement]]:
+    """Yield the given list of statements and every nested statement list, depth-first."""
+    stack = [statements]
+    while stack:
+        block = stack.pop()
+        yield block
+        for statement in block:
+            if isinstance(statement, (QuantumGateDefinition, Box)):
+                stack.append(statement.body)
+            elif isinstance(statement, BranchingStatement):
+                stack.append(statement.if_block)
+                stack.append(statement.else_block)
+            elif isinstance(statement, (ForInLoop, WhileLoop)):
+                stack.append(statement.block)
+            elif isinstance(statement, CompoundStatement):
+                stack.append(statement.statements)
+
+
+def _filter_statements(program: Program, statement_type: type) -> None:
+    """Remove all statements of the given type from the program, including nested blocks."""
+    for block in _statement_blocks(program.statements):
+        block[:] = [statement for statement in block if not isinstance(statement, statement_type)]
+
+
+def remove_barriers_pass(program: Program) -> None:
+    """Remove all barrier statements from the program."""
+    _filter_statements(program, QuantumBarrier)
+
+
+def remove_measurements_pass(program: Program) -> None:
+    """Remove all measurement statements from the program."""
+    _filter_statements(program, QuantumMeasurementStatement)
+
+
+def remove_include_statements_pass(program: Program) -> None:
+    """Remove all include statements from the program."""
+    program.statements[:] = [
+        statement for statement in program.statements if not isinstance(statement, Include)
+    ]
+
+
+def replace_gate_names_pass(
+    program: Program, gate_mappings: dict[str, str], case_sensitive: bool = False
+) -> Program:
+    """Replace occurrences of the specified gate names in the program."""
+    return _replace_gate_names(program, gate_mappings, case_sensitive)
+
+
+def _fold_argument(expression: Expression) -> Expression:
+    """Return a float literal for constant gate arguments, or the original expression."""
+    if isinstance(expression, FloatLiteral):
+        return expression
+    value = fold_expression(expression)
+    if value is None:
+        return expression
+    return FloatLiteral(value=float(value))
+
+
+def fold_gate_params_pass(program: Program) -> None:
+    """Evaluate constant gate parameter expressions (including ``pi``) to float literals."""
+    for block in _statement_blocks(program.statements):
+        for statement in block:
+            if isinstance(statement, QuantumGate):
+                statement.arguments = [_fold_argument(arg) for arg in statement.arguments]
+            elif isinstance(statement, QuantumPhase):
+                statement.argument = _fold_argument(statement.argument)
+
+
+register_qasm_pass("remove_barriers", remove_barriers_pass)
+register_qasm_pass("remove_measurements", remove_measurements_pass)
+register_qasm_pass("remove_include_statements", remove_include_statements_pass)
+register_qasm_pass("replace_gate_names", replace_gate_names_pass)
+register_qasm_pass("fold_gate_params", fold_gate_params_pass)
+
+
+class QasmPassManager:
+    """Runs a sequence of AST-level passes over an OpenQASM program.
+
+    The input program is parsed once, each pass transforms the shared ``openqasm3`` AST in
+    turn, and the result is dumped back to a string once. The wall-clock time spent in
+    parsing, in each pass, and in dumping is recorded on every run and can be inspected
+    through :attr:`timings` or :meth:`report`.
+
+    Example usage:
+
+    .. code-block:: python
+
+        manager = QasmPassManager(["remove_barriers", "fold_gate_params"])
+        manager.append("replace_gate_names", gate_mappings={"cnot": "cx"})
+        qasm_out = manager.run(qasm)
+        print(manager.report())
+
+    Args:
+        passes (Iterable[str | Callable], optional): Initial passes, given either by
+            registered name or as callables that accept an ``openqasm3.ast.Program``.
+    """
+
+    def __init__(self, passes: Optional[Iterable[Union[str, QasmPass]]] = None):
+        self._passes: list[tuple[str, QasmPass]] = []
+        self._timings: dict[str, float] = {}
+        for qasm_pass in passes or []:
+            self.append(qasm_pass)
+
+    @property
+    def passes(self) -> list[str]:
+        """Return the names of the passes in the order they will be run."""
+        return [name for name, _ in self._passes]
+
+    @property
+    def timings(self) -> dict[str, float]:
+        """Return the seconds spent in each stage of the most recent run."""
+        return dict(self._timings)
+
+    def append(
+        self, qasm_pass: Union[str, QasmPass], name: Optional[str] = None, **kwargs
+    ) -> QasmPassManager:
+        """Append a pass to the pipeline.
+
+        Args:
+            qasm_pass (str | Callable): Registered pass name, or a callable that accepts an
+                ``openqasm3.ast.Program`` and either modifies it in-place or returns a new one.
+            name (str, optional): Name under which the pass timing is reported. Defaults to
+                the registered name or the callable's ``__name__``.
+            **kwargs: Keyword arguments bound to the pass when it is run.
+
+        Returns:
+            QasmPassManager: The pass manager, to allow chaining.
+
+        Raises:
+            ValueError: If the pass name is not registered.
+        """
+        if isinstance(qasm_pass, str):
+            if qasm_pass not in _QASM_PASSES:
+                raise ValueError(
+                    f"QASM pass '{qasm_pass}' is not registered. "
+                    f"Available passes include: {set(_QASM_PASSES)}"
+                )
+            name = name or qasm_pass
+            qasm_pass = _QASM_PASSES[qasm_pass]
+        else:
+            name = name or getattr(qasm_pass, "__name__", type(qasm_pass).__name__)
+
+        if kwargs:
+            qasm_pass = functools.partial(qasm_pass, **kwargs)
+
+        self._passes.append((name, qasm_pass))
+        return self
+
+    def run_ast(self, program: Program) -> Program:
+        """Run all passes over a parsed program and return the transformed program."""
+        for name, qasm_pass in self._passes:
+            start = time.perf_counter()
+            result = qasm_pass(program)
+            if result is not None:
+                program = result
+            self._record(name, time.perf_counter() - start)
+        return program
+
+    def run(self, program: Union[str, Program]) -> str:
+        """Parse the program once, run all passes, and dump the result once.
+
+        Args:
+            program (str | Program): OpenQASM 2 or 3 program string, or parsed program.
+
+        Returns:
+            str: The transformed OpenQASM program string.
+        """
+        self._timings = {}
+
+        if isinstance(program, str):
+            start = time.perf_counter()
+            program = parse(program)
+            self._record("parse", time.perf_counter() - start)
+
+        program = self.run_ast(program)
+
+        start = time.perf_counter()
+        qasm_out = dumps(program)
+        if program.version is not None and program.version.split(".")[0] == "2":
+            qasm_out = declarations_to_qasm2(qasm_out)
+        self._record("dump", time.perf_counter() - start)
+
+        return qasm_out
+
+    def _record(self, name: str, elapsed: float) -> None:
+        """Accumulate the elapsed time of a pipeline stage."""
+        self._timings[name] = self._timings.get(name, 0.0) + elapsed
+        logger.debug("QASM pass '%s' completed in %.6f seconds", name, elapsed)
+
+    def report(self) -> str:
+        """Return a table of the time spent in each stage of the most recent run."""
+        if not self._timings:
+            return "No passes have been run."
+
+        width = max(len(name) for name in self._timings)
+        total = sum(self._timings.values())
+        lines = [f"{'Pass':<{width}}  Time (s)  % Total"]
+        for name, elapsed in self._timings.items():
+            percent = 100 * elapsed / total if total > 0 else 0.0
+            lines.append(f"{name:<{width}}  {elapsed:8.6f}  {percent:7.2f}")
+        lines.append(f"{'total':<{width}}  {total:8.6f}  {100.0:7.2f}")
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        return f"QasmPassManager(passes={self.passes})"
@@ -13,101 +13,184 @@ Module for preprocessing qasm string to before it is passed to parser.
 
 """
 import re
+from typing import Optional
 
 from .compat import remove_qasm_barriers
 from .decompose import decompose_qasm2
-from .format import format_qasm
 
-
-def _unfold_gate_defs(qasm: str) -> str:
-    """Recursively expands gate definitions in the input OpenQASM string."""
-    # Define regular expression patterns
-    gate_definition_pattern = re.compile(
-        r"gate ([a-zA-Z0-9_]+)(\((.*?)\))? ((q[0-9]+,)*q[0-9]+) {(.*?)}"
-    )
-
-    gate_body = ""
-    params_list = []
-    gate_usage_match = None
-
-    # Find gate definition and extract its components
-    gate_definition_match = gate_definition_pattern.search(qasm)
-    if gate_definition_match:
-        gate_name, _, params, qubits, _, gate_body = gate_definition_match.groups()
-        params_list = [param.strip() for param in params.split(",")] if params is not None else []
-
-        qubits = [qubit.strip() for qubit in qubits.split(",")]
-
-        # pylint: disable=consider-using-f-string
-        gate_usage_pattern = re.compile(
-            r"({})(\((.*?)\))? ((q\[([0-9]+)\],)*(q\[([0-9]+)\]));".format(gate_name)
+GATE_DEFINITION_PATTERN = re.compile(
+    r"^[ \t]*gate\s+([a-zA-Z_]\w*)\s*(?:\(([^)]*)\))?\s*([^{]*?)\s*\{([^}]*)\}[ \t]*\n?",
+    re.MULTILINE,
+)
+STATEMENT_PATTERN = re.compile(r"([a-zA-Z_]\w*)\s*(?:\((.*)\))?\s*(.*)", re.DOTALL)
+IDENTIFIER_PATTERN = re.compile(r"\b[a-zA-Z_]\w*\b")
+ATOMIC_EXPRESSION_PATTERN = re.compile(r"[\w.]+")
+
+# (gate name, parameter names, qubit argument names, body statements)
+GateDefinition = tuple[str, list[str], list[str], list[tuple[str, list[str], list[str]]]]
+
+# (instruction text preceding the qubit operands, indices into the qubit operands of the usage)
+ExpandedInstruction = tuple[str, tuple[int, ...]]
+
+
+def _split_args(args: Optional[str]) -> list[str]:
+    """Split a comma-separated argument string at top-level commas only."""
+    if args is None or not args.strip():
+        return []
+
+    if "(" not in args:
+        return [part.strip() for part in args.split(",")]
+
+    parts = []
+    depth = 0
+    start = 0
+    for i, char in enumerate(args):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "," and depth == 0:
+            parts.append(args[start:i].strip())
+            start = i + 1
+    parts.append(args[start:].strip())
+    return parts
+
+
+def _parse_statement(statement: str) -> Optional[tuple[str, list[str], list[str]]]:
+    """Split a gate statement into its name, parameter expressions, and qubit operands."""
+    match = STATEMENT_PATTERN.fullmatch(statement.strip())
+    if match is None:
+        return None
+    name, params, qubits = match.groups()
+    return name, _split_args(params), _split_args(qubits)
+
+
+def _extract_gate_defs(qasm: str) -> tuple[dict[str, GateDefinition], str]:
+    """Return the gate definitions in the input QASM string, and the program without them."""
+    gate_defs = {}
+    program_parts = []
+    position = 0
+
+    for match in GATE_DEFINITION_PATTERN.finditer(qasm):
+        gate_name, params, qubits, body = match.groups()
+        body_statements = []
+        for statement in body.split(";"):
+            if statement.strip():
+                parsed = _parse_statement(statement)
+                if parsed is not None:
+                    body_statements.append(parsed)
+
+        gate_defs[gate_name] = (
+            gate_name,
+            _split_args(params),
+            _split_args(qubits),
+            body_statements,
         )
+        program_parts.append(qasm[position : match.start()])
+        position = match.end()
 
-        # Replace parameters with their values in gate body
-        gate_usage_match = gate_usage_pattern.search(qasm)
+    program_parts.append(qasm[position:])
+    return gate_defs, "".join(program_parts)
 
-    while gate_usage_match:
-        groups = gate_usage_match.groups()
-        param_values, qubits_usage = groups[2], groups[3]
-        param_values_list = (
-            [value.strip() for value in param_values.split(",")] if param_values is not None else []
-        )
-        expanded_gate_body = gate_body
-        qubits_usage = [qubit.strip() for qubit in re.findall(r"q\[\d+\]", qubits_usage)]
 
-        for param, value in zip(params_list, param_values_list):
-            expanded_gate_body = expanded_gate_body.replace(param, value)
+def _substitute_params(expression: str, bindings: dict[str, str]) -> str:
+    """Replace parameter names in an expression with their bound values."""
+    if not bindings:
+        return expression
 
-        for qubit, qubit_usage in zip(qubits, qubits_usage):
-            expanded_gate_body = expanded_gate_body.replace(qubit, qubit_usage)
+    stripped = expression.strip()
+    if stripped in bindings:
+        return bindings[stripped]
 
-        # Replace gate usage with the expanded gate body in the input string
-        qasm = qasm.replace(gate_usage_match.group(0), expanded_gate_body + ";")
+    def replace(match: re.Match) -> str:
+        value = bindings.get(match.group(0))
+        if value is None:
+            return match.group(0)
+        return value if ATOMIC_EXPRESSION_PATTERN.fullmatch(value) else f"({value})"
 
-        # Search for the next gate usage
-        gate_usage_match = gate_usage_pattern.search(qasm)
+    return IDENTIFIER_PATTERN.sub(replace, expression)
 
-    # Remove double semicolons
-    qasm = format_qasm(qasm, gate_definition_pattern)
 
-    return qasm
+class _GateUnfolder:
+    """Expands custom gate usages into their primitive instructions.
 
+    Expanded bodies are memoized per (gate name, parameter values) signature as a list of
+    instruction templates, so each usage only substitutes its qubit operands.
+    """
 
-def _find_gate_line(lines):
-    for i, line in enumerate(lines):
-        if line.strip().startswith("gate"):
-            return i
-    return None
+    def __init__(self, gate_defs: dict[str, GateDefinition]):
+        self._gate_defs = gate_defs
+        self._memo: dict[tuple[str, tuple[str, ...]], list[ExpandedInstruction]] = {}
 
+    def expand(self, name: str, params: tuple[str, ...]) -> list[ExpandedInstruction]:
+        """Return the fully expanded instruction templates of a custom gate."""
+        key = (name, params)
+        cached = self._memo.get(key)
+        if cached is not None:
+            return cached
 
-def unfold_qasm2(qasm: str) -> str:
-    """Returns a QASM copy with custom gates deconstructed and unsupported operations decomposed."""
-    # temp hack to fix 'r' replacing last char of 'ecr'
-    qasm = qasm.replace("ecr", "ecr_")
+        _, param_names, qubit_names, body = self._gate_defs[name]
+        bindings = dict(zip(param_names, params))
+        qubit_index = {qubit: i for i, qubit in enumerate(qubit_names)}
 
-    input_str = remove_qasm_barriers(qasm)
+        expanded = []
+        for body_name, body_params, body_qubits in body:
+            values = tuple(_substitute_params(param, bindings) for param in body_params)
+            indices = tuple(qubit_index[qubit] for qubit in body_qubits)
+
+            if body_name in self._gate_defs:
+                for prefix, inner_indices in self.expand(body_name, values):
+                    expanded.append((prefix, tuple(indices[i] for i in inner_indices)))
+            else:
+                prefix = f"{body_name}({','.join(values)})" if values else body_name
+                expanded.append((prefix, indices))
+
+        self._memo[key] = expanded
+        return expanded
 
-    lines = input_str.strip("\n").split("\n")
-    gate_lines = [(i, line) for i, line in enumerate(lines) if line.strip().startswith("gate")]
-    gate_lines.reverse()  # Reverse to start removing from the last
-    gate_line_idx = _find_gate_line(lines)
+    def unfold_statement(self, statement: str, out: list[str]) -> None:
+        """Append the expansion of a single program statement to the output lines."""
+        parsed = _parse_statement(statement)
+        if parsed is None or parsed[0] not in self._gate_defs:
+            out.append(statement + ";")
+            return
 
-    # Remove all 'gate' lines
-    for idx, _ in gate_lines:
-        lines.pop(idx)
+        name, params, qubits = parsed
+        for prefix, indices in self.expand(name, tuple(params)):
+            out.append(f"{prefix} {','.join(qubits[i] for i in indices)};")
 
-    for _, gate_line in gate_lines:
-        # Insert the current 'gate' line for this iteration
-        lines.insert(gate_line_idx, gate_line)
 
-        new_input = "\n".join(lines)
-        new_input = _unfold_gate_defs(new_input)  # call the conversion function
-        lines = new_input.split("\n")  # update lines after conversion
+def _unfold_gate_defs(qasm: str) -> str:
+    """Expands all custom gate definitions in the input OpenQASM string in a single pass."""
+    gate_defs, program = _extract_gate_defs(qasm)
+    if not gate_defs:
+        return qasm
+
+    unfolder = _GateUnfolder(gate_defs)
+    out: list[str] = []
+
+    for line in program.split("\n"):
+        line = line.strip()
+        if line.startswith("//"):
+            out.append(line)
+            continue
+
+        for statement in re.split(";[ ]*", line):
+            statement = statement.strip()
+            if not statement:
+                continue
+            if statement.startswith("//"):
+                out.append(statement)
+            else:
+                unfolder.unfold_statement(statement, out)
 
-        # Remove the current 'gate' line for the next iteration
-        lines.pop(gate_line_idx)
+    return "\n".join(out)
 
-    qasm = "\n".join(lines)
+
+def unfold_qasm2(qasm: str) -> str:
+    """Returns a QASM copy with custom gates deconstructed and unsupported operations decomposed."""
+    input_str = remove_qasm_barriers(qasm)
+    qasm = _unfold_gate_defs(input_str.strip("\n"))
     qasm_out = decompose_qasm2(qasm)
 
     return qasm_out
@@ -134,7 +134,14 @@ __all__ = [
 _lazy = {
     "gate_model": ["GateModelProgram"],
     "ahs": ["AnalogHamiltonianProgram", "AHSEncoder"],
-    "annealing": ["AnnealingProgram", "ProblemEncoder", "ProblemType", "Problem", "QuboProblem"],
+    "annealing": [
+        "AnnealingProgram",
+        "ProblemEncoder",
+        "ProblemType",
+        "Problem",
+        "QuboProblem",
+        "SparseProblem",
+    ],
 }
 
 if TYPE_CHECKING:
@@ -145,6 +152,7 @@ if TYPE_CHECKING:
     from .annealing import ProblemEncoder as ProblemEncoder
     from .annealing import ProblemType as ProblemType
     from .annealing import QuboProblem as QuboProblem
+    from .annealing import SparseProblem as SparseProblem
     from .gate_model import GateModelProgram as GateModelProgram
 
 
@@ -15,9 +15,10 @@ Module defining AnalogHamiltonianProgram Class
 from __future__ import annotations
 
 from decimal import Decimal
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Any, Union
 
 import braket.ir.ahs as ir
+import numpy as np
 from braket.ahs import AnalogHamiltonianSimulation, Field
 
 from qbraid.programs.exceptions import ProgramTypeError
@@ -50,11 +51,36 @@ class BraketAHS(AnalogHamiltonianProgram):
             self._program = program.discretize(device._device)
 
 
+def _to_decimal(value: Any) -> Decimal:
+    """Convert a decimal string or a float to a Decimal, using the shortest float repr."""
+    return Decimal(value) if isinstance(value, str) else Decimal(str(value))
+
+
 class BraketAHSEncoder:
-    """Class for encoding AnalogHamiltonianSimulation objects to dictionaries."""
+    """Class for encoding AnalogHamiltonianSimulation objects to dictionaries.
+
+    Args:
+        numeric (bool): If True, sites, time series and site patterns are encoded as
+            float64 arrays and filling as an int8 array, instead of lists of decimal
+            strings. Defaults to False.
+    """
+
+    def __init__(self, numeric: bool = False):
+        self.numeric = numeric
+
+    def encode_values(self, values: list[Decimal]) -> Union[list[str], np.ndarray]:
+        """Convert a list of decimals to decimal strings or a float64 array."""
+        if self.numeric:
+            return np.array(values, dtype=np.float64)
+        return [str(value) for value in values]
 
     def encode_register(self, register: ir.AtomArrangement) -> dict:
         """Convert an AtomArrangement object to a dictionary."""
+        if self.numeric:
+            return {
+                "sites": np.array(register.sites, dtype=np.float64).reshape(-1, 2),
+                "filling": np.array(register.filling, dtype=np.int8),
+            }
         return {
             "sites": [[str(value) for value in sublist] for sublist in register.sites],
             "filling": register.filling,
@@ -62,12 +88,15 @@ class BraketAHSEncoder:
 
     def encode_field(self, field: Union[ir.PhysicalField, Field]) -> dict:
         """Convert a PhysicalField object to a dictionary."""
+        pattern = field.pattern
+        if self.numeric and not isinstance(pattern, str):
+            pattern = self.encode_values(pattern)
         return {
             "time_series": {
-                "values": [str(v) for v in field.time_series.values],
-                "times": [str(t) for t in field.time_series.times],
+                "values": self.encode_values(field.time_series.values),
+                "times": self.encode_values(field.time_series.times),
             },
-            "pattern": field.pattern,
+            "pattern": pattern,
         }
 
     def encode_hamiltonian(self, hamiltonian: ir.Hamiltonian) -> dict:
@@ -100,19 +129,32 @@ class BraketAHSEncoder:
 
 
 class BraketAHSDecoder:
-    """Class for decoding AnalogHamiltonianSimulation objects from dictionaries."""
+    """Class for decoding AnalogHamiltonianSimulation objects from dictionaries.
+
+    Both the decimal string encoding and the numeric array encoding
+    of :class:`BraketAHSEncoder` are accepted.
+    """
 
-    def decode_time_series(self, values: list[str], times: list[str]) -> ir.TimeSeries:
+    def decode_time_series(
+        self, values: Union[list[str], np.ndarray], times: Union[list[str], np.ndarray]
+    ) -> ir.TimeSeries:
         """Create a TimeSeries object from lists of values and times."""
         if len(values) != len(times):
             raise ValueError("The values and times lists must have the same length.")
-        return ir.TimeSeries(values=[Decimal(v) for v in values], times=[Decimal(t) for t in times])
+        return ir.TimeSeries(
+            values=[_to_decimal(v) for v in values], times=[_to_decimal(t) for t in times]
+        )
 
     def decode_physical_field(
-        self, values: list[str], times: list[str], pattern: Union[str, list[float]]
+        self,
+        values: Union[list[str], np.ndarray],
+        times: Union[list[str], np.ndarray],
+        pattern: Union[str, list[float], np.ndarray],
     ) -> ir.PhysicalField:
         """Create a PhysicalField object from lists of values and times."""
         time_series = self.decode_time_series(values, times)
+        if isinstance(pattern, np.ndarray):
+            pattern = [_to_decimal(value) for value in pattern.tolist()]
         return ir.PhysicalField(time_series=time_series, pattern=pattern)
 
     def decode_driving_field(self, amplitude_info, phase_info, detuning_info) -> ir.DrivingField:
@@ -137,9 +179,15 @@ class BraketAHSDecoder:
 
     def decode_register(self, register: dict) -> ir.AtomArrangement:
         """Convert a dictionary to an AtomArrangement object."""
+        sites = register["sites"]
+        filling = register["filling"]
+        if isinstance(sites, np.ndarray):
+            sites = sites.tolist()
+        if isinstance(filling, np.ndarray):
+            filling = filling.tolist()
         return ir.AtomArrangement(
-            sites=[[Decimal(value) for value in sublist] for sublist in register["sites"]],
-            filling=register["filling"],
+            sites=[[_to_decimal(value) for value in sublist] for sublist in sites],
+            filling=filling,
         )
 
     def decode_hamiltonian(self, data: dict) -> ir.Hamiltonian:
@@ -14,11 +14,11 @@ Module for managing and retrieving custom program type aliases
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional, Type
+from typing import TYPE_CHECKING, Any, Optional, Type
 
 from .exceptions import ProgramTypeError, QasmError
-from .registry import QPROGRAM_REGISTRY, QPROGRAM_TYPES
-from .typer import IonQDict, get_qasm_type_alias
+from .registry import _TYPE_ALIAS_INDEX, QPROGRAM_REGISTRY, QPROGRAM_TYPES
+from .typer import IonQDict, QbraidMetaType, get_qasm_type_alias
 
 if TYPE_CHECKING:
     import qbraid.programs
@@ -35,6 +35,73 @@ def find_str_type_alias(registry: dict[str, Type] = QPROGRAM_REGISTRY) -> Option
     raise ValueError(f"Multiple additional keys with type 'str' found: {str_keys}")
 
 
+def _index_program_type(
+    program_type: Type[Any],
+) -> tuple[tuple[str, ...], tuple[tuple[str, Any], ...]]:
+    """
+    Return the registry entries that can match instances of a program type.
+
+    Registered classes are resolved once per program type with ``issubclass``. Entries whose
+    matches depend on the instance, such as the content-checked :class:`~.QbraidMetaType`
+    types, are returned for an ``isinstance`` check on each call, but only if the program
+    type is a subclass of the built-in type they wrap. The result is memoized per program
+    type until the registry changes.
+
+    Args:
+        program_type (Type[Any]): The type of the quantum program.
+
+    Returns:
+        tuple: The aliases matched by type, and the (alias, registered type) pairs
+            that must be checked against each instance.
+    """
+    registry = QPROGRAM_REGISTRY
+    entry = _TYPE_ALIAS_INDEX.get(program_type)
+    if entry is not None and entry[0] is registry:
+        return entry[1], entry[2]
+
+    matched_by_type = []
+    instance_checks = []
+    for alias, registered_type in registry.items():
+        if isinstance(registered_type, QbraidMetaType):
+            if issubclass(program_type, registered_type.__bound__):
+                instance_checks.append((alias, registered_type))
+        elif not isinstance(registered_type, type):
+            instance_checks.append((alias, registered_type))
+        elif issubclass(program_type, (registered_type, type(registered_type))):
+            matched_by_type.append(alias)
+
+    entry = (registry, tuple(matched_by_type), tuple(instance_checks))
+    _TYPE_ALIAS_INDEX[program_type] = entry
+    return entry[1], entry[2]
+
+
+def _match_registered_types(program: qbraid.programs.QPROGRAM) -> list[str]:
+    """Return the aliases of all registered program types matching a program."""
+    program_type = type(program)
+    if program.__class__ is not program_type:
+        # proxies that override __class__ must go through isinstance
+        return [
+            alias
+            for alias, registered_type in QPROGRAM_REGISTRY.items()
+            if isinstance(program, (registered_type, type(registered_type)))
+        ]
+
+    matched_by_type, instance_checks = _index_program_type(program_type)
+    if not instance_checks:
+        return list(matched_by_type)
+
+    matched_by_instance = {
+        alias
+        for alias, registered_type in instance_checks
+        if isinstance(program, (registered_type, type(registered_type)))
+    }
+    return [
+        alias
+        for alias in QPROGRAM_REGISTRY
+        if alias in matched_by_instance or alias in matched_by_type
+    ]
+
+
 def _get_program_type_alias(program: qbraid.programs.QPROGRAM) -> str:
     """
     Get the type alias of a quantum program from registry.
@@ -68,10 +135,7 @@ def _get_program_type_alias(program: qbraid.programs.QPROGRAM) -> str:
     if isinstance(program, IonQDict):
         return IonQDict.__alias__
 
-    matched = []
-    for alias, program_type in QPROGRAM_REGISTRY.items():
-        if isinstance(program, (program_type, type(program_type))):
-            matched.append(alias)
+    matched = _match_registered_types(program)
 
     if len(matched) == 1:
         return matched[0]
@@ -24,6 +24,7 @@ Classes
     Problem
     AnnealingProgram
     QuboProblem
+    SparseProblem
     ProblemEncoder
 
 Submodules
@@ -38,7 +39,14 @@ Submodules
 """
 import importlib
 
-from ._model import AnnealingProgram, Problem, ProblemEncoder, ProblemType, QuboProblem
+from ._model import (
+    AnnealingProgram,
+    Problem,
+    ProblemEncoder,
+    ProblemType,
+    QuboProblem,
+    SparseProblem,
+)
 
 _qbraid = importlib.import_module("qbraid.programs._import")
 NATIVE_REGISTRY = getattr(_qbraid, "NATIVE_REGISTRY", {})
@@ -56,6 +64,13 @@ for lib in NATIVE_REGISTRY:
         pass
 
 
-__all__ = ["ProblemType", "Problem", "AnnealingProgram", "QuboProblem", "ProblemEncoder"]
+__all__ = [
+    "ProblemType",
+    "Problem",
+    "AnnealingProgram",
+    "QuboProblem",
+    "SparseProblem",
+    "ProblemEncoder",
+]
 
 __all__.extend(submodules)
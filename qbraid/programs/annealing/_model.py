@@ -14,12 +14,16 @@ Module defining AnnealingProblem Class
 """
 from __future__ import annotations
 
+import hashlib
 import json
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+
 from qbraid.programs.program import QuantumProgram
 from qbraid.programs.typer import QuboCoefficientsDict
 
@@ -61,26 +65,63 @@ class Problem:
             variables.update(key)
         return len(variables)
 
+    def to_sparse(self) -> SparseProblem:
+        """Return a SparseProblem representing this problem."""
+        return SparseProblem.from_problem(self)
+
+    def _canonical_quadratic(self) -> dict[tuple[str, str], float]:
+        """Return the quadratic terms keyed by ordered label pairs, with symmetric terms merged."""
+        quadratic: dict[tuple[str, str], float] = {}
+        for (u, v), value in self.quadratic.items():
+            key = (u, v) if u <= v else (v, u)
+            quadratic[key] = quadratic[key] + value if key in quadratic else value
+        return quadratic
+
+    def canonical(self) -> Problem:
+        """Return the canonical form of this problem.
+
+        Quadratic terms are keyed by ordered label pairs, with the coefficients of
+        ``(a, b)`` and ``(b, a)`` summed, and all terms are sorted by label. Problems
+        are equal exactly when their canonical forms are identical.
+        """
+        return Problem(
+            problem_type=self.problem_type,
+            linear=dict(sorted(self.linear.items())),
+            quadratic=dict(sorted(self._canonical_quadratic().items())),
+        )
+
+    def to_canonical_json(self) -> str:
+        """Serialize the canonical form of this problem to a JSON string."""
+        return json.dumps(self.canonical(), cls=ProblemEncoder)
+
+    def fingerprint(self) -> str:
+        """Return a content hash of the problem that is stable across processes.
+
+        Returns:
+            str: SHA-256 hex digest of the canonical JSON serialization.
+        """
+        return hashlib.sha256(self.to_canonical_json().encode()).hexdigest()
+
     def __eq__(self, other) -> bool:
         if not isinstance(other, Problem):
             return False
-        if self.problem_type != other.problem_type:
-            return False
-        if self.linear != other.linear or len(self.quadratic) != len(other.quadratic):
-            return False
-        for key, value in self.quadratic.items():
-            if key in other.quadratic:
-                if other.quadratic[key] != value:
-                    return False
-            elif (key[1], key[0]) in other.quadratic:
-                if other.quadratic[(key[1], key[0])] != value:
-                    return False
-            else:
-                return False
-        return True
+        return (
+            self.problem_type == other.problem_type
+            and self.linear == other.linear
+            and self._canonical_quadratic() == other._canonical_quadratic()
+        )
 
+    def __hash__(self) -> int:
+        return hash(
+            (
+                self.problem_type,
+                frozenset(self.linear.items()),
+                frozenset(self._canonical_quadratic().items()),
+            )
+        )
 
-@dataclass
+
+@dataclass(eq=False)
 class QuboProblem(Problem):
     """Represents a QUBO problem, subclass of Problem that only includes quadratic coefficients."""
 
@@ -92,13 +133,209 @@ class QuboProblem(Problem):
         )
 
 
+@dataclass(frozen=True, eq=False)
+class SparseProblem:
+    """Represents an annealing problem as coordinate (COO) arrays over integer variable indices.
+
+    Attributes:
+        problem_type: An instance of ProblemType indicating whether the model is QUBO or ISING.
+        labels: The variable labels, in order of first appearance. Variable ``i`` is ``labels[i]``.
+        linear_index: The variable index of each linear term.
+        linear_value: The coefficient of each linear term.
+        quadratic_row: The first variable index of each quadratic term.
+        quadratic_col: The second variable index of each quadratic term.
+        quadratic_value: The coefficient of each quadratic term.
+
+    """
+
+    problem_type: ProblemType
+    labels: tuple[str, ...]
+    linear_index: np.ndarray
+    linear_value: np.ndarray
+    quadratic_row: np.ndarray
+    quadratic_col: np.ndarray
+    quadratic_value: np.ndarray
+
+    @classmethod
+    def from_problem(cls, problem: Problem) -> SparseProblem:
+        """Create a SparseProblem from a Problem, keeping the order of its terms."""
+        index: dict[str, int] = {}
+        for label in problem.linear:
+            index.setdefault(label, len(index))
+        for u, v in problem.quadratic:
+            index.setdefault(u, len(index))
+            index.setdefault(v, len(index))
+
+        num_linear = len(problem.linear)
+        num_quadratic = len(problem.quadratic)
+        pairs = np.fromiter(
+            (index[label] for key in problem.quadratic for label in key),
+            dtype=np.intp,
+            count=2 * num_quadratic,
+        ).reshape(num_quadratic, 2)
+
+        return cls(
+            problem_type=problem.problem_type,
+            labels=tuple(index),
+            linear_index=np.fromiter(
+                (index[label] for label in problem.linear), dtype=np.intp, count=num_linear
+            ),
+            linear_value=np.fromiter(problem.linear.values(), dtype=float, count=num_linear),
+            quadratic_row=pairs[:, 0],
+            quadratic_col=pairs[:, 1],
+            quadratic_value=np.fromiter(
+                problem.quadratic.values(), dtype=float, count=num_quadratic
+            ),
+        )
+
+    def to_problem(self) -> Problem:
+        """Return the equivalent Problem, with dictionary coefficients keyed by label."""
+        labels = self.labels
+        return Problem(
+            problem_type=self.problem_type,
+            linear={
+                labels[i]: value
+                for i, value in zip(self.linear_index.tolist(), self.linear_value.tolist())
+            },
+            quadratic={
+                (labels[i], labels[j]): value
+                for i, j, value in zip(
+                    self.quadratic_row.tolist(),
+                    self.quadratic_col.tolist(),
+                    self.quadratic_value.tolist(),
+                )
+            },
+        )
+
+    def num_variables(self) -> int:
+        """Return the number of variables in the problem."""
+        return len(self.labels)
+
+    @cached_property
+    def index(self) -> dict[str, int]:
+        """Mapping from variable label to variable index."""
+        return {label: i for i, label in enumerate(self.labels)}
+
+    @cached_property
+    def _linear_dense(self) -> np.ndarray:
+        """Linear coefficients summed per variable."""
+        return np.bincount(
+            self.linear_index, weights=self.linear_value, minlength=self.num_variables()
+        )
+
+    def energies(self, samples: np.ndarray, chunk_size: int = 2**16) -> np.ndarray:
+        """Evaluate the energy of each sample.
+
+        Args:
+            samples: Array of shape ``(num_samples, num_variables)`` holding variable
+                assignments, with columns ordered as :attr:`labels`. A single sample
+                of shape ``(num_variables,)`` is also accepted.
+            chunk_size: Number of samples evaluated at a time, bounding the size of
+                the intermediate arrays of quadratic terms.
+
+        Returns:
+            np.ndarray: The energy of each sample, of shape ``(num_samples,)``,
+                or a zero-dimensional array for a single sample.
+
+        Raises:
+            ValueError: If the number of columns does not match the number of variables.
+        """
+        samples = np.asarray(samples, dtype=float)
+        single = samples.ndim == 1
+        samples = np.atleast_2d(samples)
+        if samples.ndim != 2 or samples.shape[1] != self.num_variables():
+            raise ValueError(
+                f"Expected samples of shape (num_samples, {self.num_variables()}), "
+                f"got {samples.shape}."
+            )
+
+        energies = samples @ self._linear_dense
+        if self.quadratic_value.size:
+            rows, cols, values = self.quadratic_row, self.quadratic_col, self.quadratic_value
+            for start in range(0, len(samples), chunk_size):
+                chunk = samples[start : start + chunk_size]
+                energies[start : start + chunk_size] += (chunk[:, rows] * chunk[:, cols]) @ values
+
+        return energies[0] if single else energies
+
+    def top_k(
+        self, samples: np.ndarray, k: int | None = None, unique: bool = True
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Rank samples by energy and return the ``k`` lowest.
+
+        Args:
+            samples: Array of shape ``(num_samples, num_variables)``, with columns
+                ordered as :attr:`labels`.
+            k: Number of samples to return. Defaults to all of them.
+            unique: If True, identical samples are merged and counted before ranking.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: The selected samples, their energies
+                in ascending order, and the number of occurrences of each sample.
+        """
+        samples = np.atleast_2d(np.asarray(samples))
+        if unique and len(samples):
+            samples, counts = np.unique(samples, axis=0, return_counts=True)
+        else:
+            counts = np.ones(len(samples), dtype=np.intp)
+
+        energies = self.energies(samples)
+        k = len(energies) if k is None else max(min(k, len(energies)), 0)
+        if 0 < k < len(energies):
+            selected = np.argpartition(energies, k - 1)[:k]
+            selected = selected[np.argsort(energies[selected], kind="stable")]
+        else:
+            selected = np.argsort(energies, kind="stable")[:k]
+
+        return samples[selected], energies[selected], counts[selected]
+
+    @cached_property
+    def _encoded_labels(self) -> list[str]:
+        """JSON encoding of each label."""
+        return [json.dumps(label) for label in self.labels]
+
+    def to_json(self) -> str:
+        """Serialize the problem in the :class:`ProblemEncoder` format.
+
+        The string is written directly from the coefficient arrays, without building
+        the dictionaries of an intermediate :class:`Problem`. Coefficients are stored as
+        float64, so integer coefficients are written as floats, and non-finite values as
+        ``Infinity``/``NaN`` like the :mod:`json` module.
+        """
+        labels = self._encoded_labels
+        dumps = json.dumps
+        parts = [f'{{"problem_type": {dumps(self.problem_type.value)}']
+        if self.linear_value.size:
+            linear = ", ".join(
+                f"{labels[i]}: {dumps(value)}"
+                for i, value in zip(self.linear_index.tolist(), self.linear_value.tolist())
+            )
+            parts.append(f', "linear": {{{linear}}}')
+        if self.quadratic_value.size:
+            quadratic = ", ".join(
+                f"{dumps(f'[{labels[i]}, {labels[j]}]')}: {dumps(value)}"
+                for i, j, value in zip(
+                    self.quadratic_row.tolist(),
+                    self.quadratic_col.tolist(),
+                    self.quadratic_value.tolist(),
+                )
+            )
+            parts.append(f', "quadratic": {{{quadratic}}}')
+        parts.append("}")
+        return "".join(parts)
+
+
 class AnnealingProgram(QuantumProgram, ABC):
     """Abstract class for annealing problems."""
 
     @property
     def num_qubits(self) -> int:
         """Number of qubits needed by a quantum device to execute this program."""
-        return self.to_problem().num_variables()
+        cached = getattr(self, "_sparse_problem", None)
+        problem = self.to_problem()
+        if cached is not None and cached[0] is problem:
+            return cached[1].num_variables()
+        return problem.num_variables()
 
     def transform(self, device: qbraid.runtime.QuantumDevice) -> None:
         """Transform program according to device target profile."""
@@ -108,15 +345,34 @@ class AnnealingProgram(QuantumProgram, ABC):
     def to_problem(self) -> Problem:
         """Return a Problem data class representing this annealing problem."""
 
+    def to_sparse(self) -> SparseProblem:
+        """Return a SparseProblem representing this annealing problem.
+
+        The result is cached for as long as :meth:`to_problem` returns the same Problem.
+        """
+        problem = self.to_problem()
+        cached = getattr(self, "_sparse_problem", None)
+        if cached is None or cached[0] is not problem:
+            # pylint: disable-next=attribute-defined-outside-init
+            cached = self._sparse_problem = (problem, SparseProblem.from_problem(problem))
+        return cached[1]
+
     def to_json(self) -> str:
         """Serialize the annealing problem to a JSON string."""
         return json.dumps(self, cls=ProblemEncoder)
 
+    def fingerprint(self) -> str:
+        """Return a content hash of the annealing problem, independent of term order."""
+        return self.to_problem().fingerprint()
+
     def __eq__(self, other) -> bool:
         if not isinstance(other, self.__class__):
             return False
         return self.to_problem() == other.to_problem()
 
+    def __hash__(self) -> int:
+        return hash(self.to_problem())
+
 
 class ProblemEncoder(json.JSONEncoder):
     """Custom JSON encoder for Problem data class."""
@@ -124,6 +380,8 @@ class ProblemEncoder(json.JSONEncoder):
     def default(self, o: Any) -> Any:
         if isinstance(o, AnnealingProgram):
             return self.default(o.to_problem())
+        if isinstance(o, SparseProblem):
+            return self.default(o.to_problem())
         if isinstance(o, Problem):
             data = {"problem_type": o.problem_type.value}
             if o.linear:
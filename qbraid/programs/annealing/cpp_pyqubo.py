@@ -30,13 +30,24 @@ class PyQuboModel(AnnealingProgram):
             raise ProgramTypeError(
                 message=f"Expected 'pyqubo.Model' object, got '{type(program)}'."
             )
+        self._qubo_problem: QuboProblem | None = None
 
     def to_problem(self, **kwargs) -> QuboProblem:
-        """Converts the cpp_pyqubo.Model to a Problem instance."""
+        """Converts the cpp_pyqubo.Model to a Problem instance.
+
+        The problem compiled without keyword arguments is cached, so repeated
+        calls do not re-run ``Model.to_qubo``.
+        """
+        if not kwargs and self._qubo_problem is not None:
+            return self._qubo_problem
+
         qubo, _ = self.program.to_qubo(**kwargs)
         coefficients = {}
 
         for key, value in qubo.items():
             coefficients[key] = value
 
-        return QuboProblem(coefficients)
+        problem = QuboProblem(coefficients)
+        if not kwargs:
+            self._qubo_problem = problem
+        return problem
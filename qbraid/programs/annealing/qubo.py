@@ -29,7 +29,13 @@ class QuboProgram(AnnealingProgram):
             raise ProgramTypeError(
                 message=f"Expected '{QuboCoefficientsDict}' object, got '{type(program)}'."
             )
+        self._qubo_problem: QuboProblem | None = None
 
     def to_problem(self) -> QuboProblem:
-        """Converts the QuboCoefficientsDict a Problem instance."""
-        return QuboProblem(self.program)
+        """Converts the QuboCoefficientsDict a Problem instance.
+
+        The problem is cached, so repeated calls do not rebuild it from the coefficients.
+        """
+        if self._qubo_problem is None:
+            self._qubo_problem = QuboProblem(self.program)
+        return self._qubo_problem
@@ -14,8 +14,10 @@ Module defining GateModelProgram Class
 """
 from __future__ import annotations
 
+import hashlib
+import math
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Hashable, Iterable, Optional, Sequence
 
 import numpy as np
 
@@ -24,6 +26,27 @@ from qbraid.programs.program import QuantumProgram
 if TYPE_CHECKING:
     import qbraid.runtime
 
+GateSignature = tuple[str, Sequence[Any], Sequence[Hashable]]
+
+
+def _normalize_parameter(value: Any, decimals: int) -> Hashable:
+    """Round a numeric gate parameter, or return a string for a symbolic one."""
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return tuple(_normalize_parameter(item, decimals) for item in value)
+    if isinstance(value, (complex, np.complexfloating)):
+        return (
+            _normalize_parameter(value.real, decimals),
+            _normalize_parameter(value.imag, decimals),
+        )
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return str(value)
+    if not math.isfinite(number):
+        return repr(number)
+    # Adding 0.0 maps -0.0 to 0.0 so that both have the same representation.
+    return round(number, decimals) + 0.0
+
 
 class GateModelProgram(QuantumProgram, ABC):
     """Abstract class for qbraid program wrapper objects."""
@@ -124,6 +147,39 @@ class GateModelProgram(QuantumProgram, ABC):
         tensor_le = np.einsum(tensor_be, indicies_in + indicies_out)
         return tensor_le.reshape([rank, rank])
 
+    def _gate_signatures(self) -> Iterable[GateSignature]:
+        """Yield the name, parameters, and qubit indices of each operation, in program order."""
+        raise NotImplementedError
+
+    def fingerprint(self, decimals: int = 10) -> str:
+        """Return a structural hash of the circuit.
+
+        The hash is computed from the canonical gate list of the circuit: the lowercase
+        name of each operation, its numeric parameters rounded to ``decimals`` places
+        (symbolic parameters by name), and the indices of the qubits it acts on, together
+        with the number of qubits. Circuits with equal fingerprints are structurally
+        identical up to the rounding of parameters, which makes fingerprints suitable for
+        deduplication and as a fast pre-check before comparing unitaries. The cost is
+        linear in the number of operations.
+
+        Args:
+            decimals (int): Number of decimal places to which parameters are rounded.
+                Defaults to 10.
+
+        Returns:
+            str: SHA-256 hex digest of the canonical gate list.
+        """
+        digest = hashlib.sha256(str(self.num_qubits).encode())
+        for name, params, qubits in self._gate_signatures():
+            entry = (
+                str(name).lower(),
+                tuple(_normalize_parameter(param, decimals) for param in params),
+                tuple(qubits),
+            )
+            digest.update(repr(entry).encode())
+            digest.update(b";")
+        return digest.hexdigest()
+
     def remove_idle_qubits(self) -> None:
         """Remove empty registers of circuit."""
         raise NotImplementedError
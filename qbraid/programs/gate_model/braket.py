@@ -14,13 +14,13 @@ Module defining BraketCircuit Class
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
 
 from braket.circuits import Circuit, Instruction, Qubit
 
 from qbraid.programs.exceptions import ProgramTypeError
 
-from ._model import GateModelProgram
+from ._model import GateModelProgram, GateSignature
 
 if TYPE_CHECKING:
     import braket.circuits
@@ -61,6 +61,22 @@ class BraketCircuit(GateModelProgram):
         """Calculate unitary of circuit."""
         return self.program.to_unitary()
 
+    def _gate_signatures(self) -> Iterable[GateSignature]:
+        """Yield the name, parameters, and qubit indices of each operation, in program order."""
+        for instruction in self.program.instructions:
+            operator = instruction.operator
+            params = list(getattr(operator, "parameters", None) or [])
+            if not params and operator.name == "Unitary":
+                params.append(operator.to_matrix())
+            if instruction.control:
+                params.append(f"control_state={instruction.control_state}")
+            if instruction.power != 1:
+                params.append(f"power={instruction.power}")
+            qubits = [int(qubit) for qubit in instruction.control] + [
+                int(qubit) for qubit in instruction.target
+            ]
+            yield operator.name, params, qubits
+
     def populate_idle_qubits(self) -> None:
         """Checks whether the circuit uses contiguous qubits/indices,
         and if not, adds identity gates to vacant registers as needed."""
@@ -13,12 +13,14 @@ Module defining CirqCircuit Class
 
 """
 
+from typing import Iterable
+
 import cirq
 import numpy as np
 
 from qbraid.programs.exceptions import ProgramTypeError
 
-from ._model import GateModelProgram
+from ._model import GateModelProgram, GateSignature
 
 
 class CirqCircuit(GateModelProgram):
@@ -50,6 +52,23 @@ class CirqCircuit(GateModelProgram):
         """Calculate unitary of circuit."""
         return self.program.unitary()
 
+    def _gate_signatures(self) -> Iterable[GateSignature]:
+        """Yield the name, parameters, and qubit indices of each operation, in program order."""
+        qubit_index = {
+            qubit: index for index, qubit in enumerate(sorted(self.program.all_qubits()))
+        }
+        for op in self.program.all_operations():
+            gate = op.gate
+            if gate is None:
+                name, params = type(op).__name__, [repr(op)]
+            else:
+                name = type(gate).__name__
+                value_equality_values = getattr(gate, "_value_equality_values_", None)
+                params = value_equality_values() if value_equality_values else [repr(gate)]
+                if not isinstance(params, tuple):
+                    params = [params]
+            yield name, params, [qubit_index[qubit] for qubit in op.qubits]
+
     @staticmethod
     def is_measurement_gate(op: cirq.Operation) -> bool:
         """Returns whether Cirq gate/operation is MeasurementGate."""
@@ -15,12 +15,12 @@ Module defining IonQProgram Class
 from __future__ import annotations
 
 from enum import Enum
-from typing import Any
+from typing import Any, Iterable
 
 from qbraid.programs.exceptions import ProgramTypeError
 from qbraid.programs.typer import IonQDict
 
-from ._model import GateModelProgram
+from ._model import GateModelProgram, GateSignature
 
 # https://docs.ionq.com/api-reference/v0.3/writing-quantum-programs#supported-gates
 IONQ_QIS_GATES = [
@@ -88,6 +88,22 @@ class IonQProgram(GateModelProgram):
         """Return the number of classical bits in the circuit."""
         return 0
 
+    def _gate_signatures(self) -> Iterable[GateSignature]:
+        """Yield the name, parameters, and qubit indices of each operation, in program order."""
+        qubit_keys = ("control", "controls", "target", "targets")
+        for instr in self.program.get("circuit", []):
+            qubits = []
+            for key in qubit_keys:
+                value = instr.get(key)
+                if value is not None:
+                    qubits.extend(value if isinstance(value, list) else [value])
+            params = [
+                (key, value)
+                for key, value in sorted(instr.items())
+                if key != "gate" and key not in qubit_keys
+            ]
+            yield instr.get("gate"), params, qubits
+
     @staticmethod
     def determine_gateset(circuit: list[dict[str, Any]]) -> GateSet:
         """Determines the gate set of an IonQ circuit gate list.
@@ -12,14 +12,14 @@
 Module defining PennylaneTape Class
 
 """
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
 
 import pennylane as qml
 from pennylane.tape import QuantumTape
 
 from qbraid.programs.exceptions import ProgramTypeError
 
-from ._model import GateModelProgram
+from ._model import GateModelProgram, GateSignature
 
 if TYPE_CHECKING:
     import numpy as np
@@ -58,6 +58,16 @@ class PennylaneTape(GateModelProgram):
 
         return max(op_count.values())
 
+    def _gate_signatures(self) -> Iterable[GateSignature]:
+        """Yield the name, parameters, and qubit indices of each operation, in program order."""
+        tape = self.program
+        for op in tape.operations:
+            yield op.name, op.parameters, [tape.wires.index(wire) for wire in op.wires]
+        for measurement in tape.measurements:
+            yield type(measurement).__name__, [repr(measurement)], [
+                tape.wires.index(wire) for wire in measurement.wires
+            ]
+
     def _unitary(self) -> "np.ndarray":
         """Return the unitary of the Pennylane tape"""
         return qml.matrix(self.program, wire_order=self.qubits)
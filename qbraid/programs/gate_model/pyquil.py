@@ -14,15 +14,15 @@ Module defining PyQuilProgram Class
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
 
 from pyquil import Program
-from pyquil.quilbase import Declare, Measurement
+from pyquil.quilbase import Declare, Gate, Measurement
 from pyquil.simulation.tools import program_unitary
 
 from qbraid.programs.exceptions import ProgramTypeError
 
-from ._model import GateModelProgram
+from ._model import GateModelProgram, GateSignature
 
 if TYPE_CHECKING:
     import numpy as np
@@ -67,3 +67,15 @@ class PyQuilProgram(GateModelProgram):
         """Return the unitary of a pyQuil program."""
         program_copy = self.remove_measurements(self.program)
         return program_unitary(program_copy, n_qubits=self.num_qubits)
+
+    def _gate_signatures(self) -> Iterable[GateSignature]:
+        """Yield the name, parameters, and qubit indices of each operation, in program order."""
+        for instruction in self.program.instructions:
+            if isinstance(instruction, Gate):
+                name = "".join(f"{modifier} " for modifier in instruction.modifiers)
+                qubits = [getattr(qubit, "index", str(qubit)) for qubit in instruction.qubits]
+                yield name + instruction.name, instruction.params, qubits
+            elif isinstance(instruction, Measurement):
+                yield "measure", [], [getattr(instruction.qubit, "index", str(instruction.qubit))]
+            elif not isinstance(instruction, Declare):
+                yield type(instruction).__name__, [str(instruction)], []
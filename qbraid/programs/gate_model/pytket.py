@@ -13,7 +13,7 @@ Module defining PytketCircuit Class
 
 """
 
-from typing import Optional, Union
+from typing import Iterable, Optional, Union
 
 import numpy as np
 from pytket.circuit import Circuit, Command, OpType
@@ -32,7 +32,7 @@ from pytket.unit_id import Qubit
 
 from qbraid.programs.exceptions import ProgramTypeError, TransformError
 
-from ._model import GateModelProgram
+from ._model import GateModelProgram, GateSignature
 
 IONQ_GATES = {
     OpType.X,
@@ -90,6 +90,13 @@ class PytketCircuit(GateModelProgram):
         """Return the circuit depth (i.e., length of critical path)."""
         return self.program.depth()
 
+    def _gate_signatures(self) -> Iterable[GateSignature]:
+        """Yield the name, parameters, and qubit indices of each operation, in program order."""
+        qubit_index = {qubit: index for index, qubit in enumerate(self.program.qubits)}
+        for command in self.program.get_commands():
+            qubits = [qubit_index[qubit] for qubit in command.qubits]
+            yield command.op.type.name, command.op.params, qubits
+
     @staticmethod
     def remove_measurements(original_circuit):
         """
@@ -15,7 +15,7 @@ Module defining OpenQasm2Program class.
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
 
 import numpy as np
 from openqasm3.ast import Program
@@ -23,10 +23,11 @@ from openqasm3.parser import parse
 from qbraid_core._import import LazyLoader
 
 from qbraid.passes.qasm import depth, normalize_qasm_gate_params, rebase, remove_measurements
+from qbraid.passes.qasm.analyze import gate_signatures
 from qbraid.programs.exceptions import ProgramTypeError
 from qbraid.programs.typer import Qasm2String, Qasm2StringType
 
-from ._model import GateModelProgram
+from ._model import GateModelProgram, GateSignature
 
 if TYPE_CHECKING:
     import qbraid.runtime
@@ -87,6 +88,10 @@ class OpenQasm2Program(GateModelProgram):
         """Return the unitary of the QASM"""
         return transpiler.transpile(self.program, "cirq").unitary()
 
+    def _gate_signatures(self) -> Iterable[GateSignature]:
+        """Yield the name, parameters, and qubit indices of each operation, in program order."""
+        return gate_signatures(self.parsed())
+
     def transform(self, device: qbraid.runtime.QuantumDevice, **kwargs) -> None:
         """Transform program to according to device target profile."""
         if device.id == "quera_qasm_simulator":
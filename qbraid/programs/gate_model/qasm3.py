@@ -14,19 +14,30 @@ Module defining OpenQasm3Program class.
 """
 from __future__ import annotations
 
-import re
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Iterable, Optional
 
 import numpy as np
-from openqasm3.ast import BitType, ClassicalDeclaration, Program, QubitDeclaration
+from openqasm3.ast import (
+    BitType,
+    ClassicalDeclaration,
+    Identifier,
+    IndexedIdentifier,
+    IntegerLiteral,
+    Program,
+    QuantumGateDefinition,
+    QubitDeclaration,
+    Span,
+    SubroutineDefinition,
+)
 from openqasm3.parser import parse
+from openqasm3.visitor import QASMVisitor
 
 from qbraid.passes.qasm import depth, normalize_qasm_gate_params, rebase
-from qbraid.passes.qasm.analyze import expression_value_option
+from qbraid.passes.qasm.analyze import expression_value_option, gate_signatures
 from qbraid.programs.exceptions import ProgramTypeError
 from qbraid.programs.typer import Qasm3String, Qasm3StringType
 
-from ._model import GateModelProgram
+from ._model import GateModelProgram, GateSignature
 
 if TYPE_CHECKING:
     import qbraid.runtime
@@ -44,6 +55,71 @@ def auto_reparse(func):
     return wrapper
 
 
+class _QubitReferences(QASMVisitor):
+    """Collects the references to the qubit registers of a program.
+
+    Gate and subroutine definitions are skipped, as their qubit arguments are local
+    names that may shadow a register.
+    """
+
+    def __init__(self, registers: Iterable[str]):
+        self.used: dict[str, set[int]] = {name: set() for name in registers}
+        self.fully_used: set[str] = set()
+        self.indexed: list[tuple[str, int, IndexedIdentifier]] = []
+
+    def visit_QubitDeclaration(self, node: QubitDeclaration) -> None:
+        """Skip register declarations."""
+
+    def visit_QuantumGateDefinition(self, node: QuantumGateDefinition) -> None:
+        """Skip gate definitions."""
+
+    def visit_SubroutineDefinition(self, node: SubroutineDefinition) -> None:
+        """Skip subroutine definitions."""
+
+    def visit_Identifier(self, node: Identifier) -> None:
+        """Record a reference to a whole register."""
+        if node.name in self.used:
+            self.fully_used.add(node.name)
+
+    def visit_IndexedIdentifier(self, node: IndexedIdentifier) -> None:
+        """Record a reference to a single qubit, or to a slice of a register."""
+        name = node.name.name
+        if name not in self.used:
+            return
+        indices = node.indices
+        if (
+            len(indices) == 1
+            and isinstance(indices[0], list)
+            and len(indices[0]) == 1
+            and isinstance(indices[0][0], IntegerLiteral)
+        ):
+            index = indices[0][0].value
+            self.used[name].add(index)
+            self.indexed.append((name, index, node))
+        else:
+            # index sets, ranges and expressions may reach any qubit of the register
+            self.fully_used.add(name)
+
+
+def _replace_spans(source: str, replacements: list[tuple[Span, str]]) -> str:
+    """Replace the source text of non-overlapping spans of a program, in a single pass."""
+    line_offsets = [0]
+    for line in source.split("\n"):
+        line_offsets.append(line_offsets[-1] + len(line) + 1)
+
+    chunks = []
+    pos = 0
+    for span, text in sorted(
+        replacements, key=lambda item: (item[0].start_line, item[0].start_column)
+    ):
+        start = line_offsets[span.start_line - 1] + span.start_column
+        chunks.append(source[pos:start])
+        chunks.append(text)
+        pos = line_offsets[span.end_line - 1] + span.end_column + 1
+    chunks.append(source[pos:])
+    return "".join(chunks)
+
+
 class OpenQasm3Program(GateModelProgram):
     """Wrapper class for OpenQASM 3 strings."""
 
@@ -118,120 +194,33 @@ class OpenQasm3Program(GateModelProgram):
         """Calculate unitary of circuit."""
         raise NotImplementedError
 
-    @staticmethod
-    def _remove_gate_definitions(qasm_str: str) -> str:
-        """This is required to account for the case when the gate
-        definition has an argument which is having same name as a
-        quantum register
-
-        now, if any gate is applied on this argument, it will be
-        interpreted as being applied on THE WHOLE register, when it is
-        only applied on the argument.
+    def _gate_signatures(self) -> Iterable[GateSignature]:
+        """Yield the name, parameters, and qubit indices of each operation, in program order."""
+        return gate_signatures(self.parsed())
 
-        Example :
+    def _qubit_references(self, program: Program) -> _QubitReferences:
+        """Collect the qubits referenced by each quantum register, in one traversal."""
+        references = _QubitReferences(name for name, _ in self.qubits)
+        references.visit(program)
+        return references
 
-        gate custom q1 {
-            x q1; // this is STILL DETECTED as a gate application on q1
-        }
-        qreg q1[4];
-        qreg q2[2];
-        custom q1[0];
-        cx q1[1], q2[1];
-
-        // Actual depth : 1
-        // Calculated depth : 2 (because of the gate definition)
-
-        Args:
-            qasm_str (string): The qasm string
-        Returns:
-            qasm_str (string): The qasm string with gate definitions removed
-        """
-        gate_decls = [x.group() for x in re.finditer(r"(gate)(.*\n)*?\s*\}", qasm_str)]
-        for decl in gate_decls:
-            qasm_str = qasm_str.replace(decl, "")
-        return qasm_str
-
-    def _get_unused_qubit_indices(self) -> dict:
+    def _get_unused_qubit_indices(self, references: Optional[_QubitReferences] = None) -> dict:
         """Get unused qubit indices in the circuit
 
         Returns:
             dict: A dictionary with keys as register names and values as sets of unused indices
         """
-        qasm_str = self._remove_gate_definitions(self.program)
-        lines = qasm_str.splitlines()
-        gate_lines = [
-            s
-            for s in lines
-            if s.strip()
-            and not s.strip().startswith(("OPENQASM", "include", "qreg", "qubit", "bit", "//"))
-        ]
+        references = references or self._qubit_references(self.parsed())
         unused_indices = {}
         for qreg, size in self.qubits:
-            size = 1 if size is None else size
-            unused_indices[qreg] = set(range(size))
-
-            for line in gate_lines:
-                if qreg not in line:
-                    continue
-                # either qubits or full register is referenced
-                used_indices = {int(x) for x in re.findall(rf"{qreg}\[(\d+)\]", line)}
-                if len(used_indices) > 0:
-                    unused_indices[qreg] = unused_indices[qreg].difference(used_indices)
-                else:
-                    # full register is referenced
-                    unused_indices[qreg] = set()
-                    break
-
-                if len(unused_indices[qreg]) == 0:
-                    break
+            if qreg in references.fully_used:
+                unused_indices[qreg] = set()
+            else:
+                size = 1 if size is None else size
+                unused_indices[qreg] = set(range(size)).difference(references.used[qreg])
 
         return unused_indices
 
-    @staticmethod
-    def _remap_qubits(qasm_str, reg_name, reg_size, unused_indices):
-        """Re-map the qubits for a partially used quantum register
-        Args:
-            qasm_str (str): QASM string
-            reg_name (str): name of register
-            reg_size (int): original size of register
-            unused_indices (set): set of unused indices
-
-        Returns:
-            str: updated qasm string"""
-        required_size = reg_size - len(unused_indices)
-
-        new_id = 0
-        qubit_map = {}
-        for idx in range(reg_size):
-            if idx not in unused_indices:
-                # idx -> new_id
-                qubit_map[idx] = new_id
-                new_id += 1
-
-        # old_id WILL NEVER match the declaration
-        # as it will be < the original size of register
-
-        # 1. Replace the qubits first
-        #    as the regex may match the new declaration itself
-        for old_id, new_id in qubit_map.items():
-            if old_id != new_id:
-                qasm_str = re.sub(rf"{reg_name}\s*\[{old_id}\]", f"{reg_name}[{new_id}]", qasm_str)
-
-        # 2. Replace the declaration
-        qasm_str = re.sub(
-            rf"qreg\s+{reg_name}\s*\[{reg_size}\]\s*;",
-            f"qreg {reg_name}[{required_size}];",
-            qasm_str,
-        )
-        qasm_str = re.sub(
-            rf"qubit\s*\[{reg_size}\]\s*{reg_name}\s*;",
-            f"qubit[{required_size}] {reg_name};",
-            qasm_str,
-        )
-        # 1 qubit register can never be partially used :)
-
-        return qasm_str
-
     @auto_reparse
     def populate_idle_qubits(self) -> None:
         """Converts OpenQASM 3 string to contiguous qasm3 string with gate expansion.
@@ -240,12 +229,13 @@ class OpenQasm3Program(GateModelProgram):
         """
         # Analyse the qasm3 string for registers and find unused qubits
         qubit_indices = self._get_unused_qubit_indices()
-        expansion_qasm = ""
 
         # Add an identity gate for the unused qubits
-        for reg, indices in qubit_indices.items():
-            for index in indices:
-                expansion_qasm += f"i {reg}[{index}];\n"
+        expansion_qasm = "".join(
+            f"i {reg}[{index}];\n"
+            for reg, indices in qubit_indices.items()
+            for index in sorted(indices)
+        )
 
         qasm: str = self.program
         self._program = qasm + expansion_qasm
@@ -254,31 +244,41 @@ class OpenQasm3Program(GateModelProgram):
     def remove_idle_qubits(self) -> None:
         """Checks whether the circuit uses contiguous qubits/indices,
         and if not, reduces dimension accordingly."""
-        qasm_str: str = self.program
-        qreg_list = set(self.qubits)
-        qubit_indices = self._get_unused_qubit_indices()
-        for reg, indices in qubit_indices.items():
-            size = 1
-            for qreg in qreg_list:
-                if qreg[0] == reg:
-                    size = qreg[1] or 1
-                    break
-
-            # remove the register declarations which are not used
+        program = self.parsed()
+        references = self._qubit_references(program)
+        qubit_indices = self._get_unused_qubit_indices(references)
+        replacements: list[tuple[Span, str]] = []
+        lines = self._program.split("\n")
+
+        # remove the declarations of unused registers, and resize partially used ones
+        qubit_maps: dict[str, dict[int, int]] = {}
+        for statement in program.statements:
+            if not isinstance(statement, QubitDeclaration):
+                continue
+            reg = statement.qubit.name
+            indices = qubit_indices.get(reg)
+            if not indices:
+                continue
+            size = expression_value_option(statement.size) or 1
             if len(indices) == size:
-                qasm_str = re.sub(rf"qreg\s+{reg}\s*\[\d+\]\s*;", "", qasm_str)
-                qasm_str = re.sub(rf"qubit\s*\[\d+\]\s*{reg}\s*;", "", qasm_str)
-                if size == 1:
-                    qasm_str = re.sub(rf"qubit\s+{reg}\s*;", "", qasm_str)
-                try:
-                    qreg_list.remove((reg, size))
-                except KeyError:
-                    qreg_list.remove((reg, None))
-
-            # resize and re-map the indices of the partially used register
-            elif len(indices):
-                qasm_str = self._remap_qubits(qasm_str, reg, size, indices)
-        self._program = qasm_str
+                replacements.append((statement.span, ""))
+                continue
+
+            used = [idx for idx in range(size) if idx not in indices]
+            qubit_maps[reg] = {old_id: new_id for new_id, old_id in enumerate(used)}
+            declaration = lines[statement.span.start_line - 1][statement.span.start_column :]
+            if declaration.startswith("qreg"):
+                replacements.append((statement.span, f"qreg {reg}[{len(used)}];"))
+            else:
+                replacements.append((statement.span, f"qubit[{len(used)}] {reg};"))
+
+        # re-map the indices of the partially used registers
+        for reg, old_id, node in references.indexed:
+            new_id = qubit_maps.get(reg, {}).get(old_id, old_id)
+            if new_id != old_id:
+                replacements.append((node.span, f"{reg}[{new_id}]"))
+
+        self._program = _replace_spans(self._program, replacements)
 
     def _validate_qubit_mapping(self, qubit_decls, qubit_mapping: dict):
         """Validate the supplied qubit map
@@ -342,34 +342,19 @@ class OpenQasm3Program(GateModelProgram):
         if not qubit_mapping:
             return
 
-        qasm = self._program
         qubit_decls = self.qubits
         self._validate_qubit_mapping(qubit_decls, qubit_mapping)
 
-        # need some placeholder to avoid replacing the same qubit multiple times
-        # in case of a CYCLIC mapping
-
-        # Eg. { q : {0:1, 1:0} }
-        # In this case if we have
-        # cnot q[0], q[1]; and apply the mapping
-        # first q[0] -> q[1] and state is -
-        # cnot q[1], q[1];
-        # second, q[1] -> q[0] and state is -
-        # cnot q[0], q[0];
-
-        # this is inconsistent
-
-        marker = "-"
-        for name, _ in qubit_decls:
-            for old_id, new_id in qubit_mapping[name].items():
-                if old_id != new_id:
-                    qasm = re.sub(rf"{name}\s*\[{old_id}\]", f"{name}[{marker}{new_id}]", qasm)
-
-        # remove the '-' markers
-        for name, _ in qubit_decls:
-            qasm = re.sub(rf"{name}\[{marker}", f"{name}[", qasm)
+        # every operand is rewritten from the original program at once, so cyclic
+        # mappings such as { q : {0:1, 1:0} } cannot remap a qubit twice
+        references = self._qubit_references(self.parsed())
+        replacements = [
+            (node.span, f"{reg}[{qubit_mapping[reg][old_id]}]")
+            for reg, old_id, node in references.indexed
+            if qubit_mapping[reg].get(old_id, old_id) != old_id
+        ]
 
-        self._program = qasm
+        self._program = _replace_spans(self._program, replacements)
 
     @auto_reparse
     def replace_reset_with_ops(self) -> None:
@@ -15,7 +15,7 @@ Module defining QiskitCircuit Class
 from __future__ import annotations
 
 from collections import OrderedDict
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
 
 import qiskit
 from qiskit.circuit import Qubit
@@ -24,7 +24,7 @@ from qiskit.quantum_info import Operator
 
 from qbraid.programs.exceptions import ProgramTypeError
 
-from ._model import GateModelProgram
+from ._model import GateModelProgram, GateSignature
 
 if TYPE_CHECKING:
     import numpy as np
@@ -67,6 +67,13 @@ class QiskitCircuit(GateModelProgram):
         circuit.remove_final_measurements()
         return Operator(circuit).data
 
+    def _gate_signatures(self) -> Iterable[GateSignature]:
+        """Yield the name, parameters, and qubit indices of each operation, in program order."""
+        circuit = self.program
+        for instruction in circuit.data:
+            qubits = [circuit.find_bit(qubit).index for qubit in instruction.qubits]
+            yield instruction.operation.name, instruction.operation.params, qubits
+
     def remove_idle_qubits(self) -> None:
         """Checks whether the circuit uses contiguous qubits/indices,
         and if not, reduces dimension accordingly."""
@@ -25,6 +25,7 @@ from qbraid.exceptions import QbraidError
 
 from .alias_manager import get_program_type_alias
 from .registry import QPROGRAM
+from .typer import IonQDictInstanceMeta
 
 if TYPE_CHECKING:
     from qbraid.programs.ahs import AnalogHamiltonianProgram
@@ -58,16 +59,22 @@ def load_program(
     if isinstance(program, openqasm3.ast.Program):
         program = openqasm3.dumps(program)
 
-    try:
-        package = get_program_type_alias(program)
-    except QbraidError as err:
-        raise ProgramLoaderError(f"Error loading quantum program of type {type(program)}") from err
-
-    try:
-        load_program_class = load_entrypoint("programs", package)
-    except Exception as err:
-        raise ProgramLoaderError(f"Error loading quantum program of type {type(program)}") from err
-
-    program_instance = load_program_class(program)
+    # the alias lookup and the program class check the same program, e.g. an IonQ dict
+    with IonQDictInstanceMeta.reuse_checks():
+        try:
+            package = get_program_type_alias(program)
+        except QbraidError as err:
+            raise ProgramLoaderError(
+                f"Error loading quantum program of type {type(program)}"
+            ) from err
+
+        try:
+            load_program_class = load_entrypoint("programs", package)
+        except Exception as err:
+            raise ProgramLoaderError(
+                f"Error loading quantum program of type {type(program)}"
+            ) from err
+
+        program_instance = load_program_class(program)
 
     return program_instance
@@ -28,6 +28,9 @@ QPROGRAM_TYPES = _QPROGRAM_TYPES
 
 QPROGRAM = TypeVar("QPROGRAM", bound=Any)
 
+# program type -> registry entries able to match its instances, see alias_manager
+_TYPE_ALIAS_INDEX: dict[Type[Any], tuple] = {}
+
 
 def derive_program_type_alias(program_type: Type[Any], use_submodule: bool = False) -> str:
     """
@@ -132,6 +135,7 @@ def register_program_type(
     QPROGRAM_REGISTRY[normalized_alias] = program_type
     QPROGRAM_ALIASES.add(normalized_alias)
     QPROGRAM_TYPES.add(program_type)
+    _TYPE_ALIAS_INDEX.clear()
 
 
 def unregister_program_type(alias: str, raise_error: bool = True) -> None:
@@ -155,6 +159,7 @@ def unregister_program_type(alias: str, raise_error: bool = True) -> None:
         return
 
     program_type = QPROGRAM_REGISTRY.pop(normalized_alias)
+    _TYPE_ALIAS_INDEX.clear()
 
     if not any(pt == program_type for pt in QPROGRAM_REGISTRY.values()):
         QPROGRAM_TYPES.discard(program_type)
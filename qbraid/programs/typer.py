@@ -13,8 +13,10 @@ Module providing granular type checking for quantum programs
 that use Python's built-in types.
 
 """
+import threading
 from abc import ABCMeta, abstractmethod
-from typing import Any, Optional, Type, TypeVar
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional, Type, TypeVar
 
 from openqasm3.parser import QASM3ParsingError, parse
 
@@ -41,7 +43,14 @@ class QbraidMetaType(ABCMeta):
 
 
 class IonQDictInstanceMeta(QbraidMetaType):
-    """Metaclass for IonQ JSON type checking based on dict content."""
+    """Metaclass for IonQ JSON type checking based on dict content.
+
+    Every instance check validates each gate of the circuit. Callers that check the same
+    payloads several times in a row, e.g. resolving the alias of a program and then loading
+    it, can validate each payload only once by making the checks within :meth:`reuse_checks`.
+    """
+
+    _local = threading.local()
 
     @property
     def __alias__(cls) -> str:
@@ -65,11 +74,32 @@ class IonQDictInstanceMeta(QbraidMetaType):
         ):
             raise ValidationError(f"Invalid {field_name}s: {multiple}. Must be a list of integers.")
 
+    @classmethod
+    @contextmanager
+    def reuse_checks(mcs) -> Iterator[None]:
+        """Remember the dicts that pass the instance check within the block, in this thread.
+
+        Dicts are remembered by identity until the outermost block exits, so the checked
+        payloads must not be modified within the block.
+        """
+        if getattr(mcs._local, "validated", None) is not None:
+            yield
+            return
+        mcs._local.validated = {}
+        try:
+            yield
+        finally:
+            mcs._local.validated = None
+
     def __instancecheck__(cls, instance: Any) -> bool:
         """Custom instance checks based on dict format."""
         if not isinstance(instance, dict):
             return False
 
+        validated = getattr(cls._local, "validated", None)
+        if validated is not None and validated.get(id(instance)) is instance:
+            return True
+
         qubits = instance.get("qubits")
         circuit = instance.get("circuit")
         gateset = instance.get("gateset")
@@ -105,6 +135,8 @@ class IonQDictInstanceMeta(QbraidMetaType):
             except ValidationError:
                 return False
 
+        if validated is not None:
+            validated[id(instance)] = instance
         return True
 
 
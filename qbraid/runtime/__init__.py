@@ -35,6 +35,12 @@ Functions
    :toctree: ../stubs/
 
     display_jobs_from_data
+    enable_result_cache
+    disable_result_cache
+    get_result_cache
+    enable_connection_pool
+    disable_connection_pool
+    get_connection_pool
 
 Classes
 --------
@@ -44,6 +50,7 @@ Classes
 
     RuntimeOptions
     TargetProfile
+    ProgramContext
     QuantumDevice
     QuantumJob
     QuantumProvider
@@ -53,6 +60,8 @@ Classes
     AhsResultData
     AhsShotResult
     AnnealingResultData
+    ResultCache
+    ConnectionPool
 
 Exceptions
 ------------
@@ -71,6 +80,8 @@ import importlib
 from typing import TYPE_CHECKING
 
 from ._display import display_jobs_from_data
+from .cache import ResultCache, disable_result_cache, enable_result_cache, get_result_cache
+from .context import ProgramContext
 from .device import QuantumDevice
 from .enums import DeviceStatus, JobStatus, ValidationLevel
 from .exceptions import (
@@ -80,6 +91,12 @@ from .exceptions import (
     QbraidRuntimeError,
     ResourceNotFoundError,
 )
+from .http_pool import (
+    ConnectionPool,
+    disable_connection_pool,
+    enable_connection_pool,
+    get_connection_pool,
+)
 from .job import QuantumJob
 from .noise import NoiseModel, NoiseModelSet
 from .options import RuntimeOptions
@@ -105,6 +122,7 @@ __all__ = [
     "ResourceNotFoundError",
     "DeviceProgramTypeMismatchError",
     "TargetProfile",
+    "ProgramContext",
     "QuantumJob",
     "QuantumProvider",
     "RuntimeOptions",
@@ -117,6 +135,14 @@ __all__ = [
     "AhsShotResult",
     "AnnealingResultData",
     "ValidationLevel",
+    "ResultCache",
+    "enable_result_cache",
+    "disable_result_cache",
+    "get_result_cache",
+    "ConnectionPool",
+    "enable_connection_pool",
+    "disable_connection_pool",
+    "get_connection_pool",
 ]
 
 _lazy = {
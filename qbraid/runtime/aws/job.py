@@ -23,6 +23,7 @@ from braket.tasks.analog_hamiltonian_simulation_quantum_task_result import (
 from braket.tasks.gate_model_quantum_task_result import GateModelQuantumTaskResult
 
 from qbraid._logging import logger
+from qbraid.runtime.cache import cached_result
 from qbraid.runtime.enums import JobStatus
 from qbraid.runtime.exceptions import JobStateError
 from qbraid.runtime.job import QuantumJob
@@ -83,6 +84,7 @@ class BraketQuantumTask(QuantumJob):
                 "Queue visibility is only available for amazon-braket-sdk>=1.56.0"
             ) from err
 
+    @cached_result
     def result(self) -> Result:
         """Return the results of the job."""
 
@@ -14,13 +14,12 @@ Module defining BraketGateModelResultBuilder Class
 """
 from __future__ import annotations
 
-from collections import Counter
 from typing import TYPE_CHECKING, Optional
 
 import numpy as np
 
 from qbraid.runtime.exceptions import QbraidRuntimeError
-from qbraid.runtime.result_data import AhsShotResult
+from qbraid.runtime.result_data import AhsResultData, AhsShotResult
 
 if TYPE_CHECKING:
     from braket.tasks.analog_hamiltonian_simulation_quantum_task_result import (
@@ -96,21 +95,7 @@ class BraketAhsResultBuilder:
                 the result object.
 
         """
-        state_counts = Counter()
-        states = ["e", "r", "g"]
         try:
-            for shot in self.measurements():
-                if shot.success:
-                    pre = shot.pre_sequence
-                    post = shot.post_sequence
-                    # converting presequence and postsequence measurements to state_idx
-                    state_idx = [
-                        0 if pre_i == 0 else 1 if post_i == 0 else 2
-                        for pre_i, post_i in zip(pre, post)
-                    ]
-                    state = "".join(states[s_idx] for s_idx in state_idx)
-                    state_counts.update([state])
+            return AhsResultData(measurements=self.measurements()).get_counts()
         except AttributeError as err:
             raise ResultDecodingError from err
-
-        return None if not state_counts else dict(state_counts)
@@ -0,0 +1,152 @@
+# Copyright (C) 2024 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Module providing an opt-in, on-disk cache for the results of quantum jobs
+that have reached a terminal state.
+
+"""
+from __future__ import annotations
+
+import functools
+import hashlib
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar, Union
+
+from qbraid._caching import DEFAULT_CACHE_MAX_BYTES, DiskCache
+from qbraid._logging import logger
+from qbraid._version import __version__
+
+from .enums import JobStatus
+
+if TYPE_CHECKING:
+    import qbraid.runtime
+
+TFunc = TypeVar("TFunc", bound=Callable)
+
+_RESULT_CACHE: Optional[ResultCache] = None
+
+
+def _default_cache_dir() -> Path:
+    """Return the default directory used to store cached job results."""
+    env_dir = os.getenv("QBRAID_RESULT_CACHE_DIR")
+    if env_dir:
+        return Path(env_dir).expanduser()
+    return Path.home() / ".qbraid" / "cache" / "results"
+
+
+class ResultCache(DiskCache):
+    """Size-bounded, least-recently-used cache of job results stored on disk.
+
+    Entries are addressed by a SHA-256 digest of the job class, job ID, and qBraid version,
+    so results from different providers can never collide and entries pickled by an
+    incompatible SDK release are never loaded. Writes are atomic, and the least-recently-used
+    entries are evicted whenever the total size of the cache exceeds ``max_bytes``.
+
+    Args:
+        directory (str | Path, optional): Directory in which to store cached results.
+            Defaults to ``$QBRAID_RESULT_CACHE_DIR`` or ``~/.qbraid/cache/results``.
+        max_bytes (int): Maximum total size of the cache in bytes. Defaults to 256 MiB.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Union[str, os.PathLike]] = None,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+    ):
+        super().__init__(directory or _default_cache_dir(), max_bytes=max_bytes)
+
+    @staticmethod
+    def key(job: qbraid.runtime.QuantumJob) -> str:
+        """Return the content address under which the result of the given job is stored."""
+        job_cls = type(job)
+        key_str = f"{__version__}:{job_cls.__module__}.{job_cls.__qualname__}:{job.id}"
+        return hashlib.sha256(key_str.encode()).hexdigest()
+
+
+def enable_result_cache(
+    directory: Optional[Union[str, os.PathLike]] = None,
+    max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+) -> ResultCache:
+    """
+    Enable the on-disk cache for the results of jobs that have reached a terminal state.
+
+    Once enabled, repeated calls to ``result()`` on the same completed job are served from
+    disk instead of refetching and re-decoding the result from the remote service.
+
+    Note:
+        Cache entries are pickles, and loading a pickle can run arbitrary code. Only use a
+        directory that no other user can write to. Entries are ignored unless both the
+        directory and the entry are owned by the current user and not writable by group
+        or others.
+
+    Args:
+        directory (str | Path, optional): Directory in which to store cached results.
+            Defaults to ``$QBRAID_RESULT_CACHE_DIR`` or ``~/.qbraid/cache/results``.
+        max_bytes (int): Maximum total size of the cache in bytes. Defaults to 256 MiB.
+
+    Returns:
+        ResultCache: The active result cache.
+    """
+    global _RESULT_CACHE  # pylint: disable=global-statement
+    _RESULT_CACHE = ResultCache(directory=directory, max_bytes=max_bytes)
+    return _RESULT_CACHE
+
+
+def disable_result_cache() -> None:
+    """Disable the on-disk result cache. Existing cache entries are left on disk."""
+    global _RESULT_CACHE  # pylint: disable=global-statement
+    _RESULT_CACHE = None
+
+
+def get_result_cache() -> Optional[ResultCache]:
+    """Return the active result cache, or None if result caching is disabled."""
+    return _RESULT_CACHE
+
+
+def cached_result(func: TFunc) -> TFunc:
+    """
+    Decorator for ``QuantumJob.result`` implementations that serves results from the active
+    :class:`ResultCache`, if any, and stores the results of jobs in a terminal state.
+
+    Example usage:
+
+    .. code-block:: python
+
+        class MyJob(QuantumJob):
+
+            @cached_result
+            def result(self):
+                ...
+    """
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs) -> Any:
+        cache = _RESULT_CACHE
+        if cache is None or args or kwargs or os.getenv("DISABLE_CACHE") == "1":
+            return func(self, *args, **kwargs)
+
+        key = cache.key(self)
+        result = cache.get(key)
+        if result is not None:
+            return result
+
+        result = func(self)
+
+        if self._cache_metadata.get("status") in JobStatus.terminal_states():
+            try:
+                cache.put(key, result)
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                logger.warning("Failed to cache result of job %s: %s", self.id, err)
+
+        return result
+
+    return wrapper
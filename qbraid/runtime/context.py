@@ -0,0 +1,88 @@
+# Copyright (C) 2024 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Module defining the ProgramContext class, which carries a program through the runtime pipeline.
+
+"""
+from __future__ import annotations
+
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from qbraid.programs import ProgramLoaderError, ProgramSpec, get_program_type_alias, load_program
+
+if TYPE_CHECKING:
+    import qbraid.programs
+
+
+class ProgramContext:
+    """Carries a quantum program through the stages of a single submission.
+
+    The program type alias, its :class:`~qbraid.programs.ProgramSpec`, the loaded
+    :class:`~qbraid.programs.QuantumProgram` wrapper and the metrics derived from it
+    are computed on first access and then reused by every stage, so each is computed
+    at most once per program.
+
+    Args:
+        program (qbraid.programs.QPROGRAM): The quantum program.
+        alias (Optional[str]): The program type alias, if already known.
+    """
+
+    def __init__(self, program: qbraid.programs.QPROGRAM, alias: Optional[str] = None):
+        self.program = program
+        self._metrics: dict[str, Any] = {}
+        if alias is not None:
+            self.alias = alias
+
+    @cached_property
+    def alias(self) -> Optional[str]:
+        """The program type alias, or None if the program type is not registered."""
+        return get_program_type_alias(self.program, safe=True)
+
+    @cached_property
+    def spec(self) -> ProgramSpec:
+        """The program spec of the program."""
+        return ProgramSpec(type(self.program), alias=self.alias)
+
+    @cached_property
+    def qbraid_program(self) -> Optional[qbraid.programs.QuantumProgram]:
+        """The loaded program wrapper, or None if the program type is not supported natively."""
+        try:
+            return load_program(self.program)
+        except ProgramLoaderError:
+            return None
+
+    @cached_property
+    def num_qubits(self) -> int:
+        """The number of qubits of the loaded program."""
+        return self.qbraid_program.num_qubits
+
+    @cached_property
+    def depth(self) -> int:
+        """The circuit depth of the loaded program."""
+        return self.qbraid_program.depth
+
+    def metric(self, name: str, compute: Callable[[], Any]) -> Any:
+        """Return a derived metric of the program, computing it on first access.
+
+        Args:
+            name (str): The name of the metric, e.g. ``"qasm"``.
+            compute (Callable[[], Any]): Function computing the metric.
+
+        Returns:
+            Any: The cached value of the metric.
+        """
+        if name not in self._metrics:
+            self._metrics[name] = compute()
+        return self._metrics[name]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({type(self.program).__name__}, alias={self.alias!r})"
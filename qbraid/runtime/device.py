@@ -18,16 +18,11 @@ from __future__ import annotations
 
 import warnings
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any, Optional, Union, cast
 
 from qbraid._logging import logger
-from qbraid.programs import (
-    ProgramLoaderError,
-    ProgramSpec,
-    ProgramTypeError,
-    get_program_type_alias,
-    load_program,
-)
+from qbraid.programs import ProgramSpec, ProgramTypeError, get_program_type_alias
 from qbraid.transpiler import (
     ConversionGraph,
     ConversionPathNotFoundError,
@@ -36,6 +31,7 @@ from qbraid.transpiler import (
     transpile,
 )
 
+from .context import ProgramContext
 from .enums import DeviceStatus, ValidationLevel
 from .exceptions import ProgramValidationError, ResourceNotFoundError
 from .options import RuntimeOptions
@@ -215,11 +211,53 @@ class QuantumDevice(ABC):
 
         return metadata
 
+    def _validation_issues(self, context: ProgramContext) -> list[Union[str, ValueError]]:
+        """Return the qubit count and target spec violations of a single program."""
+        issues: list[Union[str, ValueError]] = []
+
+        if context.qbraid_program is None:
+            logger.info(
+                "Skipping qubit count validation: program type '%s' not supported natively.",
+                type(context.program).__name__,
+            )
+        elif self.num_qubits and context.num_qubits > self.num_qubits:
+            issues.append(
+                f"Number of qubits in the circuit ({context.num_qubits}) exceeds "
+                f"the device's capacity ({self.num_qubits})."
+            )
+
+        if self._target_spec is None:
+            return issues
+
+        target_spec = self._get_target_spec(context.program, alias=context.alias)
+
+        try:
+            target_spec.validate(context.program)
+        except ValueError as err:
+            issues.append(err)
+
+        return issues
+
     def validate(
-        self, run_input_batch: list[qbraid.programs.QPROGRAM], suppress_device_warning: bool = False
+        self,
+        run_input_batch: list[Union[qbraid.programs.QPROGRAM, ProgramContext]],
+        suppress_device_warning: bool = False,
+        max_workers: Optional[int] = 1,
     ) -> None:
         """Verifies run input compatibility with target device.
 
+        Each distinct program in the batch is validated once: strings are compared by
+        value and all other programs by identity. Programs are validated sequentially
+        unless ``max_workers`` opts into a thread pool. Errors and warnings are reported
+        in batch order.
+
+        Args:
+            run_input_batch: The programs to validate, or the contexts carrying them, whose
+                loaded programs and derived metrics are reused.
+            suppress_device_warning: If True, do not warn when the device is not online.
+            max_workers: Maximum number of validation threads. Defaults to 1, which validates
+                sequentially. None uses the ``ThreadPoolExecutor`` default.
+
         Raises:
             ProgramValidationError: If the run input is incompatible with the target device.
         """
@@ -235,37 +273,39 @@ class QuantumDevice(ABC):
                 UserWarning,
             )
 
-        for run_input in run_input_batch:
-            try:
-                program = load_program(run_input)
-            except ProgramLoaderError:
-                logger.info(
-                    "Skipping qubit count validation: program type '%s' not supported natively.",
-                    type(run_input).__name__,
+        contexts = [
+            item if isinstance(item, ProgramContext) else ProgramContext(item)
+            for item in run_input_batch
+        ]
+        keys = [
+            (
+                (type(context.program), context.program)
+                if isinstance(context.program, str)
+                else id(context.program)
+            )
+            for context in contexts
+        ]
+        unique_contexts = list(dict(zip(keys, contexts)).items())
+
+        if len(unique_contexts) > 1 and max_workers != 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = executor.map(
+                    self._validation_issues, [context for _, context in unique_contexts]
                 )
-            else:
-                if self.num_qubits and program.num_qubits > self.num_qubits:
-                    message = (
-                        f"Number of qubits in the circuit ({program.num_qubits}) exceeds "
-                        f"the device's capacity ({self.num_qubits})."
-                    )
-                    if level == ValidationLevel.RAISE:
-                        raise ProgramValidationError(message)
-                    if level == ValidationLevel.WARN:
-                        warnings.warn(message, UserWarning)
-
-            if self._target_spec is None:
-                continue
-
-            target_spec = self._get_target_spec(run_input)
+                issues_by_key = dict(zip((key for key, _ in unique_contexts), results))
+        else:
+            issues_by_key = {
+                key: self._validation_issues(context) for key, context in unique_contexts
+            }
 
-            try:
-                target_spec.validate(run_input)
-            except ValueError as err:
+        for key, _ in unique_contexts:
+            for issue in issues_by_key[key]:
                 if level == ValidationLevel.RAISE:
-                    raise ProgramValidationError from err
+                    if isinstance(issue, ValueError):
+                        raise ProgramValidationError from issue
+                    raise ProgramValidationError(issue)
                 if level == ValidationLevel.WARN:
-                    warnings.warn(str(err), UserWarning)
+                    warnings.warn(str(issue), UserWarning)
 
         return None
 
@@ -336,8 +376,10 @@ class QuantumDevice(ABC):
             f"The following errors occurred:\n{error_messages}"
         )
 
-    def _get_target_spec(self, run_input: qbraid.programs.QPROGRAM) -> ProgramSpec:
-        run_input_alias = get_program_type_alias(run_input, safe=True)
+    def _get_target_spec(
+        self, run_input: qbraid.programs.QPROGRAM, alias: Optional[str] = None
+    ) -> ProgramSpec:
+        run_input_alias = alias or get_program_type_alias(run_input, safe=True)
         target_specs = (
             self._target_spec
             if isinstance(self._target_spec, list)
@@ -378,20 +420,27 @@ class QuantumDevice(ABC):
         Returns:
             Transpiled and transformed quantum program
         """
+        context = ProgramContext(run_input)
         if self._target_spec is not None and self._options.get("transpile") is True:
-            run_input_alias = get_program_type_alias(run_input, safe=True)
-            run_input_spec = ProgramSpec(type(run_input), alias=run_input_alias)
-            run_input = self.transpile(run_input, run_input_spec)
+            run_input = self.transpile(run_input, context.spec)
 
         is_single_output = not isinstance(run_input, list)
         run_input = [run_input] if is_single_output else run_input
+        contexts = [
+            context if program is context.program else ProgramContext(program)
+            for program in cast(list, run_input)
+        ]
 
         if self._options.get("transform") is True:
-            run_input = [self.transform(p) for p in cast(list, run_input)]
+            transformed = [self.transform(context.program) for context in contexts]
+            contexts = [
+                context if program is context.program else ProgramContext(program)
+                for context, program in zip(contexts, transformed)
+            ]
 
-        self.validate(run_input)
+        self.validate(contexts)
 
-        run_input = [self.to_ir(p) for p in cast(list, run_input)]
+        run_input = [self.to_ir(context.program) for context in contexts]
 
         run_input = run_input[0] if is_single_output else run_input
         return run_input
@@ -0,0 +1,144 @@
+# Copyright (C) 2024 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Module providing an opt-in, process-wide pool of keep-alive HTTP connections
+shared by the sessions of runtime providers.
+
+"""
+from __future__ import annotations
+
+from typing import Optional, Union
+
+import requests
+from qbraid_core.retry import STATUS_FORCELIST, PostForcelistRetry
+from requests.adapters import HTTPAdapter
+
+_CONNECTION_POOL: Optional[ConnectionPool] = None
+
+
+class ConnectionPool:
+    """Pool of keep-alive HTTP connections and retry policy shared between sessions.
+
+    Sessions mounted on the same pool reuse its open connections to each host, so repeated
+    status and result requests made through different providers, devices and jobs do not
+    pay a new TCP and TLS handshake each time.
+
+    Args:
+        pool_connections (int): Number of hosts for which connections are kept. Defaults to 10.
+        pool_maxsize (int): Maximum number of connections kept per host. Defaults to 10.
+        pool_block (bool): Whether to wait for a free connection when ``pool_maxsize``
+            connections to a host are in use, instead of opening a new one. Defaults to False.
+        total (int): Number of total retries per request. Defaults to 2.
+        connect (int): Number of connection error retries per request. Defaults to 1.
+        backoff_factor (float): Backoff factor between retry attempts. Defaults to 0.5.
+        status_forcelist (Union[list[int], set[int], tuple[int, ...]]): Status codes
+            to retry on. Defaults to the 5xx codes retried by ``qbraid_core`` sessions.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        total: int = 2,
+        connect: int = 1,
+        backoff_factor: float = 0.5,
+        status_forcelist: Union[list[int], set[int], tuple[int, ...]] = STATUS_FORCELIST,
+    ):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        retry = PostForcelistRetry(
+            total=total,
+            connect=connect,
+            backoff_factor=backoff_factor,
+            status_forcelist=status_forcelist,
+            raise_on_status=False,
+        )
+        self.adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=retry,
+            pool_block=pool_block,
+        )
+
+    def mount(self, session: requests.Session) -> requests.Session:
+        """Route the HTTP and HTTPS requests of a session through the pool.
+
+        Args:
+            session (requests.Session): The session to mount, e.g. a provider session.
+
+        Returns:
+            requests.Session: The same session.
+        """
+        session.mount("http://", self.adapter)
+        session.mount("https://", self.adapter)
+        return session
+
+    def close(self) -> None:
+        """Close all idle connections of the pool."""
+        self.adapter.close()
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(pool_connections={self.pool_connections}, "
+            f"pool_maxsize={self.pool_maxsize})"
+        )
+
+
+def enable_connection_pool(**kwargs) -> ConnectionPool:
+    """
+    Enable a process-wide pool of keep-alive HTTP connections.
+
+    Once enabled, the sessions of providers created afterwards, such as
+    :class:`~qbraid.runtime.QbraidProvider` and :class:`~qbraid.runtime.IonQProvider`,
+    are mounted on the pool, unless a pool is passed to the provider explicitly.
+    Enabling again replaces the pool used by providers created afterwards.
+
+    Args:
+        **kwargs: Pool size and retry policy, see :class:`ConnectionPool`.
+
+    Returns:
+        ConnectionPool: The active connection pool.
+    """
+    global _CONNECTION_POOL  # pylint: disable=global-statement
+    _CONNECTION_POOL = ConnectionPool(**kwargs)
+    return _CONNECTION_POOL
+
+
+def disable_connection_pool() -> None:
+    """Disable the process-wide connection pool and close its idle connections."""
+    global _CONNECTION_POOL  # pylint: disable=global-statement
+    if _CONNECTION_POOL is not None:
+        _CONNECTION_POOL.close()
+    _CONNECTION_POOL = None
+
+
+def get_connection_pool() -> Optional[ConnectionPool]:
+    """Return the active connection pool, or None if connection pooling is disabled."""
+    return _CONNECTION_POOL
+
+
+def mount_connection_pool(
+    session: requests.Session, pool: Optional[ConnectionPool] = None
+) -> requests.Session:
+    """Mount a session on the given pool, or on the active process-wide pool if any.
+
+    Args:
+        session (requests.Session): The session to mount.
+        pool (ConnectionPool, optional): The pool to use. Defaults to the active pool.
+
+    Returns:
+        requests.Session: The same session.
+    """
+    pool = pool or _CONNECTION_POOL
+    if pool is not None:
+        pool.mount(session)
+    return session
@@ -20,6 +20,7 @@ from qiskit_ibm_runtime import QiskitRuntimeService
 from qiskit_ibm_runtime.exceptions import RuntimeInvalidStateError
 
 from qbraid._logging import logger
+from qbraid.runtime.cache import cached_result
 from qbraid.runtime.enums import JobStatus
 from qbraid.runtime.exceptions import JobStateError, QbraidRuntimeError
 from qbraid.runtime.job import QuantumJob
@@ -92,6 +93,7 @@ class QiskitJob(QuantumJob):
         """Returns the position of the job in the server queue."""
         return self._job.queue_position(refresh=True)
 
+    @cached_result
     def result(self):
         """Return the results of the job."""
         if not self.is_terminal_state():
@@ -18,6 +18,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Optional, Union
 
+from qbraid.runtime.cache import cached_result
 from qbraid.runtime.enums import JobStatus
 from qbraid.runtime.exceptions import QbraidRuntimeError
 from qbraid.runtime.job import QuantumJob
@@ -98,11 +99,15 @@ class IonQJob(QuantumJob):
 
         return convert_to_counts(probabilities)
 
+    @cached_result
     def result(self) -> Result:
         """Return the result of the IonQ job."""
         self.wait_for_final_state()
         job_data = self.session.get_job(self.id)
         success = job_data.get("status") == "completed"
+        self._cache_metadata.update(
+            {**job_data, "status": self._map_status(job_data.get("status"))}
+        )
         if not success:
             failure: dict = job_data.get("failure", {})
             code = failure.get("code")
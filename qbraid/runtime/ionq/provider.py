@@ -27,6 +27,7 @@ from qbraid.programs.gate_model.ionq import (
     IONQ_QIS_GATES,
 )
 from qbraid.runtime.exceptions import ResourceNotFoundError
+from qbraid.runtime.http_pool import ConnectionPool, mount_connection_pool
 from qbraid.runtime.noise import NoiseModelSet
 from qbraid.runtime.profile import TargetProfile
 from qbraid.runtime.provider import QuantumProvider
@@ -37,9 +38,17 @@ from .device import IonQDevice
 
 
 class IonQSession(Session):
-    """IonQ session class."""
+    """IonQ session class.
 
-    def __init__(self, api_key: Optional[str] = None):
+    Args:
+        api_key (str, optional): IonQ API key. Defaults to ``$IONQ_API_KEY``.
+        connection_pool (ConnectionPool, optional): Pool of HTTP connections to use.
+            Defaults to the process-wide pool, if enabled.
+    """
+
+    def __init__(
+        self, api_key: Optional[str] = None, connection_pool: Optional[ConnectionPool] = None
+    ):
         api_key = api_key or os.getenv("IONQ_API_KEY")
         if not api_key:
             raise ValueError(
@@ -55,6 +64,7 @@ class IonQSession(Session):
         )
         self.api_key = api_key
         self.add_user_agent(f"QbraidSDK/{qbraid_version}")
+        mount_connection_pool(self, connection_pool)
 
     def get_devices(self, **kwargs) -> dict[str, dict[str, Any]]:
         """Get all IonQ devices."""
@@ -86,8 +96,10 @@ class IonQSession(Session):
 class IonQProvider(QuantumProvider):
     """IonQ provider class."""
 
-    def __init__(self, api_key: Optional[str] = None):
-        self.session = IonQSession(api_key)
+    def __init__(
+        self, api_key: Optional[str] = None, connection_pool: Optional[ConnectionPool] = None
+    ):
+        self.session = IonQSession(api_key, connection_pool=connection_pool)
 
     def _get_characterization(self, data: dict[str, Any]) -> Optional[dict[str, Any]]:
         """Return the characterization of the IonQ device."""
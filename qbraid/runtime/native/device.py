@@ -24,7 +24,8 @@ from qbraid_core.services.quantum import QuantumClient, QuantumServiceRequestErr
 
 from qbraid._entrypoints import get_entrypoints
 from qbraid._logging import logger
-from qbraid.programs import ExperimentType, ProgramSpec, get_program_type_alias, load_program
+from qbraid.programs import ExperimentType, ProgramSpec
+from qbraid.runtime.context import ProgramContext
 from qbraid.runtime.device import QuantumDevice
 from qbraid.runtime.enums import DeviceStatus
 from qbraid.runtime.exceptions import QbraidRuntimeError
@@ -184,20 +185,27 @@ class QbraidDevice(QuantumDevice):
         return transpile(program, closest_qasm, conversion_graph=aux_graph)
 
     def _construct_aux_payload(
-        self, program: qbraid.programs.QPROGRAM, program_spec: Optional[ProgramSpec] = None
+        self,
+        program: qbraid.programs.QPROGRAM,
+        program_spec: Optional[ProgramSpec] = None,
+        context: Optional[ProgramContext] = None,
     ) -> dict[str, Union[int, str]]:
-        """Construct auxiliary payload for the job submission."""
+        """Construct auxiliary payload for the job submission.
+
+        Metrics are read from ``context`` when given, so that values already computed
+        by earlier stages, e.g. the qubit count computed during validation, are reused.
+        """
         aux_payload = {}
 
+        if context is None or context.program is not program:
+            context = ProgramContext(program)
+
         if program_spec is None:
-            program_alias = get_program_type_alias(program, safe=True)
-            program_spec = ProgramSpec(type(program), alias=program_alias)
+            program_spec = context.spec
 
         if program_spec.native is False:
             return aux_payload
 
-        qbraid_program = load_program(program)
-
         payload_key = {
             ExperimentType.GATE_MODEL: "circuitNumQubits",
             ExperimentType.ANNEALING: "numVariables",
@@ -205,7 +213,7 @@ class QbraidDevice(QuantumDevice):
         }
 
         num_required_qubits = self.try_extracting_info(
-            lambda program=qbraid_program: program.num_qubits,
+            lambda: context.num_qubits,
             "Error calculating circuit number of qubits.",
         )
 
@@ -217,12 +225,10 @@ class QbraidDevice(QuantumDevice):
             return aux_payload
 
         aux_payload["circuitDepth"] = self.try_extracting_info(
-            lambda program=qbraid_program: program.depth, "Error calculating circuit depth."
+            lambda: context.depth, "Error calculating circuit depth."
         )
         aux_payload["openQasm"] = self.try_extracting_info(
-            lambda program=program, program_spec=program_spec: self._extract_qasm_rep(
-                program, program_spec
-            ),
+            lambda: context.metric("qasm", lambda: self._extract_qasm_rep(program, program_spec)),
             "Error extracting OpenQASM string representation.",
         )
 
@@ -351,22 +357,33 @@ class QbraidDevice(QuantumDevice):
         )
         transpile_option = self._target_spec is not None and self._options.get("transpile") is True
 
-        for i, program in enumerate(run_input_list):
+        prepared_batches = []
+        for program in run_input_list:
             aux_payload = {}
             program_spec = None
+            context = ProgramContext(program)
             if transpile_option or not native_target:
-                program_alias = get_program_type_alias(program, safe=True)
-                program_spec = ProgramSpec(type(program), alias=program_alias)
+                program_spec = context.spec
             if not native_target:
-                aux_payload = self._construct_aux_payload(program, program_spec)
+                aux_payload = self._construct_aux_payload(program, program_spec, context)
             if transpile_option:
                 program = self.transpile(program, program_spec)
             is_batched_output = is_single_input and isinstance(program, list)
             program_batch = program if is_batched_output else [program]
-            self.validate(program_batch, suppress_device_warning=i != 0)
-            for program in program_batch:
+            contexts = [
+                context if item is context.program else ProgramContext(item)
+                for item in program_batch
+            ]
+            prepared_batches.append((aux_payload, program_spec, contexts))
+
+        # validate every program before submitting any, so a bad batch submits no jobs
+        self.validate([context for *_, contexts in prepared_batches for context in contexts])
+
+        for aux_payload, program_spec, contexts in prepared_batches:
+            for context in contexts:
+                program = context.program
                 if native_target:
-                    aux_payload = self._construct_aux_payload(program, program_spec)
+                    aux_payload = self._construct_aux_payload(program, program_spec, context)
                 run_input_json = self.to_ir(program)
                 self._validate_run_input_payload(run_input_json, self._target_spec)
                 runtime_payload = {**aux_payload, **run_input_json}
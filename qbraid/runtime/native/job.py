@@ -20,6 +20,7 @@ from qbraid_core.services.quantum import QuantumClient
 
 from qbraid._logging import logger
 from qbraid.programs import ExperimentType
+from qbraid.runtime.cache import cached_result
 from qbraid.runtime.enums import JobStatus
 from qbraid.runtime.exceptions import JobStateError, QbraidRuntimeError
 from qbraid.runtime.job import QuantumJob
@@ -132,6 +133,7 @@ class QbraidJob(QuantumJob):
 
         return result_data_cls
 
+    @cached_result
     def result(self) -> Result[ResultDataType]:
         """Return the results of the job."""
         self.wait_for_final_state()
@@ -29,6 +29,7 @@ from qbraid.programs.ahs import AHSEncoder
 from qbraid.programs.typer import Qasm2StringType, Qasm3StringType, QuboCoefficientsDict
 from qbraid.runtime._display import display_jobs_from_data
 from qbraid.runtime.exceptions import ResourceNotFoundError
+from qbraid.runtime.http_pool import ConnectionPool, get_connection_pool
 from qbraid.runtime.ionq.provider import IonQProvider
 from qbraid.runtime.noise import NoiseModelSet
 from qbraid.runtime.profile import TargetProfile
@@ -130,16 +131,28 @@ class QbraidProvider(QuantumProvider):
         client (qbraid_core.services.quantum.QuantumClient): qBraid QuantumClient object
     """
 
-    def __init__(self, api_key: Optional[str] = None, client: Optional[QuantumClient] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        client: Optional[QuantumClient] = None,
+        connection_pool: Optional[ConnectionPool] = None,
+    ):
         """
         Initializes the QbraidProvider object
 
+        Args:
+            api_key (str, optional): qBraid API key.
+            client (QuantumClient, optional): qBraid QuantumClient object.
+            connection_pool (ConnectionPool, optional): Pool of HTTP connections used by the
+                client session. Defaults to the process-wide pool, if enabled.
         """
         if api_key and client:
             raise ValueError("Provide either api_key or client, not both.")
 
         self._api_key = api_key
+        self._connection_pool = connection_pool
         self._client = client
+        self._client_pooled = False
 
     def save_config(self, **kwargs):
         """Save the current configuration."""
@@ -155,6 +168,11 @@ class QbraidProvider(QuantumProvider):
                 raise ResourceNotFoundError(
                     "Failed to authenticate with the Quantum service."
                 ) from err
+        if not self._client_pooled:
+            pool = self._connection_pool or get_connection_pool()
+            if pool is not None:
+                pool.mount(self._client.session)
+                self._client_pooled = True
         return self._client
 
     @staticmethod
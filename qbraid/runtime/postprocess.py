@@ -14,7 +14,9 @@ Module for post-processing of raw results data.
 """
 from __future__ import annotations
 
-from typing import Any, Union
+from typing import Any, Optional, Union
+
+import numpy as np
 
 
 def normalize_batch_bit_lengths(measurements: list[dict[str, int]]) -> list[dict[str, int]]:
@@ -226,3 +228,44 @@ def normalize_tuples(measurements: list[list[tuple[int, ...]]]) -> list[list[tup
         normalized_measurements.append(normalized_sublist)
 
     return normalized_measurements
+
+
+def ahs_state_counts(
+    success: np.ndarray, pre_sequences: np.ndarray, post_sequences: np.ndarray
+) -> Optional[dict[str, int]]:
+    """
+    Aggregate atom state counts from the shots of an analog Hamiltonian simulation.
+
+    Each site is decoded as empty ('e') if no atom was present before the evolution,
+    in the Rydberg state ('r') if the atom was lost by the final measurement, and in the
+    ground state ('g') otherwise. Every shot is mapped to the bytes of its state string,
+    so identical shots are merged with a single ``np.unique`` call over whole rows.
+
+    Args:
+        success (np.ndarray): Boolean array of shape ``(num_shots,)`` marking successful shots.
+        pre_sequences (np.ndarray): Array of shape ``(num_shots, num_sites)`` of atom
+            occupations before the evolution.
+        post_sequences (np.ndarray): Array of shape ``(num_shots, num_sites)`` of atom
+            occupations after the evolution.
+
+    Returns:
+        Optional[dict[str, int]]: A dictionary mapping each state configuration to the number
+            of successful shots in which it occurred, in order of first occurrence, or None
+            if there are no successful shots.
+    """
+    success = np.asarray(success, dtype=bool)
+    pre = np.asarray(pre_sequences)[success]
+    post = np.asarray(post_sequences)[success]
+    if len(pre) == 0:
+        return None
+
+    if pre.shape[1] == 0:
+        return {"": len(pre)}
+
+    state_idx = np.where(pre == 0, 0, np.where(post == 0, 1, 2))
+    states = np.frombuffer(b"erg", dtype=np.uint8)[state_idx]
+    rows = np.ascontiguousarray(states).view(f"S{states.shape[1]}").ravel()
+
+    keys, first, counts = np.unique(rows, return_index=True, return_counts=True)
+    order = np.argsort(first, kind="stable")
+    return {key.decode(): count for key, count in zip(keys[order].tolist(), counts[order].tolist())}
@@ -16,13 +16,13 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Optional, Type, TypeVar, Union, overload
+from typing import TYPE_CHECKING, Any, Optional, Sequence, Type, TypeVar, Union, overload
 
 import numpy as np
 
 from qbraid.programs import ExperimentType
 
-from .postprocess import counts_to_probabilities, normalize_counts
+from .postprocess import ahs_state_counts, counts_to_probabilities, normalize_counts
 from .schemas.experiment import (
     AhsExperimentMetadata,
     AnnealingExperimentMetadata,
@@ -30,6 +30,9 @@ from .schemas.experiment import (
     GateModelExperimentMetadata,
 )
 
+if TYPE_CHECKING:
+    from qbraid.programs.annealing import Problem, SparseProblem
+
 ResultDataType = TypeVar("ResultDataType", bound="ResultData")
 
 KeyType = TypeVar("KeyType", str, int)
@@ -291,6 +294,8 @@ class AhsResultData(ResultData):
     ):
         self._measurement_counts = measurement_counts
         self._measurements = measurements
+        self._shots: Optional[tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+        self._shot_counts: Optional[dict[str, int]] = None
 
     @property
     def experiment_type(self) -> ExperimentType:
@@ -300,11 +305,83 @@ class AhsResultData(ResultData):
     @property
     def measurements(self) -> Optional[list[AhsShotResult]]:
         """Returns the measurements data of the run."""
+        if self._measurements is None and self._shots is not None:
+            success, pre_sequences, post_sequences = self._shots
+            self._measurements = [
+                AhsShotResult(success=flag, pre_sequence=pre, post_sequence=post)
+                for flag, pre, post in zip(success.tolist(), pre_sequences, post_sequences)
+            ]
         return self._measurements
 
+    @classmethod
+    def from_arrays(
+        cls,
+        success: np.ndarray,
+        pre_sequences: np.ndarray,
+        post_sequences: np.ndarray,
+        measurement_counts: Optional[dict[str, int]] = None,
+    ) -> AhsResultData:
+        """Creates a new AhsResultData instance from shot arrays.
+
+        Args:
+            success: Boolean array of shape ``(num_shots,)`` marking successful shots.
+            pre_sequences: Array of shape ``(num_shots, num_sites)`` of atom occupations
+                before the evolution.
+            post_sequences: Array of shape ``(num_shots, num_sites)`` of atom occupations
+                after the evolution.
+            measurement_counts: The histogram data of the run, if already known.
+
+        Returns:
+            AhsResultData: The result data, with per-shot results built on first access.
+        """
+        data = cls(measurement_counts=measurement_counts)
+        data._shots = (
+            np.asarray(success, dtype=bool),
+            np.asarray(pre_sequences, dtype=np.int8),
+            np.asarray(post_sequences, dtype=np.int8),
+        )
+        return data
+
+    def get_shots(self) -> Optional[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Returns the shots of the run as arrays.
+
+        Returns:
+            Optional[tuple[np.ndarray, np.ndarray, np.ndarray]]: The boolean success flag of
+                each shot, and the int8 pre- and post-sequence matrices of shape
+                ``(num_shots, num_sites)``, or None if there are no measurements. Missing
+                sequences are filled with zeros.
+        """
+        if self._shots is None and self._measurements is not None:
+            shots = self._measurements
+            num_sites = next(
+                (len(shot.pre_sequence) for shot in shots if shot.pre_sequence is not None), 0
+            )
+            empty = np.zeros(num_sites, dtype=np.int8)
+            self._shots = (
+                np.fromiter((shot.success for shot in shots), dtype=bool, count=len(shots)),
+                np.array(
+                    [empty if shot.pre_sequence is None else shot.pre_sequence for shot in shots],
+                    dtype=np.int8,
+                ).reshape(len(shots), num_sites),
+                np.array(
+                    [empty if shot.post_sequence is None else shot.post_sequence for shot in shots],
+                    dtype=np.int8,
+                ).reshape(len(shots), num_sites),
+            )
+        return self._shots
+
     def get_counts(self) -> Optional[dict[str, int]]:
-        """Returns the histogram data of the run."""
-        return self._measurement_counts
+        """Returns the histogram data of the run.
+
+        If no histogram was given, it is computed from the shots.
+        """
+        if self._measurement_counts is not None:
+            return self._measurement_counts
+        if self._shot_counts is None:
+            shots = self.get_shots()
+            if shots is not None:
+                self._shot_counts = ahs_state_counts(*shots)
+        return self._shot_counts
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> AhsResultData:
@@ -326,7 +403,7 @@ class AhsResultData(ResultData):
         """Converts the AhsResultData instance to a dictionary."""
         return {
             "measurement_counts": self._measurement_counts,
-            "measurements": self._measurements,
+            "measurements": self.measurements,
         }
 
     def __eq__(self, other):
@@ -336,14 +413,15 @@ class AhsResultData(ResultData):
         if self._measurement_counts != other._measurement_counts:
             return False
 
-        if self._measurements is None and other._measurements is None:
+        measurements, other_measurements = self.measurements, other.measurements
+        if measurements is None and other_measurements is None:
             return True
-        if self._measurements is None or other._measurements is None:
+        if measurements is None or other_measurements is None:
             return False
-        if len(self._measurements) != len(other._measurements):
+        if len(measurements) != len(other_measurements):
             return False
 
-        return all(s1 == s2 for s1, s2 in zip(self._measurements, other._measurements))
+        return all(s1 == s2 for s1, s2 in zip(measurements, other_measurements))
 
 
 class AnnealingResultData(ResultData):
@@ -380,6 +458,86 @@ class AnnealingResultData(ResultData):
             self._num_solutions = len(self._solutions)
         return self._num_solutions
 
+    def get_samples(self, labels: Optional[Sequence[str]] = None) -> np.ndarray:
+        """Returns the spin assignments of the solutions as a samples matrix.
+
+        Args:
+            labels: Variable labels giving the column order. Defaults to the
+                labels of the first solution.
+
+        Returns:
+            np.ndarray: Array of shape ``(num_solutions, num_variables)``.
+        """
+        solutions = self._solutions or []
+        if labels is None:
+            labels = list(solutions[0]["spin"]) if solutions else []
+
+        samples = np.array(
+            [[solution["spin"][label] for label in labels] for solution in solutions]
+        )
+        return samples.reshape(len(solutions), len(labels))
+
+    @staticmethod
+    def _sparse_problem(problem: Union[Problem, SparseProblem]) -> SparseProblem:
+        """Returns the sparse form of an annealing problem."""
+        # pylint: disable-next=import-outside-toplevel
+        from qbraid.programs.annealing import SparseProblem
+
+        return (
+            problem if isinstance(problem, SparseProblem) else SparseProblem.from_problem(problem)
+        )
+
+    def energies(self, problem: Union[Problem, SparseProblem]) -> np.ndarray:
+        """Evaluates the energy of each solution for the given annealing problem.
+
+        Args:
+            problem: The problem the solutions are scored against.
+
+        Returns:
+            np.ndarray: The energy of each solution, in order.
+        """
+        sparse = self._sparse_problem(problem)
+        return sparse.energies(self.get_samples(sparse.labels))
+
+    def aggregate(self, labels: Optional[Sequence[str]] = None) -> tuple[np.ndarray, np.ndarray]:
+        """Merges identical solutions.
+
+        Args:
+            labels: Variable labels giving the column order. Defaults to the
+                labels of the first solution.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The distinct samples and the number
+                of occurrences of each.
+        """
+        samples = self.get_samples(labels)
+        if samples.size == 0:
+            return samples, np.zeros(0, dtype=np.intp)
+        return np.unique(samples, axis=0, return_counts=True)
+
+    def top_k(
+        self, problem: Union[Problem, SparseProblem], k: Optional[int] = None, unique: bool = True
+    ) -> list[dict[str, Any]]:
+        """Re-ranks the solutions by their energy for the given annealing problem.
+
+        Args:
+            problem: The problem the solutions are scored against.
+            k: Number of solutions to return. Defaults to all of them.
+            unique: If True, identical solutions are merged and counted.
+
+        Returns:
+            list[dict[str, Any]]: The ``k`` lowest-energy solutions, each with its
+                ``spin`` assignment, ``energy`` and ``num_occurrences``.
+        """
+        sparse = self._sparse_problem(problem)
+        samples, energies, counts = sparse.top_k(
+            self.get_samples(sparse.labels), k=k, unique=unique
+        )
+        return [
+            {"spin": dict(zip(sparse.labels, sample)), "energy": energy, "num_occurrences": count}
+            for sample, energy, count in zip(samples.tolist(), energies.tolist(), counts.tolist())
+        ]
+
     def to_dict(self) -> dict[str, Any]:
         """Converts the AnnealingResultData instance to a dictionary."""
         return {
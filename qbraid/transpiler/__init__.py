@@ -23,6 +23,8 @@ Classes
    Conversion
    ConversionGraph
    ConversionScheme
+   ConversionTemplate
+   TranspileCache
 
 Functions
 -----------
@@ -32,6 +34,10 @@ Functions
 
    transpile
    requires_extras
+   register_parameter_binder
+   enable_transpile_cache
+   disable_transpile_cache
+   get_transpile_cache
 
 Exceptions
 -----------
@@ -45,11 +51,18 @@ Exceptions
 
 """
 from .annotations import requires_extras
+from .cache import (
+    TranspileCache,
+    disable_transpile_cache,
+    enable_transpile_cache,
+    get_transpile_cache,
+)
 from .converter import transpile
 from .edge import Conversion
 from .exceptions import ConversionPathNotFoundError, NodeNotFoundError, ProgramConversionError
 from .graph import ConversionGraph
 from .scheme import ConversionScheme
+from .template import ConversionTemplate, register_parameter_binder
 
 __all__ = [
     "requires_extras",
@@ -57,6 +70,12 @@ __all__ = [
     "Conversion",
     "ConversionGraph",
     "ConversionScheme",
+    "ConversionTemplate",
+    "register_parameter_binder",
+    "TranspileCache",
+    "enable_transpile_cache",
+    "disable_transpile_cache",
+    "get_transpile_cache",
     "ProgramConversionError",
     "NodeNotFoundError",
     "ConversionPathNotFoundError",
@@ -0,0 +1,326 @@
+# Copyright (C) 2024 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Module providing an opt-in cache for the results of :func:`~qbraid.transpiler.transpile`,
+keyed by a content fingerprint of the input program.
+
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import re
+import threading
+from collections import OrderedDict
+from copy import deepcopy
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Optional, Union
+
+from qbraid._caching import DEFAULT_CACHE_MAX_BYTES, DiskCache
+from qbraid._logging import logger
+from qbraid._version import __version__
+from qbraid.programs.registry import QPROGRAM_ALIASES
+
+if TYPE_CHECKING:
+    import qbraid.programs
+    from qbraid.transpiler.graph import ConversionGraph
+
+DEFAULT_CACHE_MAXSIZE = 1024
+
+_QASM_COMMENT_PATTERN = re.compile(r"//[^\n]*|/\*.*?\*/", re.DOTALL)
+
+_TRANSPILE_CACHE: Optional[TranspileCache] = None
+
+
+class TranspileCacheInfo(NamedTuple):
+    """Hit and miss statistics of a :class:`TranspileCache`."""
+
+    hits: int
+    misses: int
+    disk_hits: int
+    maxsize: int
+    currsize: int
+
+
+def _normalize_qasm(qasm: str) -> str:
+    """Remove comments and collapse whitespace in an OpenQASM program."""
+    return " ".join(_QASM_COMMENT_PATTERN.sub(" ", qasm).split())
+
+
+def fingerprint_program(program: qbraid.programs.QPROGRAM) -> Optional[str]:
+    """Return a content fingerprint of a quantum program.
+
+    OpenQASM strings are fingerprinted by their text with comments and whitespace
+    normalized, dictionaries by their canonical JSON serialization, and all other
+    programs by their pickled bytes, together with the program type. Equal fingerprints
+    imply equal programs, while equal programs built in different ways may have different
+    fingerprints. The program text is not parsed.
+
+    Args:
+        program (qbraid.programs.QPROGRAM): The quantum program to fingerprint.
+
+    Returns:
+        Optional[str]: SHA-256 hex digest of the program, or None if the program
+            cannot be fingerprinted.
+    """
+    program_type = type(program)
+    try:
+        if isinstance(program, str):
+            content = _normalize_qasm(program).encode()
+        elif isinstance(program, dict):
+            content = json.dumps(program, sort_keys=True, separators=(",", ":")).encode()
+        else:
+            content = pickle.dumps(program, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as err:  # pylint: disable=broad-exception-caught
+        logger.debug("Cannot fingerprint program of type %s: %s", program_type, err)
+        return None
+
+    digest = hashlib.sha256(f"{program_type.__module__}.{program_type.__qualname__}".encode())
+    digest.update(b"\0")
+    digest.update(content)
+    return digest.hexdigest()
+
+
+def _function_name(func: Callable) -> str:
+    """Return a stable name for a conversion function."""
+    func = getattr(getattr(func, "__self__", None), "_conversion_func", func)
+    name = f"{getattr(func, '__module__', '')}.{getattr(func, '__qualname__', repr(func))}"
+    # Lambdas and nested functions cannot be told apart by name, so include their identity.
+    return f"{name}@{id(func)}" if "<" in name else name
+
+
+def graph_signature(graph: ConversionGraph) -> str:
+    """Return a digest of the conversions and edge weights that make up a conversion graph."""
+    edges = sorted(
+        (graph[source], graph[target], _function_name(data["func"]), repr(data["weight"]))
+        for source, target, data in graph.weighted_edge_list()
+    )
+    return hashlib.sha256(repr(edges).encode()).hexdigest()
+
+
+def conversion_graph_key(graph: ConversionGraph) -> str:
+    """Return the signature of a conversion graph, memoized until its nodes or edges change.
+
+    The memo is stored on the graph and holds its edge payloads, so an edge that is removed
+    and added again is recognized as a change.
+    """
+    edges = graph.edges()
+    memo = getattr(graph, "_transpile_cache_signature", None)
+    if (
+        memo is None
+        or memo[0] != graph.num_nodes()
+        or len(memo[1]) != len(edges)
+        or any(old is not new for old, new in zip(memo[1], edges))
+    ):
+        memo = (graph.num_nodes(), edges, graph_signature(graph))
+        graph._transpile_cache_signature = memo
+    return memo[2]
+
+
+def default_graph_key(**kwargs) -> Optional[str]:
+    """Return a digest identifying the default conversion graph built from the given keyword
+    arguments, without building it.
+
+    Returns:
+        Optional[str]: SHA-256 hex digest of the registered conversion functions and the
+            graph options, or None if the graph is built from explicit conversions.
+    """
+    if kwargs.get("conversions") is not None:
+        return None
+
+    conversions = import_module("qbraid.transpiler.conversions")
+    options = sorted(
+        (name, sorted(value) if isinstance(value, (set, list)) else value)
+        for name, value in kwargs.items()
+    )
+    parts = [repr(options)]
+    parts.extend(
+        f"{name}={_function_name(getattr(conversions, name))}"
+        for name in getattr(conversions, "conversion_functions", [])
+    )
+    if kwargs.get("include_isolated"):
+        parts.extend(sorted(QPROGRAM_ALIASES))
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+class TranspileCache:
+    """Least-recently-used cache of transpiled programs with an optional on-disk tier.
+
+    Entries are keyed by the fingerprint of the input program, the target alias, the
+    signature of the conversion graph, the path search options, and the qBraid version.
+    Programs are copied on the way in and out of the cache, so callers may freely modify
+    the programs they receive. When a directory is given, entries evicted from memory
+    remain available on disk, and disk hits are promoted back into memory.
+
+    Args:
+        maxsize (int): Maximum number of entries kept in memory. Defaults to 1024.
+        directory (str | Path, optional): Directory for the on-disk tier. If None,
+            entries are only kept in memory.
+        max_bytes (int): Maximum total size of the on-disk tier in bytes.
+            Defaults to 256 MiB.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_CACHE_MAXSIZE,
+        directory: Optional[Union[str, os.PathLike]] = None,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+    ):
+        if maxsize <= 0:
+            raise ValueError("Maximum cache size must be a positive number of entries.")
+
+        self._maxsize = maxsize
+        self._memory: OrderedDict[str, Any] = OrderedDict()
+        self._disk = DiskCache(directory, max_bytes=max_bytes) if directory else None
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._disk_hits = 0
+
+    @property
+    def disk(self) -> Optional[DiskCache]:
+        """Return the on-disk tier of the cache, if any."""
+        return self._disk
+
+    @staticmethod
+    def key(
+        program: qbraid.programs.QPROGRAM,
+        target: str,
+        graph_key: str,
+        max_path_attempts: int,
+        max_path_depth: Optional[int],
+    ) -> Optional[str]:
+        """Return the key under which a transpiled program is stored, or None if the
+        program cannot be fingerprinted.
+
+        The conversion graph is identified by ``graph_key``, as returned by
+        :func:`conversion_graph_key` or :func:`default_graph_key`.
+        """
+        fingerprint = fingerprint_program(program)
+        if fingerprint is None:
+            return None
+        key_str = ":".join(
+            [
+                __version__,
+                fingerprint,
+                target,
+                graph_key,
+                str(max_path_attempts),
+                str(max_path_depth),
+            ]
+        )
+        return hashlib.sha256(key_str.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[qbraid.programs.QPROGRAM]:
+        """Return a copy of the cached program for the given key, or None on a miss."""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self._hits += 1
+                return deepcopy(self._memory[key])
+
+        program = self._disk.get(key) if self._disk is not None else None
+
+        with self._lock:
+            if program is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._disk_hits += 1
+            self._store(key, program)
+        return deepcopy(program)
+
+    def put(self, key: str, program: qbraid.programs.QPROGRAM) -> None:
+        """Store a copy of a transpiled program under the given key."""
+        program = deepcopy(program)
+        with self._lock:
+            self._store(key, program)
+
+        if self._disk is not None:
+            try:
+                self._disk.put(key, program)
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                logger.warning("Failed to write transpile cache entry to disk: %s", err)
+
+    def _store(self, key: str, program: qbraid.programs.QPROGRAM) -> None:
+        """Insert an entry in memory, evicting the least-recently-used entries if full."""
+        self._memory[key] = program
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._maxsize:
+            self._memory.popitem(last=False)
+
+    def cache_info(self) -> TranspileCacheInfo:
+        """Return the hit and miss statistics and the current size of the in-memory tier."""
+        with self._lock:
+            return TranspileCacheInfo(
+                self._hits, self._misses, self._disk_hits, self._maxsize, len(self._memory)
+            )
+
+    def clear(self) -> None:
+        """Remove all entries, including those on disk, and reset the statistics."""
+        with self._lock:
+            self._memory.clear()
+            self._hits = self._misses = self._disk_hits = 0
+        if self._disk is not None:
+            self._disk.clear()
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def __repr__(self) -> str:
+        directory = None if self._disk is None else str(self._disk.directory)
+        return f"TranspileCache(maxsize={self._maxsize}, directory={directory!r})"
+
+
+def enable_transpile_cache(
+    maxsize: int = DEFAULT_CACHE_MAXSIZE,
+    directory: Optional[Union[str, os.PathLike]] = None,
+    max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+) -> TranspileCache:
+    """
+    Enable caching of the programs returned by :func:`~qbraid.transpiler.transpile`.
+
+    Once enabled, transpiling a program that is identical to one transpiled before, to the
+    same target and over an equivalent conversion graph, returns a copy of the earlier
+    result instead of converting the program again.
+
+    Note:
+        Cache entries are pickles, and loading a pickle can run arbitrary code. Only use a
+        directory that no other user can write to. Entries are ignored unless both the
+        directory and the entry are owned by the current user and not writable by group
+        or others.
+
+    Args:
+        maxsize (int): Maximum number of entries kept in memory. Defaults to 1024.
+        directory (str | Path, optional): Directory for the on-disk tier. If None,
+            entries are only kept in memory.
+        max_bytes (int): Maximum total size of the on-disk tier in bytes.
+            Defaults to 256 MiB.
+
+    Returns:
+        TranspileCache: The active transpile cache.
+    """
+    global _TRANSPILE_CACHE  # pylint: disable=global-statement
+    _TRANSPILE_CACHE = TranspileCache(maxsize=maxsize, directory=directory, max_bytes=max_bytes)
+    return _TRANSPILE_CACHE
+
+
+def disable_transpile_cache() -> None:
+    """Disable the transpile cache. Existing on-disk entries are left in place."""
+    global _TRANSPILE_CACHE  # pylint: disable=global-statement
+    _TRANSPILE_CACHE = None
+
+
+def get_transpile_cache() -> Optional[TranspileCache]:
+    """Return the active transpile cache, or None if transpile caching is disabled."""
+    return _TRANSPILE_CACHE
@@ -19,7 +19,7 @@ Module for converting Braket circuits to Cirq circuits
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 import numpy as np
 from braket.circuits import Circuit as BKCircuit
@@ -88,14 +88,52 @@ def braket_to_cirq(circuit: BKCircuit) -> cirq_circuits.Circuit:
     bk_qubits = [int(q) for q in circuit.qubits]
     cirq_qubits = [cirq.LineQubit(x) for x in bk_qubits]
     qubit_mapping = {q: cirq_qubits[i] for i, q in enumerate(bk_qubits)}
+    matrix_gates: dict[tuple, cirq_ops.Gate] = {}
     circuit = cirq.Circuit(
-        _from_braket_instruction(instr, qubit_mapping) for instr in circuit.instructions
+        _from_braket_instruction(instr, qubit_mapping, matrix_gates)
+        for instr in circuit.instructions
     )
     return QbraidCircuit.align_final_measurements(circuit)
 
 
+def _lookup(table: dict[type, Callable], gate: Any) -> Optional[Callable]:
+    """Return the handler registered for the most specific class of ``gate``, if any."""
+    for cls in type(gate).__mro__:
+        handler = table.get(cls)
+        if handler is not None:
+            return handler
+    return None
+
+
+def _matrix_gate(
+    gate: braket_gates.Gate,
+    matrix_gates: Optional[dict[tuple, cirq_ops.Gate]],
+    named: bool = False,
+) -> cirq_ops.Gate:
+    """Returns a Cirq matrix gate for a Braket gate, reusing the gate built for an
+    identical matrix earlier in the same conversion.
+
+    Args:
+        gate: Braket gate to convert.
+        matrix_gates: Optional memo of Cirq gates keyed by Braket gate matrix.
+        named: If True, label the gate "U" in Cirq circuit diagrams.
+    """
+    matrix = np.asarray(gate.to_matrix())
+    key = (named, matrix.shape, matrix.dtype.str, matrix.tobytes())
+    if matrix_gates is not None and key in matrix_gates:
+        return matrix_gates[key]
+
+    matrix = braket_gate_to_matrix(gate)
+    cirq_gate = matrix_to_cirq_gate(matrix) if named else cirq.ops.MatrixGate(matrix)
+    if matrix_gates is not None:
+        matrix_gates[key] = cirq_gate
+    return cirq_gate
+
+
 def _from_braket_instruction(
-    instr: BKInstruction, qubit_mapping: dict[int, cirq_devices.LineQubit]
+    instr: BKInstruction,
+    qubit_mapping: dict[int, cirq_devices.LineQubit],
+    matrix_gates: Optional[dict[tuple, cirq_ops.Gate]] = None,
 ) -> list[cirq_ops.Operation]:
     """Converts the braket instruction to an equivalent Cirq operation or list
     of Cirq operations.
@@ -103,6 +141,7 @@ def _from_braket_instruction(
     Args:
         instr: Braket instruction to convert.
         qubit_mapping: Braket qubit indicies mapped to indexed Cirq LineQubits
+        matrix_gates: Optional memo of Cirq gates built from Braket gate matrices.
 
     Raises:
         ValueError: If the instruction cannot be converted to Cirq.
@@ -117,10 +156,10 @@ def _from_braket_instruction(
 
     try:
         if nqubits == 1:
-            return _from_one_qubit_braket_instruction(instr, qubits)
+            return _from_one_qubit_braket_instruction(instr, qubits, matrix_gates)
 
         if nqubits == 2:
-            return _from_two_qubit_braket_instruction(instr, qubits)
+            return _from_two_qubit_braket_instruction(instr, qubits, matrix_gates)
 
         if nqubits == 3:
             if isinstance(instr.operator, braket_gates.CCNot):
@@ -128,8 +167,7 @@ def _from_braket_instruction(
             if isinstance(instr.operator, braket_gates.CSwap):
                 return [cirq.ops.FREDKIN.on(*qubits)]
             try:
-                matrix = braket_gate_to_matrix(instr.operator)
-                return [cirq.ops.MatrixGate(matrix).on(*qubits)]
+                return [_matrix_gate(instr.operator, matrix_gates).on(*qubits)]
             except (ValueError, TypeError) as err:
                 raise ProgramConversionError(
                     f"Unable to convert the instruction {instr} to Cirq."
@@ -147,172 +185,178 @@ def _from_braket_instruction(
         ) from err
 
 
+def _ionq_gpi_to_cirq(gate: braket_gates.Gate, qubits: list) -> list[cirq_ops.Operation]:
+    phi = gate.angle / (2 * np.pi)
+    gate_class = (
+        cirq_ionq_ops.GPIGate if isinstance(gate, braket_gates.GPi) else cirq_ionq_ops.GPI2Gate
+    )
+    return [gate_class(phi=phi).on(*qubits)]
+
+
+_ONE_QUBIT_GATES: dict[type, Callable[[Any, list], list]] = {
+    # One-qubit non-parameterized gates.
+    braket_gates.I: lambda gate, qubits: [cirq.ops.I.on(*qubits)],
+    braket_gates.X: lambda gate, qubits: [cirq.ops.X.on(*qubits)],
+    braket_gates.Y: lambda gate, qubits: [cirq.ops.Y.on(*qubits)],
+    braket_gates.Z: lambda gate, qubits: [cirq.ops.Z.on(*qubits)],
+    braket_gates.H: lambda gate, qubits: [cirq.ops.H.on(*qubits)],
+    braket_gates.S: lambda gate, qubits: [cirq.ops.S.on(*qubits)],
+    braket_gates.Si: lambda gate, qubits: [cirq.protocols.inverse(cirq.ops.S.on(*qubits))],
+    braket_gates.T: lambda gate, qubits: [cirq.ops.T.on(*qubits)],
+    braket_gates.Ti: lambda gate, qubits: [cirq.protocols.inverse(cirq.ops.T.on(*qubits))],
+    braket_gates.V: lambda gate, qubits: [cirq.ops.X.on(*qubits) ** 0.5],
+    braket_gates.Vi: lambda gate, qubits: [cirq.ops.X.on(*qubits) ** -0.5],
+    # One-qubit parameterized gates.
+    braket_gates.Rx: lambda gate, qubits: [cirq.ops.rx(gate.angle).on(*qubits)],
+    braket_gates.Ry: lambda gate, qubits: [cirq.ops.ry(gate.angle).on(*qubits)],
+    braket_gates.Rz: lambda gate, qubits: [cirq.ops.rz(gate.angle).on(*qubits)],
+    braket_gates.PhaseShift: lambda gate, qubits: [cirq.ops.Z.on(*qubits) ** (gate.angle / np.pi)],
+    # One-qubit noise gates.
+    braket_noise_gate.BitFlip: lambda gate, qubits: [
+        cirq.ops.BitFlipChannel(gate.probability).on(*qubits)
+    ],
+    braket_noise_gate.PhaseFlip: lambda gate, qubits: [
+        cirq.ops.PhaseFlipChannel(gate.probability).on(*qubits)
+    ],
+    braket_noise_gate.Depolarizing: lambda gate, qubits: [
+        cirq.ops.DepolarizingChannel(gate.probability).on(*qubits)
+    ],
+    braket_noise_gate.AmplitudeDamping: lambda gate, qubits: [
+        cirq.ops.AmplitudeDampingChannel(gate.gamma).on(*qubits)
+    ],
+    braket_noise_gate.GeneralizedAmplitudeDamping: lambda gate, qubits: [
+        cirq.ops.GeneralizedAmplitudeDampingChannel(gate.probability, gate.gamma).on(*qubits)
+    ],
+    braket_noise_gate.PhaseDamping: lambda gate, qubits: [
+        cirq.ops.PhaseDampingChannel(gate.gamma).on(*qubits)
+    ],
+}
+
+# One-qubit parameterized IonQ gates
+if cirq_ionq_ops:
+    _ONE_QUBIT_GATES[braket_gates.GPi] = _ionq_gpi_to_cirq
+    _ONE_QUBIT_GATES[braket_gates.GPi2] = _ionq_gpi_to_cirq
+
+
 def _from_one_qubit_braket_instruction(
-    instr: BKInstruction, qubits: list[cirq_devices.LineQubit]
+    instr: BKInstruction,
+    qubits: list[cirq_devices.LineQubit],
+    matrix_gates: Optional[dict[tuple, cirq_ops.Gate]] = None,
 ) -> list[cirq_ops.Operation]:
     """Converts the one-qubit Braket instruction to Cirq operation(s).
 
     Args:
         instr: One-qubit Braket instruction to convert.
         qubits: Cirq LineQubit list indexed according to Braket instruction
+        matrix_gates: Optional memo of Cirq gates built from Braket gate matrices.
 
     Raises:
         ValueError: If the instruction cannot be converted to Cirq.
     """
     gate = instr.operator
 
-    # One-qubit non-parameterized gates.
-    if isinstance(gate, braket_gates.I):
-        return [cirq.ops.I.on(*qubits)]
-    if isinstance(gate, braket_gates.X):
-        return [cirq.ops.X.on(*qubits)]
-    if isinstance(gate, braket_gates.Y):
-        return [cirq.ops.Y.on(*qubits)]
-    if isinstance(gate, braket_gates.Z):
-        return [cirq.ops.Z.on(*qubits)]
-    if isinstance(gate, braket_gates.H):
-        return [cirq.ops.H.on(*qubits)]
-    if isinstance(gate, braket_gates.S):
-        return [cirq.ops.S.on(*qubits)]
-    if isinstance(gate, braket_gates.Si):
-        return [cirq.protocols.inverse(cirq.ops.S.on(*qubits))]
-    if isinstance(gate, braket_gates.T):
-        return [cirq.ops.T.on(*qubits)]
-    if isinstance(gate, braket_gates.Ti):
-        return [cirq.protocols.inverse(cirq.ops.T.on(*qubits))]
-    if isinstance(gate, braket_gates.V):
-        return [cirq.ops.X.on(*qubits) ** 0.5]
-    if isinstance(gate, braket_gates.Vi):
-        return [cirq.ops.X.on(*qubits) ** -0.5]
-
-    # One-qubit parameterized gates.
-    if isinstance(gate, braket_gates.Rx):
-        return [cirq.ops.rx(gate.angle).on(*qubits)]
-    if isinstance(gate, braket_gates.Ry):
-        return [cirq.ops.ry(gate.angle).on(*qubits)]
-    if isinstance(gate, braket_gates.Rz):
-        return [cirq.ops.rz(gate.angle).on(*qubits)]
-    if isinstance(gate, braket_gates.PhaseShift):
-        return [cirq.ops.Z.on(*qubits) ** (gate.angle / np.pi)]
-
-    # One-qubit parameterized IonQ gates
-    if cirq_ionq_ops and isinstance(gate, (braket_gates.GPi, braket_gates.GPi2)):
-        phi = gate.angle / (2 * np.pi)
-        gate_class = (
-            cirq_ionq_ops.GPIGate if isinstance(gate, braket_gates.GPi) else cirq_ionq_ops.GPI2Gate
-        )
-        return [gate_class(phi=phi).on(*qubits)]
-
-    # One-qubit Noise gates.
-    if isinstance(gate, braket_noise_gate.BitFlip):
-        return [cirq.ops.BitFlipChannel(gate.probability).on(*qubits)]
-    if isinstance(gate, braket_noise_gate.PhaseFlip):
-        return [cirq.ops.PhaseFlipChannel(gate.probability).on(*qubits)]
-    if isinstance(gate, braket_noise_gate.Depolarizing):
-        return [cirq.ops.DepolarizingChannel(gate.probability).on(*qubits)]
-    if isinstance(gate, braket_noise_gate.AmplitudeDamping):
-        return [cirq.ops.AmplitudeDampingChannel(gate.gamma).on(*qubits)]
-    if isinstance(gate, braket_noise_gate.GeneralizedAmplitudeDamping):
-        return [
-            cirq.ops.GeneralizedAmplitudeDampingChannel(gate.probability, gate.gamma).on(*qubits)
-        ]
-    if isinstance(gate, braket_noise_gate.PhaseDamping):
-        return [cirq.ops.PhaseDampingChannel(gate.gamma).on(*qubits)]
+    handler = _lookup(_ONE_QUBIT_GATES, gate)
+    if handler is not None:
+        return handler(gate, qubits)
 
     try:
-        matrix = braket_gate_to_matrix(gate)
-        return [cirq.ops.MatrixGate(matrix).on(*qubits)]
+        return [_matrix_gate(gate, matrix_gates).on(*qubits)]
     except (ValueError, TypeError) as err:
         raise ValueError(f"Unable to convert the instruction {instr} to Cirq.") from err
 
 
+def _controlled_phase_to_cirq(
+    gate: braket_gates.Gate, qubits: list, flipped: tuple[int, ...]
+) -> list[cirq_ops.Operation]:
+    """Returns a controlled phase conjugated by X gates on the given qubit positions."""
+    flips = [cirq.ops.X(qubits[i]) for i in flipped]
+    return [*flips, cirq.ops.CZ.on(*qubits) ** (gate.angle / np.pi), *flips]
+
+
+def _ms_to_cirq(gate: braket_gates.MS, qubits: list) -> list[cirq_ops.Operation]:
+    return [
+        cirq_ionq_ops.MSGate(
+            phi0=gate.angle_1 / (2 * np.pi),
+            phi1=gate.angle_2 / (2 * np.pi),
+            theta=gate.angle_3 / (2 * np.pi),
+        ).on(*qubits)
+    ]
+
+
+_TWO_QUBIT_GATES: dict[type, Callable[[Any, list], list]] = {
+    # Two-qubit non-parameterized gates.
+    braket_gates.CNot: lambda gate, qubits: [cirq.ops.CNOT.on(*qubits)],
+    braket_gates.Swap: lambda gate, qubits: [cirq.ops.SWAP.on(*qubits)],
+    braket_gates.ISwap: lambda gate, qubits: [cirq.ops.ISWAP.on(*qubits)],
+    braket_gates.CZ: lambda gate, qubits: [cirq.ops.CZ.on(*qubits)],
+    braket_gates.CY: lambda gate, qubits: [
+        cirq.protocols.inverse(cirq.ops.S.on(qubits[1])),
+        cirq.ops.CNOT.on(*qubits),
+        cirq.ops.S.on(qubits[1]),
+    ],
+    # Two-qubit parameterized gates.
+    braket_gates.CPhaseShift: lambda gate, qubits: _controlled_phase_to_cirq(gate, qubits, ()),
+    braket_gates.CPhaseShift01: lambda gate, qubits: _controlled_phase_to_cirq(gate, qubits, (0,)),
+    braket_gates.CPhaseShift10: lambda gate, qubits: _controlled_phase_to_cirq(gate, qubits, (1,)),
+    braket_gates.CPhaseShift00: lambda gate, qubits: [
+        cirq.ops.XX(*qubits),
+        cirq.ops.CZ.on(*qubits) ** (gate.angle / np.pi),
+        cirq.ops.XX(*qubits),
+    ],
+    braket_gates.PSwap: lambda gate, qubits: [
+        cirq.ops.SWAP.on(*qubits),
+        cirq.ops.CNOT.on(*qubits),
+        cirq.ops.Z.on(qubits[1]) ** (gate.angle / np.pi),
+        cirq.ops.CNOT.on(*qubits),
+    ],
+    braket_gates.XX: lambda gate, qubits: [
+        cirq.ops.XXPowGate(exponent=gate.angle / np.pi, global_shift=-0.5).on(*qubits)
+    ],
+    braket_gates.YY: lambda gate, qubits: [
+        cirq.ops.YYPowGate(exponent=gate.angle / np.pi, global_shift=-0.5).on(*qubits)
+    ],
+    braket_gates.ZZ: lambda gate, qubits: [
+        cirq.ops.ZZPowGate(exponent=gate.angle / np.pi, global_shift=-0.5).on(*qubits)
+    ],
+    braket_gates.XY: lambda gate, qubits: [
+        cirq.ops.ISwapPowGate(exponent=gate.angle / np.pi).on(*qubits)
+    ],
+    # Two-qubit noise gates.
+    braket_noise_gate.Kraus: lambda gate, qubits: [
+        cirq.ops.KrausChannel(gate._matrices).on(*qubits)
+    ],
+    braket_noise_gate.TwoQubitDepolarizing: lambda gate, qubits: [
+        cirq.ops.DepolarizingChannel(gate.probability, n_qubits=2).on(*qubits)
+    ],
+}
+
+# Two-qubit two-parameters IonQ gates.
+if cirq_ionq_ops:
+    _TWO_QUBIT_GATES[braket_gates.MS] = _ms_to_cirq
+
+
 def _from_two_qubit_braket_instruction(
-    instr: BKInstruction, qubits: list[cirq_devices.LineQubit]
+    instr: BKInstruction,
+    qubits: list[cirq_devices.LineQubit],
+    matrix_gates: Optional[dict[tuple, cirq_ops.Gate]] = None,
 ) -> list[cirq_ops.Operation]:
     """Converts the two-qubit braket instruction to Cirq.
 
     Args:
         instr: Two-qubit Braket instruction to convert.
         qubits: Cirq LineQubit list indexed according to Braket instruction
+        matrix_gates: Optional memo of Cirq gates built from Braket gate matrices.
 
     Raises:
         ValueError: If the instruction cannot be converted to Cirq.
     """
     gate = instr.operator
 
-    # Two-qubit non-parameterized gates.
-    if isinstance(gate, braket_gates.CNot):
-        return [cirq.ops.CNOT.on(*qubits)]
-
-    if isinstance(gate, braket_gates.Swap):
-        return [cirq.ops.SWAP.on(*qubits)]
-    if isinstance(gate, braket_gates.ISwap):
-        return [cirq.ops.ISWAP.on(*qubits)]
-    if isinstance(gate, braket_gates.CZ):
-        return [cirq.ops.CZ.on(*qubits)]
-    if isinstance(gate, braket_gates.CY):
-        return [
-            cirq.protocols.inverse(cirq.ops.S.on(qubits[1])),
-            cirq.ops.CNOT.on(*qubits),
-            cirq.ops.S.on(qubits[1]),
-        ]
-
-    # Two-qubit parameterized gates.
-    if isinstance(gate, braket_gates.CPhaseShift):
-        return [cirq.ops.CZ.on(*qubits) ** (gate.angle / np.pi)]
-    if isinstance(gate, braket_gates.CPhaseShift00):
-        return [
-            cirq.ops.XX(*qubits),
-            cirq.ops.CZ.on(*qubits) ** (gate.angle / np.pi),
-            cirq.ops.XX(*qubits),
-        ]
-    if isinstance(gate, braket_gates.CPhaseShift01):
-        return [
-            cirq.ops.X(qubits[0]),
-            cirq.ops.CZ.on(*qubits) ** (gate.angle / np.pi),
-            cirq.ops.X(qubits[0]),
-        ]
-    if isinstance(gate, braket_gates.CPhaseShift10):
-        return [
-            cirq.ops.X(qubits[1]),
-            cirq.ops.CZ.on(*qubits) ** (gate.angle / np.pi),
-            cirq.ops.X(qubits[1]),
-        ]
-    if isinstance(gate, braket_gates.PSwap):
-        return [
-            cirq.ops.SWAP.on(*qubits),
-            cirq.ops.CNOT.on(*qubits),
-            cirq.ops.Z.on(qubits[1]) ** (gate.angle / np.pi),
-            cirq.ops.CNOT.on(*qubits),
-        ]
-    if isinstance(gate, braket_gates.XX):
-        return [cirq.ops.XXPowGate(exponent=gate.angle / np.pi, global_shift=-0.5).on(*qubits)]
-    if isinstance(gate, braket_gates.YY):
-        return [cirq.ops.YYPowGate(exponent=gate.angle / np.pi, global_shift=-0.5).on(*qubits)]
-    if isinstance(gate, braket_gates.ZZ):
-        return [cirq.ops.ZZPowGate(exponent=gate.angle / np.pi, global_shift=-0.5).on(*qubits)]
-    if isinstance(gate, braket_gates.XY):
-        return [cirq.ops.ISwapPowGate(exponent=gate.angle / np.pi).on(*qubits)]
-
-    # Two-qubit noise gates.
-    if isinstance(gate, braket_noise_gate.Kraus):
-        return [cirq.ops.KrausChannel(gate._matrices).on(*qubits)]
-    if isinstance(gate, braket_noise_gate.TwoQubitDepolarizing):
-        return [cirq.ops.DepolarizingChannel(gate.probability, n_qubits=2).on(*qubits)]
-
-    # Two-qubit two-parameters IonQ gates.
-    if cirq_ionq_ops and isinstance(gate, braket_gates.MS):
-        return [
-            cirq_ionq_ops.MSGate(
-                phi0=gate.angle_1 / (2 * np.pi),
-                phi1=gate.angle_2 / (2 * np.pi),
-                theta=gate.angle_3 / (2 * np.pi),
-            ).on(*qubits)
-        ]
+    handler = _lookup(_TWO_QUBIT_GATES, gate)
+    if handler is not None:
+        return handler(gate, qubits)
 
     try:
-        matrix = braket_gate_to_matrix(gate)
-        unitary_gate = matrix_to_cirq_gate(matrix)
-        return [unitary_gate.on(*qubits)]
+        return [_matrix_gate(gate, matrix_gates, named=True).on(*qubits)]
     except (ValueError, TypeError) as err:
         raise ValueError(f"Unable to convert the instruction {instr} to Cirq.") from err
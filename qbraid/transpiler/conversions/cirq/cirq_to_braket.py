@@ -20,7 +20,7 @@ Module for converting Braket circuits to Cirq circuits
 from __future__ import annotations
 
 from copy import deepcopy
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
 
 import numpy as np
 
@@ -58,10 +58,17 @@ if TYPE_CHECKING:
     import braket.circuits
 
 
+_Template = list[tuple[Any, tuple[int, ...]]]
+"""Braket operators of a translated gate, each with the indices of the gate qubits it acts on."""
+
+
 @weight(0.85)
 def cirq_to_braket(circuit: Circuit) -> braket.circuits.Circuit:
     """Returns a Braket circuit equivalent to the input Cirq circuit.
 
+    Each distinct gate value is translated once per conversion, and its Braket operators
+    are reused for every further operation with an equal gate.
+
     Args:
         circuit: Cirq circuit to convert to a Braket circuit.
 
@@ -74,20 +81,33 @@ def cirq_to_braket(circuit: Circuit) -> braket.circuits.Circuit:
     ]
     braket_int_qubits = deepcopy(cirq_int_qubits)
     qubit_mapping = {q: braket_int_qubits[i] for i, q in enumerate(cirq_int_qubits)}
+    templates: dict[cirq_ops.Gate, _Template] = {}
     return BKCircuit(
-        _to_braket_instruction(operation, qubit_mapping) for operation in circuit.all_operations()
+        _to_braket_instruction(operation, qubit_mapping, templates)
+        for operation in circuit.all_operations()
     )
 
 
+def _lookup(table: dict[type, Callable], gate: Any) -> Optional[Callable]:
+    """Return the handler registered for the most specific class of ``gate``, if any."""
+    for cls in type(gate).__mro__:
+        handler = table.get(cls)
+        if handler is not None:
+            return handler
+    return None
+
+
 def _to_braket_instruction(
     operation: cirq_ops.Operation,
     qubit_mapping: dict[int, int],
+    templates: Optional[dict[cirq_ops.Gate, _Template]] = None,
 ) -> list[braket.circuits.Instruction]:
     """Converts Cirq operation to equivalent Braket instruction(s).
 
     Args:
         operation: Cirq operation to convert.
         qubit_mapping: Mappings of input / output qubit indicies
+        templates: Optional memo of Braket operators already computed for each gate value.
 
     Raises:
         ProgramConversionError: If the operation cannot be converted to Braket.
@@ -97,45 +117,147 @@ def _to_braket_instruction(
     ) and qbraid.programs.gate_model.cirq.CirqCircuit.is_measurement_gate(operation):
         return []
 
-    nqubits = protocols.num_qubits(operation)
-    cirq_qubits = operation.qubits
     cirq_qubits = [
         qbraid.programs.gate_model.cirq.CirqCircuit._int_from_qubit(q) for q in operation.qubits
     ]
     qubits = [qubit_mapping[x] for x in cirq_qubits]
+    gate = operation.gate
+
+    if gate is None or templates is None:
+        template = _braket_template(operation if gate is None else gate, len(qubits))
+    else:
+        try:
+            template = templates.get(gate)
+        except TypeError:  # unhashable gate
+            template = _braket_template(gate, len(qubits))
+        else:
+            if template is None:
+                template = templates[gate] = _braket_template(gate, len(qubits))
+
+    return [BKInstruction(operator, [qubits[i] for i in indices]) for operator, indices in template]
 
+
+def _braket_template(gate: Union[cirq_ops.Gate, cirq_ops.Operation], nqubits: int) -> _Template:
+    """Returns the Braket operators equivalent to a Cirq gate acting on ``nqubits`` qubits.
+
+    Raises:
+        ProgramConversionError: If the gate cannot be converted to Braket.
+    """
     if nqubits == 1:
-        target = qubits[0]
-        return _to_one_qubit_braket_instruction(operation, target)
+        return [(_one_qubit_braket_operator(gate), (0,))]
 
     if nqubits == 2:
-        return _to_two_qubit_braket_instruction(operation, qubits)
+        return _two_qubit_braket_template(gate)
 
     if nqubits == 3:
-        if operation == cirq_ops.TOFFOLI.on(*operation.qubits):
-            return [BKInstruction(braket_gates.CCNot(), qubits)]
-        if operation == cirq_ops.FREDKIN.on(*operation.qubits):
-            return [BKInstruction(braket_gates.CSwap(), qubits)]
-        if isinstance(operation.gate, cirq_ops.ControlledGate):
-            sub_gate_instr = _to_two_qubit_braket_instruction(operation.gate.sub_gate, qubits[1:])
-            sub_gate = sub_gate_instr[0].operator
-            # return [BKInstruction(sub_gate, target=qubits[1:], control=qubits[:1])]
-            return [BKInstruction(BKControl(sub_gate, qubits), qubits)]
+        if gate == cirq_ops.TOFFOLI:
+            return [(braket_gates.CCNot(), (0, 1, 2))]
+        if gate == cirq_ops.FREDKIN:
+            return [(braket_gates.CSwap(), (0, 1, 2))]
+        if isinstance(gate, cirq_ops.ControlledGate):
+            sub_gate = _two_qubit_braket_template(gate.sub_gate)[0][0]
+            return [(BKControl(sub_gate, [0, 1, 2]), (0, 1, 2))]
 
         try:
-            matrix = protocols.unitary(operation)
-            name = str(operation.gate)
-            return [
-                BKInstruction(
-                    braket_gates.Unitary(matrix, display_name=name),
-                    qubits,
-                )
-            ]
+            matrix = protocols.unitary(gate)
+            return [(braket_gates.Unitary(matrix, display_name=str(gate)), (0, 1, 2))]
         except (ValueError, TypeError) as err:
-            raise ProgramConversionError(f"Unable to convert {operation} to Braket") from err
+            raise ProgramConversionError(f"Unable to convert {gate} to Braket") from err
 
     # Unsupported gates.
-    raise ProgramConversionError(f"Unable to convert {operation} to Braket")
+    raise ProgramConversionError(f"Unable to convert {gate} to Braket")
+
+
+def _x_pow_to_braket(gate: cirq_ops.XPowGate) -> braket.circuits.Gate:
+    exponent = gate.exponent
+    if np.isclose(exponent, 1.0) or np.isclose(exponent, -1.0):
+        return braket_gates.X()
+    if np.isclose(exponent, 0.5):
+        return braket_gates.V()
+    if np.isclose(exponent, -0.5):
+        return braket_gates.Vi()
+    return braket_gates.Rx(exponent * np.pi)
+
+
+def _y_pow_to_braket(gate: cirq_ops.YPowGate) -> braket.circuits.Gate:
+    exponent = gate.exponent
+    if np.isclose(exponent, 1.0) or np.isclose(exponent, -1.0):
+        return braket_gates.Y()
+    return braket_gates.Ry(exponent * np.pi)
+
+
+def _z_pow_to_braket(gate: cirq_ops.ZPowGate) -> Optional[braket.circuits.Gate]:
+    global_shift = gate.global_shift
+    exponent = gate.exponent
+
+    if np.isclose(global_shift, 0.0):
+        if np.isclose(exponent, 1.0) or np.isclose(exponent, -1.0):
+            return braket_gates.Z()
+        if np.isclose(exponent, 0.5):
+            return braket_gates.S()
+        if np.isclose(exponent, -0.5):
+            return braket_gates.Si()
+        if np.isclose(exponent, 0.25):
+            return braket_gates.T()
+        if np.isclose(exponent, -0.25):
+            return braket_gates.Ti()
+        return braket_gates.PhaseShift(exponent * np.pi)
+    if np.isclose(global_shift, -0.5):
+        return braket_gates.Rz(exponent * np.pi)
+    return None
+
+
+def _h_pow_to_braket(gate: cirq_ops.HPowGate) -> Optional[braket.circuits.Gate]:
+    return braket_gates.H() if np.isclose(abs(gate.exponent), 1.0) else None
+
+
+_ONE_QUBIT_GATES: dict[type, Callable[[Any], Any]] = {
+    cirq_ops.XPowGate: _x_pow_to_braket,
+    cirq_ops.YPowGate: _y_pow_to_braket,
+    cirq_ops.ZPowGate: _z_pow_to_braket,
+    cirq_ops.HPowGate: _h_pow_to_braket,
+    cirq_ops.IdentityGate: lambda gate: braket_gates.I(),
+    cirq_ops.BitFlipChannel: lambda gate: braket_noise_gate.BitFlip(gate._p),
+    cirq_ops.PhaseFlipChannel: lambda gate: braket_noise_gate.PhaseFlip(gate._p),
+    cirq_ops.DepolarizingChannel: lambda gate: braket_noise_gate.Depolarizing(gate._p),
+    cirq_ops.AmplitudeDampingChannel: lambda gate: braket_noise_gate.AmplitudeDamping(gate._gamma),
+    cirq_ops.GeneralizedAmplitudeDampingChannel: (
+        lambda gate: braket_noise_gate.GeneralizedAmplitudeDamping(
+            gamma=gate._gamma, probability=gate._p
+        )
+    ),
+    cirq_ops.PhaseDampingChannel: lambda gate: braket_noise_gate.PhaseDamping(gate._gamma),
+}
+
+if cirq_ionq_ops:
+    _ONE_QUBIT_GATES[cirq_ionq_ops.GPIGate] = lambda gate: braket_gates.GPi(
+        angle=gate.phi * 2 * np.pi
+    )
+    _ONE_QUBIT_GATES[cirq_ionq_ops.GPI2Gate] = lambda gate: braket_gates.GPi2(
+        angle=gate.phi * 2 * np.pi
+    )
+
+
+def _matrix_to_braket_unitary(
+    matrix: np.ndarray, name: Optional[str] = None
+) -> braket.circuits.gates.Unitary:
+    """Returns a Braket unitary gate for a one-qubit matrix."""
+    display_name = "U" if name is None or "QasmUGate" in name else name
+    return braket_gates.Unitary(matrix, display_name=display_name)
+
+
+def _one_qubit_braket_operator(
+    gate: Union[cirq_ops.Gate, cirq_ops.Operation]
+) -> braket.circuits.Gate:
+    """Returns the Braket operator equivalent to a one-qubit Cirq gate."""
+    handler = _lookup(_ONE_QUBIT_GATES, gate)
+    operator = handler(gate) if handler is not None else None
+    if operator is not None:
+        return operator
+
+    matrix = protocols.unitary(gate)
+    gate_name = "U" if isinstance(gate, cirq_ops.MatrixGate) else str(gate)
+    return _matrix_to_braket_unitary(matrix, gate_name)
 
 
 def _to_one_qubit_braket_instruction(
@@ -154,101 +276,8 @@ def _to_one_qubit_braket_instruction(
     Raises:
         ValueError: If the operation cannot be converted to Braket.
     """
-
-    def instruction_from_matrix(matrix, target, name):
-        display_name = "U" if name is None or "QasmUGate" in name else name
-        return [BKInstruction(braket_gates.Unitary(matrix, display_name=display_name), target)]
-
-    def convert_one_qubit_gate(gate, target):
-        if isinstance(gate, cirq_ops.XPowGate):
-            exponent = gate.exponent
-            if np.isclose(exponent, 1.0) or np.isclose(exponent, -1.0):
-                return [BKInstruction(braket_gates.X(), target)]
-            if np.isclose(exponent, 0.5):
-                return [BKInstruction(braket_gates.V(), target)]
-            if np.isclose(exponent, -0.5):
-                return [BKInstruction(braket_gates.Vi(), target)]
-
-            return [BKInstruction(braket_gates.Rx(exponent * np.pi), target)]
-
-        if isinstance(gate, cirq_ops.YPowGate):
-            exponent = gate.exponent
-
-            if np.isclose(exponent, 1.0) or np.isclose(exponent, -1.0):
-                return [BKInstruction(braket_gates.Y(), target)]
-
-            return [BKInstruction(braket_gates.Ry(exponent * np.pi), target)]
-
-        if isinstance(gate, cirq_ops.ZPowGate):
-            global_shift = gate.global_shift
-            exponent = gate.exponent
-
-            if np.isclose(global_shift, 0.0):
-                if np.isclose(exponent, 1.0) or np.isclose(exponent, -1.0):
-                    return [BKInstruction(braket_gates.Z(), target)]
-                if np.isclose(exponent, 0.5):
-                    return [BKInstruction(braket_gates.S(), target)]
-                if np.isclose(exponent, -0.5):
-                    return [BKInstruction(braket_gates.Si(), target)]
-                if np.isclose(exponent, 0.25):
-                    return [BKInstruction(braket_gates.T(), target)]
-                if np.isclose(exponent, -0.25):
-                    return [BKInstruction(braket_gates.Ti(), target)]
-                return [BKInstruction(braket_gates.PhaseShift(exponent * np.pi), target)]
-            if np.isclose(global_shift, -0.5):
-                return [BKInstruction(braket_gates.Rz(exponent * np.pi), target)]
-
-        if isinstance(gate, cirq_ops.HPowGate) and np.isclose(abs(gate.exponent), 1.0):
-            return [BKInstruction(braket_gates.H(), target)]
-
-        if isinstance(gate, cirq_ops.IdentityGate):
-            return [BKInstruction(braket_gates.I(), target)]
-
-        if isinstance(gate, cirq_ops.BitFlipChannel):
-            return [BKInstruction(braket_noise_gate.BitFlip(operation.gate._p), target)]
-
-        if isinstance(gate, cirq_ops.PhaseFlipChannel):
-            return [BKInstruction(braket_noise_gate.PhaseFlip(operation.gate._p), target)]
-
-        if isinstance(gate, cirq_ops.DepolarizingChannel):
-            return [BKInstruction(braket_noise_gate.Depolarizing(operation.gate._p), target)]
-
-        if isinstance(gate, cirq_ops.AmplitudeDampingChannel):
-            return [
-                BKInstruction(braket_noise_gate.AmplitudeDamping(operation.gate._gamma), target)
-            ]
-
-        if isinstance(gate, cirq_ops.GeneralizedAmplitudeDampingChannel):
-            return [
-                BKInstruction(
-                    braket_noise_gate.GeneralizedAmplitudeDamping(
-                        gamma=operation.gate._gamma, probability=operation.gate._p
-                    ),
-                    target,
-                )
-            ]
-
-        if isinstance(gate, cirq_ops.PhaseDampingChannel):
-            return [BKInstruction(braket_noise_gate.PhaseDamping(operation.gate._gamma), target)]
-
-        if cirq_ionq_ops and isinstance(
-            gate, (cirq_ionq_ops.GPIGate, cirq_ionq_ops.GPI2Gate, cirq_ionq_ops.MSGate)
-        ):
-            if isinstance(gate, cirq_ionq_ops.GPIGate):
-                return [
-                    BKInstruction(braket_gates.GPi(angle=operation.gate.phi * 2 * np.pi), target)
-                ]
-            if isinstance(gate, cirq_ionq_ops.GPI2Gate):
-                return [
-                    BKInstruction(braket_gates.GPi2(angle=operation.gate.phi * 2 * np.pi), target)
-                ]
-
-        matrix = protocols.unitary(gate)
-        gate_name = "U" if isinstance(gate, cirq_ops.MatrixGate) else str(gate)
-        return _to_one_qubit_braket_instruction(matrix, target, gate_name=gate_name)
-
     if isinstance(operation, np.ndarray):
-        return instruction_from_matrix(operation, target, gate_name)
+        return [BKInstruction(_matrix_to_braket_unitary(operation, gate_name), target)]
 
     if isinstance(operation, cirq_ops.Operation):
         gate = operation.gate
@@ -257,7 +286,69 @@ def _to_one_qubit_braket_instruction(
     else:
         raise ValueError(f"Unable to convert {operation} to braket")
 
-    return convert_one_qubit_gate(gate, target)
+    return [BKInstruction(_one_qubit_braket_operator(gate), target)]
+
+
+def _controlled_to_braket(gate: cirq_ops.ControlledGate) -> _Template:
+    sub_gate = _one_qubit_braket_operator(gate.sub_gate)
+    return [(BKControl(sub_gate, [0, 1]), (0, 1))]
+
+
+def _ms_to_braket(gate: Any) -> _Template:
+    operator = braket_gates.MS(
+        angle_1=gate.phi0 * 2 * np.pi,
+        angle_2=gate.phi1 * 2 * np.pi,
+        angle_3=gate.theta * 2 * np.pi,
+    )
+    return [(operator, (0, 1))]
+
+
+def _cnot_pow_to_braket(gate: cirq_ops.CNotPowGate) -> Optional[_Template]:
+    return [(braket_gates.CNot(), (0, 1))] if np.isclose(abs(gate.exponent), 1.0) else None
+
+
+def _cz_pow_to_braket(gate: cirq_ops.CZPowGate) -> Optional[_Template]:
+    return [(braket_gates.CZ(), (0, 1))] if np.isclose(abs(gate.exponent), 1.0) else None
+
+
+def _swap_pow_to_braket(gate: cirq_ops.SwapPowGate) -> Optional[_Template]:
+    return [(braket_gates.Swap(), (0, 1))] if np.isclose(gate.exponent, 1.0) else None
+
+
+def _iswap_pow_to_braket(gate: cirq_ops.ISwapPowGate) -> Optional[_Template]:
+    return [(braket_gates.ISwap(), (0, 1))] if np.isclose(gate.exponent, 1.0) else None
+
+
+_TWO_QUBIT_GATES: dict[type, Callable[[Any], Optional[_Template]]] = {
+    cirq_ops.CNotPowGate: _cnot_pow_to_braket,
+    cirq_ops.CZPowGate: _cz_pow_to_braket,
+    cirq_ops.SwapPowGate: _swap_pow_to_braket,
+    cirq_ops.ISwapPowGate: _iswap_pow_to_braket,
+    cirq_ops.XXPowGate: lambda gate: [(braket_gates.XX(gate.exponent * np.pi), (0, 1))],
+    cirq_ops.YYPowGate: lambda gate: [(braket_gates.YY(gate.exponent * np.pi), (0, 1))],
+    cirq_ops.ZZPowGate: lambda gate: [(braket_gates.ZZ(gate.exponent * np.pi), (0, 1))],
+    cirq_ops.ControlledGate: _controlled_to_braket,
+    cirq_ops.DepolarizingChannel: lambda gate: [
+        (braket_noise_gate.TwoQubitDepolarizing(gate.p), (0, 1))
+    ],
+    cirq_ops.KrausChannel: lambda gate: [
+        (braket_noise_gate.Kraus(matrices=gate._kraus_ops), (0, 1))
+    ],
+}
+
+if cirq_ionq_ops:
+    _TWO_QUBIT_GATES[cirq_ionq_ops.MSGate] = _ms_to_braket
+
+
+def _two_qubit_braket_template(gate: Union[cirq_ops.Gate, cirq_ops.Operation]) -> _Template:
+    """Returns the Braket operators equivalent to a two-qubit Cirq gate."""
+    handler = _lookup(_TWO_QUBIT_GATES, gate)
+    template = handler(gate) if handler is not None else None
+    if template is not None:
+        return template
+
+    # Fallback: arbitrary two-qubit unitary (KAK) decomposition
+    return _kak_decomposition_template(protocols.unitary(gate))
 
 
 def _to_two_qubit_braket_instruction(
@@ -282,48 +373,38 @@ def _to_two_qubit_braket_instruction(
     else:
         raise ValueError(f"Unable to convert {operation} to Braket")
 
-    # Translate qubit indices.
-    q1, q2 = qubits
-
-    # Check common two-qubit gates.
-    if isinstance(gate, cirq_ops.CNotPowGate) and np.isclose(abs(gate.exponent), 1.0):
-        return [BKInstruction(braket_gates.CNot(), [q1, q2])]
-    if isinstance(gate, cirq_ops.CZPowGate) and np.isclose(abs(gate.exponent), 1.0):
-        return [BKInstruction(braket_gates.CZ(), [q1, q2])]
-    if isinstance(gate, cirq_ops.SwapPowGate) and np.isclose(gate.exponent, 1.0):
-        return [BKInstruction(braket_gates.Swap(), [q1, q2])]
-    if isinstance(gate, cirq_ops.ISwapPowGate) and np.isclose(gate.exponent, 1.0):
-        return [BKInstruction(braket_gates.ISwap(), [q1, q2])]
-    if isinstance(gate, cirq_ops.XXPowGate):
-        return [BKInstruction(braket_gates.XX(gate.exponent * np.pi), [q1, q2])]
-    if isinstance(gate, cirq_ops.YYPowGate):
-        return [BKInstruction(braket_gates.YY(gate.exponent * np.pi), [q1, q2])]
-    if isinstance(gate, cirq_ops.ZZPowGate):
-        return [BKInstruction(braket_gates.ZZ(gate.exponent * np.pi), [q1, q2])]
-    if isinstance(gate, cirq_ops.ControlledGate):
-        sub_gate_instr = _to_one_qubit_braket_instruction(gate.sub_gate, q2)
-        sub_gate = sub_gate_instr[0].operator
-        # return [BKInstruction(sub_gate, target=q2, control=q1)]
-        return [BKInstruction(BKControl(sub_gate, [0, 1]), [q1, q2])]
-    if isinstance(gate, cirq_ops.DepolarizingChannel):
-        return BKInstruction(braket_noise_gate.TwoQubitDepolarizing(operation.gate.p), [q1, q2])
-    if isinstance(gate, cirq_ops.KrausChannel):
-        return BKInstruction(braket_noise_gate.Kraus(matrices=operation.gate._kraus_ops), [q1, q2])
-    if isinstance(gate, cirq_ionq_ops.MSGate):
-        return [
-            BKInstruction(
-                braket_gates.MS(
-                    angle_1=operation.gate.phi0 * 2 * np.pi,
-                    angle_2=operation.gate.phi1 * 2 * np.pi,
-                    angle_3=operation.gate.theta * 2 * np.pi,
-                ),
-                [q1, q2],
-            )
-        ]
+    return [
+        BKInstruction(operator, [qubits[i] for i in indices])
+        for operator, indices in _two_qubit_braket_template(gate)
+    ]
 
-    # Fallback: arbitrary two-qubit unitary (KAK) decomposition
-    unitary = protocols.unitary(operation)
-    return _kak_decomposition_to_braket_instruction(unitary, q1, q2)
+
+def _kak_decomposition_template(matrix: np.ndarray) -> _Template:
+    """Returns the Braket operators of the KAK decomposition of a 4x4 unitary."""
+    kak = kak_decomposition(matrix)
+    A1, A2 = kak.single_qubit_operations_before
+
+    x, y, z = kak.interaction_coefficients
+    a = x * -2 / np.pi + 0.5
+    b = y * -2 / np.pi + 0.5
+    c = z * -2 / np.pi + 0.5
+
+    B1, B2 = kak.single_qubit_operations_after
+
+    return [
+        (_matrix_to_braket_unitary(A1), (0,)),
+        (_matrix_to_braket_unitary(A2), (1,)),
+        (braket_gates.Rx(0.5 * np.pi), (0,)),
+        (braket_gates.CNot(), (0, 1)),
+        (braket_gates.Rx(a * np.pi), (0,)),
+        (braket_gates.Ry(b * np.pi), (1,)),
+        (braket_gates.CNot(), (1, 0)),
+        (braket_gates.Rx(-0.5 * np.pi), (1,)),
+        (braket_gates.Rz(c * np.pi), (1,)),
+        (braket_gates.CNot(), (0, 1)),
+        (_matrix_to_braket_unitary(B1), (0,)),
+        (_matrix_to_braket_unitary(B2), (1,)),
+    ]
 
 
 def _kak_decomposition_to_braket_instruction(
@@ -336,27 +417,8 @@ def _kak_decomposition_to_braket_instruction(
         q1: Index of first qubit to act on
         q2: Index of second qubit to act on
     """
-    kak = kak_decomposition(matrix)
-    A1, A2 = kak.single_qubit_operations_before
-
-    x, y, z = kak.interaction_coefficients
-    a = x * -2 / np.pi + 0.5
-    b = y * -2 / np.pi + 0.5
-    c = z * -2 / np.pi + 0.5
-
-    B1, B2 = kak.single_qubit_operations_after
-
+    qubits = (q1, q2)
     return [
-        *_to_one_qubit_braket_instruction(A1, q1),
-        *_to_one_qubit_braket_instruction(A2, q2),
-        BKInstruction(braket_gates.Rx(0.5 * np.pi), q1),
-        BKInstruction(braket_gates.CNot(), [q1, q2]),
-        BKInstruction(braket_gates.Rx(a * np.pi), q1),
-        BKInstruction(braket_gates.Ry(b * np.pi), q2),
-        BKInstruction(braket_gates.CNot(), [q2, q1]),
-        BKInstruction(braket_gates.Rx(-0.5 * np.pi), q2),
-        BKInstruction(braket_gates.Rz(c * np.pi), q2),
-        BKInstruction(braket_gates.CNot(), [q1, q2]),
-        *_to_one_qubit_braket_instruction(B1, q1),
-        *_to_one_qubit_braket_instruction(B2, q2),
+        BKInstruction(operator, [qubits[i] for i in indices])
+        for operator, indices in _kak_decomposition_template(matrix)
     ]
@@ -15,13 +15,12 @@ Module containing OpenQASM to IonQ JSON conversion function
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING, Any, Union
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 import openqasm3.ast
 
-from qbraid.passes.qasm.analyze import has_measurements
-from qbraid.passes.qasm.compat import convert_qasm_pi_to_decimal
-from qbraid.programs import load_program
+from qbraid.passes.qasm.analyze import expression_value_option, has_measurements
+from qbraid.passes.qasm.expressions import fold_expression
 from qbraid.programs.gate_model.ionq import IonQProgram
 from qbraid.programs.gate_model.qasm2 import OpenQasm2Program
 from qbraid.programs.gate_model.qasm3 import OpenQasm3Program
@@ -88,7 +87,7 @@ def extract_params(statement: openqasm3.ast.QuantumGate) -> list[str]:
 
 
 def _parse_float_in_range(
-    value: str, gate_name: str, param_name: str, bounds: tuple[float, float]
+    value: Union[float, str], gate_name: str, param_name: str, bounds: tuple[float, float]
 ) -> float:
 
     min_val, max_val = bounds
@@ -109,76 +108,113 @@ def _parse_float_in_range(
     return value
 
 
-def _parse_phase(phase: str, gate_name: str) -> float:
+def _parse_phase(phase: Union[float, str], gate_name: str) -> float:
     return _parse_float_in_range(phase, gate_name, "phase", (-1, 1))
 
 
-def _parse_angle(angle: str, gate_name: str) -> float:
+def _parse_angle(angle: Union[float, str], gate_name: str) -> float:
     return _parse_float_in_range(angle, gate_name, "angle", (0, 0.25))
 
 
-# pylint: disable-next=too-many-statements
-def _parse_gates(program: Union[OpenQasm2Program, OpenQasm3Program]) -> list[dict[str, Any]]:
-    program_qubits = program.qubits
+def _gate_params(statement: openqasm3.ast.QuantumGate) -> list[Union[float, str]]:
+    """Return the values of the parameters of a gate, evaluated numerically where possible.
 
-    program: openqasm3.ast.Program = program.parsed()
+    Parameters that are not constant expressions are returned as OpenQASM text, so that
+    they are reported in error messages.
+    """
+    params = []
+    for argument in statement.arguments:
+        value = fold_expression(argument)
+        params.append(openqasm3.dumps(argument) if value is None else float(value))
+    return params
+
+
+def _parse_rotation(rotation: Union[float, str], gate_name: str) -> float:
+    if isinstance(rotation, str):
+        raise ValueError(
+            f"Invalid rotation value '{rotation}' for the '{gate_name}' gate. "
+            "Rotation must be a constant expression."
+        )
+    return rotation
+
+
+def _gate_qubits(
+    statement: openqasm3.ast.QuantumGate, registers: dict[str, Optional[int]]
+) -> list[int]:
+    """Return the qubit indices that a gate acts on, expanding whole-register operands."""
+    qubits = statement.qubits
+    if len(qubits) == 1 and isinstance(qubits[0], openqasm3.ast.Identifier):
+        if qubits[0].name not in registers:
+            return []
+        return list(range(registers[qubits[0].name] or 1))
+
+    qubit_values = []
+    for qubit in qubits:
+        for index in qubit.indices:
+            for expression in index:
+                value = fold_expression(expression)
+                if not isinstance(value, int):
+                    raise ValueError(
+                        f"Qubit index '{openqasm3.dumps(expression)}' must be a constant integer."
+                    )
+                qubit_values.append(value)
+    return qubit_values
+
+
+# pylint: disable-next=too-many-statements,too-many-branches
+def _parse_gates(
+    program: Union[OpenQasm2Program, OpenQasm3Program, openqasm3.ast.Program]
+) -> list[dict[str, Any]]:
+    """Return the IonQ gate list of an OpenQASM program in a single pass over its syntax tree.
+
+    Args:
+        program: The OpenQASM program, as a program wrapper or a parsed syntax tree.
 
+    Returns:
+        list[dict[str, Any]]: The IonQ JSON representation of each gate.
+
+    Raises:
+        ValueError: If the program contains a gate that is not supported by IonQ,
+            or a gate with missing or invalid parameters.
+    """
+    if not isinstance(program, openqasm3.ast.Program):
+        program = program.parsed()
+
+    registers: dict[str, Optional[int]] = {}
     gates: list[dict[str, Any]] = []
 
     for statement in program.statements:
-        if isinstance(statement, openqasm3.ast.QuantumGate):
+        if isinstance(statement, openqasm3.ast.QubitDeclaration):
+            registers[statement.qubit.name] = expression_value_option(statement.size)
+
+        elif isinstance(statement, openqasm3.ast.QuantumGate):
             name = statement.name.name.lower()
-            qubits = statement.qubits
-            qubit_values = []
-
-            if len(qubits) == 1 and isinstance(qubits[0], openqasm3.ast.Identifier):
-                reg_name = qubits[0].name
-                for qreg_name, qubit_id in program_qubits:
-                    if qreg_name == reg_name:
-                        qubit_values.append(qubit_id)
-            else:
-                for qubit in qubits:
-                    indices = qubit.indices
-                    for index in indices:
-                        qubit_values.extend(literal.value for literal in index)
+            qubit_values = _gate_qubits(statement, registers)
 
             if name in IONQ_ONE_QUBIT_GATE_MAP:
                 ionq_name = IONQ_ONE_QUBIT_GATE_MAP[name]
                 if ionq_name in ["rx", "ry", "rz"]:
                     try:
-                        angle: str = extract_params(statement)[0]
+                        angle = _gate_params(statement)[0]
                     except IndexError as err:
                         raise ValueError(
                             f"Angle parameter is required for the '{ionq_name}' "
                             "gate but was not provided."
                         ) from err
-                    angle_decimal = float(convert_qasm_pi_to_decimal(angle))
+                    angle = _parse_rotation(angle, ionq_name)
                     for qubit in qubit_values:
-                        gates.append(
-                            {
-                                "gate": ionq_name,
-                                "target": qubit,
-                                "rotation": angle_decimal,
-                            }
-                        )
+                        gates.append({"gate": ionq_name, "target": qubit, "rotation": angle})
                 elif ionq_name in ["gpi", "gpi2"]:
                     try:
-                        phase: str = extract_params(statement)[0]
+                        phase = _gate_params(statement)[0]
                     except IndexError as err:
                         raise ValueError(
                             f"Phase parameter is required for the '{ionq_name}' "
                             "gate but was not provided."
                         ) from err
                     phase = _parse_phase(phase, ionq_name)
-
                     for qubit in qubit_values:
-                        gates.append(
-                            {
-                                "gate": ionq_name,
-                                "target": qubit,
-                                "phase": phase,
-                            }
-                        )
+                        gates.append({"gate": ionq_name, "target": qubit, "phase": phase})
                 else:
                     for qubit in qubit_values:
                         gates.append({"gate": ionq_name, "target": qubit})
@@ -191,33 +227,24 @@ def _parse_gates(program: Union[OpenQasm2Program, OpenQasm3Program]) -> list[dic
 
                 elif ionq_name == "zz":
                     try:
-                        angle = extract_params(statement)[0]
+                        angle = _gate_params(statement)[0]
                     except IndexError as err:
                         raise ValueError(
                             f"Angle parameter is required for the '{ionq_name}' "
                             "gate but was not provided."
                         ) from err
                     angle = _parse_angle(angle, ionq_name)
-                    gates.append(
-                        {
-                            "gate": ionq_name,
-                            "angle": angle,
-                            "targets": qubit_values,
-                        }
-                    )
+                    gates.append({"gate": ionq_name, "angle": angle, "targets": qubit_values})
 
                 elif ionq_name == "ms":
-                    params = extract_params(statement)
+                    params = _gate_params(statement)
                     if len(params) not in {2, 3}:
                         raise ValueError(
                             f"Invalid number of parameters for the '{ionq_name}' gate. "
                             f"Expected 2 or 3, got {len(params)}"
                         )
 
-                    phases = [
-                        _parse_phase(param, ionq_name) if i < 2 else _parse_phase(param, ionq_name)
-                        for i, param in enumerate(params[:2])
-                    ]
+                    phases = [_parse_phase(param, ionq_name) for param in params[:2]]
                     angle = _parse_angle(params[2], ionq_name) if len(params) == 3 else None
 
                     gate_data = {
@@ -262,10 +289,10 @@ def openqasm3_to_ionq(qasm: Union[QasmStringType, openqasm3.ast.Program]) -> Ion
     Returns:
         dict: IonQ JSON format equivalent to input OpenQASM string.
     """
-    if has_measurements(qasm):
-        raise ValueError("Circuits with measurements are not supported by the IonQDictType")
+    program = openqasm3.parse(qasm) if isinstance(qasm, str) else qasm
 
-    program: Union[OpenQasm2Program, OpenQasm3Program] = load_program(qasm)
+    if has_measurements(program):
+        raise ValueError("Circuits with measurements are not supported by the IonQDictType")
 
     gates = _parse_gates(program)
 
@@ -274,8 +301,14 @@ def openqasm3_to_ionq(qasm: Union[QasmStringType, openqasm3.ast.Program]) -> Ion
 
     gateset = IonQProgram.determine_gateset(gates)
 
+    num_qubits = sum(
+        expression_value_option(statement.size) or 1
+        for statement in program.statements
+        if isinstance(statement, openqasm3.ast.QubitDeclaration)
+    )
+
     return {
-        "qubits": program.num_qubits,
+        "qubits": num_qubits,
         "circuit": gates,
         "gateset": gateset.value,
         "format": "ionq.circuit.v0",
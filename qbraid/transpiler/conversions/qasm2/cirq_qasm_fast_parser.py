@@ -0,0 +1,330 @@
+# Copyright (C) 2024 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Module defining a hand-written OpenQASM 2 front end that builds Cirq circuits.
+
+Programs are tokenized with a single regular expression and parsed by recursive descent,
+resolving gates through the same gate table as :class:`~.cirq_qasm_parser.QasmParser`.
+Operations are collected in a list and packed into a ``cirq.Circuit`` in one call.
+
+Anything outside the supported subset, and every malformed program, is handed to the
+PLY-based :class:`~.cirq_qasm_parser.QasmParser`, so results and error messages match it.
+
+"""
+from __future__ import annotations
+
+import operator
+import re
+from typing import Any, Callable, Union
+
+import numpy as np
+from cirq import Circuit, NamedQubit, ops
+
+from qbraid._logging import logger
+
+from .cirq_qasm_parser import Qasm, QasmParser
+
+_TOKEN_PATTERN = re.compile(
+    r"""
+    (?P<space>[ \t]+)
+    | (?P<newline>\n+)
+    | (?P<comment>//[^\n]*)
+    | (?P<number>
+        (([0-9]+\.?|[0-9]?\.[0-9]+)[eE][+-]?[0-9]+)
+        | (([0-9]+)?\.[0-9]+|[0-9]+\.)
+    )
+    | (?P<natural>\d+)
+    | (?P<format>OPENQASM\s+([^\s;]*);)
+    | (?P<qelib>include\s+"qelib1\.inc";)
+    | (?P<arrow>->)
+    | (?P<id>[a-zA-Z][a-zA-Z\d_]*)
+    | (?P<literal>[;,\[\](){}+\-*/^])
+    """,
+    re.VERBOSE,
+)
+
+# gate tables are bound at import, so the fast path never touches QasmParser itself
+_BASIC_GATES = QasmParser.basic_gates
+_ALL_GATES = QasmParser.all_gates
+
+_RESERVED_PREFIXES = ("pi", "qreg", "creg", "measure", "if", "reset", "gate", "opaque")
+
+_FUNCTIONS: dict[str, Callable[[Any], Any]] = {
+    "sin": np.sin,
+    "cos": np.cos,
+    "tan": np.tan,
+    "exp": np.exp,
+    "ln": np.log,
+    "sqrt": np.sqrt,
+    "acos": np.arccos,
+    "atan": np.arctan,
+    "asin": np.arcsin,
+}
+
+# (precedence, right associative, function) of each binary operator
+_BINARY_OPERATORS: dict[str, tuple[int, bool, Callable[[Any, Any], Any]]] = {
+    "+": (1, False, operator.add),
+    "-": (1, False, operator.sub),
+    "*": (2, False, operator.mul),
+    "/": (2, False, operator.truediv),
+    "^": (3, True, operator.pow),
+}
+
+
+class _Unsupported(Exception):
+    """Raised when a program is outside the subset handled by the fast parser."""
+
+
+def _tokenize(qasm: str) -> list[tuple[str, Any]]:
+    """Return the (kind, value) tokens of an OpenQASM 2 program."""
+    tokens = []
+    append = tokens.append
+    pos = 0
+    end = len(qasm)
+    match = _TOKEN_PATTERN.match
+    while pos < end:
+        found = match(qasm, pos)
+        if found is None:
+            raise _Unsupported(f"Illegal character {qasm[pos]!r}")
+        kind = found.lastgroup
+        pos = found.end()
+        if kind in ("space", "newline", "comment"):
+            continue
+        text = found.group(kind)
+        if kind == "id":
+            if text == "pi":
+                append(("number", np.pi))
+                continue
+            if text.startswith(_RESERVED_PREFIXES) and text not in ("qreg", "creg", "measure"):
+                raise _Unsupported(f"Reserved word prefix in {text!r}")
+            append((text if text in ("qreg", "creg", "measure") else "id", text))
+        elif kind == "number":
+            append(("number", float(text)))
+        elif kind == "natural":
+            append(("natural", int(text)))
+        elif kind == "literal":
+            append((text, text))
+        elif kind == "format":
+            append(("format", re.match(r"OPENQASM\s+([^\s;]*);", text).group(1)))
+        else:
+            append((kind, text))
+    return tokens
+
+
+class _Qasm2Reader:
+    """Recursive-descent reader over the tokens of an OpenQASM 2 program."""
+
+    def __init__(self, tokens: list[tuple[str, Any]]):
+        self.tokens = tokens
+        self.pos = 0
+        self.qelibinc = False
+        self.qregs: dict[str, int] = {}
+        self.cregs: dict[str, int] = {}
+        self.qubits: dict[tuple[str, int], NamedQubit] = {}
+        self.gates: dict[tuple, ops.Gate] = {}
+        self.operations: list[ops.Operation] = []
+
+    def peek(self) -> str:
+        """Return the kind of the next token."""
+        return self.tokens[self.pos][0] if self.pos < len(self.tokens) else ""
+
+    def expect(self, kind: str) -> Any:
+        """Consume a token of the given kind and return its value."""
+        if self.peek() != kind:
+            raise _Unsupported(f"Expected {kind!r}")
+        value = self.tokens[self.pos][1]
+        self.pos += 1
+        return value
+
+    def read(self) -> Qasm:
+        """Read the whole program."""
+        if self.expect("format") != "2.0":
+            raise _Unsupported("Unsupported OpenQASM version")
+
+        statements = {
+            "qelib": self.read_include,
+            "qreg": self.read_register,
+            "creg": self.read_register,
+            "measure": self.read_measurement,
+            "id": self.read_gate,
+        }
+        num_tokens = len(self.tokens)
+        while self.pos < num_tokens:
+            reader = statements.get(self.tokens[self.pos][0])
+            if reader is None:
+                raise _Unsupported(f"Unexpected token {self.tokens[self.pos][1]!r}")
+            reader()
+
+        return Qasm(True, self.qelibinc, self.qregs, self.cregs, Circuit(self.operations))
+
+    def read_include(self) -> None:
+        """Read ``include "qelib1.inc";``."""
+        self.pos += 1
+        self.qelibinc = True
+
+    def read_register(self) -> None:
+        """Read a ``qreg`` or ``creg`` declaration."""
+        kind = self.expect(self.peek())
+        name = self.expect("id")
+        self.expect("[")
+        size = self.expect("natural")
+        self.expect("]")
+        self.expect(";")
+        if name in self.qregs or name in self.cregs or size == 0:
+            raise _Unsupported(f"Invalid register {name!r}")
+        (self.qregs if kind == "qreg" else self.cregs)[name] = size
+
+    def qubit(self, reg: str, idx: int) -> NamedQubit:
+        """Return the qubit at an index of a quantum register."""
+        qubit = self.qubits.get((reg, idx))
+        if qubit is None:
+            qubit = self.qubits[(reg, idx)] = NamedQubit(f"{reg}_{idx}")
+        return qubit
+
+    def read_argument(self, registers: dict[str, int]) -> tuple[str, Union[int, None]]:
+        """Read a register name with an optional bounds-checked index."""
+        reg = self.expect("id")
+        if reg not in registers:
+            raise _Unsupported(f"Undefined register {reg!r}")
+        if self.peek() != "[":
+            return reg, None
+        self.pos += 1
+        idx = self.expect("natural")
+        self.expect("]")
+        if idx >= registers[reg]:
+            raise _Unsupported(f"Out of bounds index on register {reg!r}")
+        return reg, idx
+
+    def read_gate(self) -> None:
+        """Read a gate application."""
+        name = self.expect("id")
+        gate_set = _ALL_GATES if self.qelibinc else _BASIC_GATES
+        statement = gate_set.get(name)
+        if statement is None:
+            raise _Unsupported(f"Unknown gate {name!r}")
+
+        params = []
+        if self.peek() == "(":
+            self.pos += 1
+            params.append(self.read_expression())
+            while self.peek() == ",":
+                self.pos += 1
+                params.append(self.read_expression())
+            self.expect(")")
+
+        args = [self.read_argument(self.qregs)]
+        while self.peek() == ",":
+            self.pos += 1
+            args.append(self.read_argument(self.qregs))
+        self.expect(";")
+
+        if len(args) != statement.num_args or len(params) != statement.num_params:
+            raise _Unsupported(f"Wrong number of arguments or parameters for {name!r}")
+
+        if any(idx is None for _, idx in args):
+            operands = [
+                (
+                    [self.qubit(reg, i) for i in range(self.qregs[reg])]
+                    if idx is None
+                    else [self.qubit(reg, idx)]
+                )
+                for reg, idx in args
+            ]
+            self.operations.extend(statement.on(params=params, args=operands, lineno=0))
+            return
+
+        qubits = [self.qubit(reg, idx) for reg, idx in args]
+        if len(set(qubits)) < len(qubits):
+            raise _Unsupported("Overlapping qubits")
+
+        if isinstance(statement.cirq_gate, ops.Gate):
+            gate = statement.cirq_gate
+        else:
+            key = (name, *params)
+            gate = self.gates.get(key)
+            if gate is None:
+                gate = self.gates[key] = statement.cirq_gate(params)
+        self.operations.append(gate.on(*qubits))
+
+    def read_measurement(self) -> None:
+        """Read ``measure qarg -> carg;``."""
+        self.pos += 1
+        qreg, qidx = self.read_argument(self.qregs)
+        self.expect("arrow")
+        creg, cidx = self.read_argument(self.cregs)
+        self.expect(";")
+
+        qindices = range(self.qregs[qreg]) if qidx is None else [qidx]
+        cindices = range(self.cregs[creg]) if cidx is None else [cidx]
+        if len(qindices) != len(cindices):
+            raise _Unsupported("Mismatched register sizes for measurement")
+
+        self.operations.extend(
+            ops.MeasurementGate(num_qubits=1, key=f"{creg}_{c}").on(self.qubit(qreg, q))
+            for q, c in zip(qindices, cindices)
+        )
+
+    def read_expression(self, min_precedence: int = 1) -> Any:
+        """Read a parameter expression by precedence climbing.
+
+        Unary signs apply to everything up to the next ``+`` or ``-``, as in the PLY grammar.
+        """
+        value = self.read_primary()
+        while True:
+            kind = self.peek()
+            binary = _BINARY_OPERATORS.get(kind)
+            if binary is None or binary[0] < min_precedence:
+                return value
+            precedence, right, func = binary
+            self.pos += 1
+            rhs = self.read_expression(precedence if right else precedence + 1)
+            value = func(value, rhs)
+
+    def read_primary(self) -> Any:
+        """Read a number, parenthesized expression, function call or signed expression."""
+        kind, value = self.tokens[self.pos] if self.pos < len(self.tokens) else ("", None)
+        self.pos += 1
+        if kind in ("number", "natural"):
+            return value
+        if kind == "(":
+            value = self.read_expression()
+            self.expect(")")
+            return value
+        if kind == "-":
+            return -self.read_expression(2)
+        if kind == "+":
+            return self.read_expression(2)
+        if kind == "id" and value in _FUNCTIONS:
+            self.expect("(")
+            argument = self.read_expression()
+            self.expect(")")
+            return _FUNCTIONS[value](argument)
+        raise _Unsupported("Invalid expression")
+
+
+def parse(qasm: str) -> Qasm:
+    """Parse an OpenQASM 2 program into a :class:`~.cirq_qasm_parser.Qasm` result.
+
+    Args:
+        qasm: OpenQASM 2 program.
+
+    Returns:
+        Qasm: The parsed program, with the equivalent Cirq circuit.
+
+    Raises:
+        QasmException: If the program is invalid.
+    """
+    try:
+        return _Qasm2Reader(_tokenize(qasm)).read()
+    except Exception as err:  # pylint: disable=broad-exception-caught
+        logger.debug("Falling back to PLY OpenQASM 2 parser: %s", err)
+
+    return QasmParser().parse(qasm)
@@ -23,8 +23,10 @@ from qbraid.programs.exceptions import QasmError
 from qbraid.transpiler.annotations import weight
 
 cirq_qasm_import = LazyLoader("cirq_contrib", globals(), "cirq.contrib.qasm_import")
-cirq_qasm_parser = LazyLoader(
-    "cirq_qasm_parser", globals(), "qbraid.transpiler.conversions.qasm2.cirq_qasm_parser"
+cirq_qasm_fast_parser = LazyLoader(
+    "cirq_qasm_fast_parser",
+    globals(),
+    "qbraid.transpiler.conversions.qasm2.cirq_qasm_fast_parser",
 )
 
 if TYPE_CHECKING:
@@ -45,6 +47,6 @@ def qasm2_to_cirq(qasm: Qasm2StringType) -> cirq.Circuit:
     """
     try:
         qasm = unfold_qasm2(qasm)
-        return cirq_qasm_parser.QasmParser().parse(qasm).circuit
+        return cirq_qasm_fast_parser.parse(qasm).circuit
     except cirq_qasm_import.QasmException as err:
         raise QasmError from err
@@ -12,8 +12,11 @@
 Module containing OpenQASM conversion function
 
 """
+import functools
 import os
+import re
 import textwrap
+from typing import Iterable, Iterator
 
 from qbraid._version import __version__ as qbraid_version
 from qbraid.passes.qasm.decompose import _decompose_rxx_instr
@@ -31,6 +34,34 @@ def _get_qasm3_gate_defs() -> str:
     return gate_defs
 
 
+_GATE_DEF_PATTERN = re.compile(r"^\s*gate\s+(\w+)", re.MULTILINE)
+_IDENTIFIER_PATTERN = re.compile(r"[A-Za-z_]\w*")
+_COMMENT_PATTERN = re.compile(r"//[^\n]*")
+
+
+def _referenced_names(text: str) -> set[str]:
+    """Return the identifiers used in OpenQASM text, ignoring comments."""
+    return set(_IDENTIFIER_PATTERN.findall(_COMMENT_PATTERN.sub("", text)))
+
+
+@functools.lru_cache(maxsize=1)
+def _get_qasm3_gate_def_map() -> dict[str, tuple[str, frozenset[str]]]:
+    """Return each gate definition from the qelib .qasm file, keyed by gate name, with
+    the names of the other gates in the file that its body uses."""
+    gate_defs = _get_qasm3_gate_defs()
+    starts = [match.start() for match in _GATE_DEF_PATTERN.finditer(gate_defs)]
+    blocks = [gate_defs[start:end] for start, end in zip(starts, starts[1:] + [None])]
+    names = [_GATE_DEF_PATTERN.match(block).group(1) for block in blocks]
+
+    def_map = {}
+    for name, block in zip(names, blocks):
+        block = block.strip() + "\n"
+        body = block[block.index("{") :]
+        dependencies = frozenset(_referenced_names(body).intersection(names) - {name})
+        def_map[name] = (block, dependencies)
+    return def_map
+
+
 def _build_qasm_3_reg(line: str, qreg_type: bool) -> str:
     """Helper function to build openqasm 3 register statements
 
@@ -88,7 +119,7 @@ def _convert_line_to_qasm3(line: str) -> str:
     if line.startswith("creg"):
         return _build_qasm_3_reg(line, qreg_type=False)
     if line.startswith("u("):
-        return line.replace("u(", "U(")
+        return line.replace("u(", "U(") + "\n"
     if line.startswith("rxx("):
         return _decompose_rxx_instr(line)
     if line.startswith("measure"):
@@ -99,20 +130,25 @@ def _convert_line_to_qasm3(line: str) -> str:
     return line + "\n"
 
 
-@weight(0.7)
-def qasm2_to_qasm3(qasm_str: Qasm2StringType) -> Qasm3StringType:
-    """Convert a OpenQASM 2.0 string to OpenQASM 3.0 string
+def qasm2_to_qasm3_lines(lines: Iterable[str]) -> Iterator[str]:
+    """Convert OpenQASM 2.0 lines to OpenQASM 3.0, one line at a time.
+
+    Gate definitions from ``qelib1.inc`` that are not in ``stdgates.inc`` are emitted
+    just before the first statement that uses them, so only referenced definitions
+    are included. Lines are consumed lazily, so e.g. a file object can be converted
+    without reading it into memory. Gates defined by the program itself are emitted
+    where they are defined, whether or not they are used.
 
     Args:
-        qasm_str (str): OpenQASM 2.0 string
+        lines (Iterable[str]): OpenQASM 2.0 program lines, with or without line endings.
 
-    Returns:
-        str: OpenQASM 3.0 string
-    """
-    if not isinstance(qasm_str, Qasm2String):
-        raise ValueError("Invalid OpenQASM 2.0 string")
+    Yields:
+        str: Chunks of the OpenQASM 3.0 program, each made up of whole lines.
 
-    qasm3_str = textwrap.dedent(
+    Raises:
+        ValueError: If the program declares an OpenQASM version other than 2.
+    """
+    yield textwrap.dedent(
         f"""
         // Generated from qBraid v{qbraid_version}
         OPENQASM 3.0;
@@ -120,19 +156,33 @@ def qasm2_to_qasm3(qasm_str: Qasm2StringType) -> Qasm3StringType:
     """
     )
 
-    gate_defs = _get_qasm3_gate_defs()
+    qelib_defs = _get_qasm3_gate_def_map()
+    defined: set[str] = set()
 
-    for line in gate_defs:
-        qasm3_str += line
+    def gate_defs_for(text: str) -> Iterator[str]:
+        for name in sorted(_referenced_names(text).intersection(qelib_defs)):
+            if name not in defined:
+                defined.add(name)
+                block, dependencies = qelib_defs[name]
+                yield from gate_defs_for(" ".join(dependencies))
+                yield block
 
     last_line_was_blank = False
-
-    for line in qasm_str.splitlines():
-        if line.strip().startswith("//"):
+    gate_block: list[str] = []
+    gate_match = None
+    depth, opened = 0, False
+
+    for line in lines:
+        line = line.rstrip("\r\n")
+        stripped = line.strip()
+        if stripped.startswith("//"):
             continue
 
+        if stripped.startswith("OPENQASM") and not re.match(r"OPENQASM\s+2(\.0)?\s*;", stripped):
+            raise ValueError("Invalid OpenQASM 2.0 string")
+
         # Check if the current line is blank
-        if not line.strip():
+        if not stripped:
             if last_line_was_blank:
                 continue  # pragma: no cover
 
@@ -141,8 +191,49 @@ def qasm2_to_qasm3(qasm_str: Qasm2StringType) -> Qasm3StringType:
             last_line_was_blank = False
 
         line = _convert_line_to_qasm3(line)
-        qasm3_str += line
+        if not line:
+            continue
+
+        # Hold back gate definitions until their body is complete, so that the qelib
+        # definitions they use can be emitted before them at the top level.
+        if not gate_block:
+            gate_match = _GATE_DEF_PATTERN.match(line)
+            if gate_match is not None:
+                defined.add(gate_match.group(1))
+                depth, opened = 0, False
+        if gate_block or gate_match is not None:
+            gate_block.append(line)
+            depth += line.count("{") - line.count("}")
+            opened = opened or "{" in line
+            if depth > 0 or not opened:
+                continue
+            line = "".join(gate_block)
+            gate_block.clear()
+
+        yield from gate_defs_for(line)
+        yield line
+
+    if gate_block:
+        yield "".join(gate_block)
+
+
+@weight(0.7)
+def qasm2_to_qasm3(qasm_str: Qasm2StringType) -> Qasm3StringType:
+    """Convert a OpenQASM 2.0 string to OpenQASM 3.0 string
+
+    Only the ``qelib1.inc`` gate definitions used by the program are included, and
+    unused gates defined by the program are removed. See :func:`qasm2_to_qasm3_lines`
+    to convert a program line by line.
+
+    Args:
+        qasm_str (str): OpenQASM 2.0 string
+
+    Returns:
+        str: OpenQASM 3.0 string
+    """
+    if not isinstance(qasm_str, Qasm2String):
+        raise ValueError("Invalid OpenQASM 2.0 string")
 
-    qasm3_str = remove_unused_gates(qasm3_str)
+    qasm3_str = "".join(qasm2_to_qasm3_lines(qasm_str.splitlines()))
 
-    return qasm3_str
+    return remove_unused_gates(qasm3_str)
@@ -14,26 +14,52 @@ Module for converting Braket circuits to/from OpenQASM 3
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
+from typing import TYPE_CHECKING, Optional, Union
+
+import openqasm3
+from openqasm3.ast import (
+    BitType,
+    ClassicalDeclaration,
+    Include,
+    IndexedIdentifier,
+    Program,
+    QuantumGate,
+    QuantumMeasurementStatement,
+    QubitDeclaration,
+)
 from qbraid_core._import import LazyLoader
 
+from qbraid._logging import logger
+from qbraid.passes.qasm.analyze import _qubit_indices, expression_value_option
 from qbraid.passes.qasm.compat import (
     convert_qasm_pi_to_decimal,
     remove_stdgates_include,
     replace_gate_names,
 )
+from qbraid.passes.qasm.expressions import fold_expression
 from qbraid.programs.exceptions import QasmError
 from qbraid.transpiler.annotations import weight
 
 braket_circuits = LazyLoader("braket_circuits", globals(), "braket.circuits")
+braket_measure = LazyLoader("braket_measure", globals(), "braket.circuits.measure")
 braket_openqasm = LazyLoader("braket_openqasm", globals(), "braket.ir.openqasm")
+braket_translations = LazyLoader("braket_translations", globals(), "braket.circuits.translations")
 
 if TYPE_CHECKING:
     import braket.circuits
 
     from qbraid.programs.typer import Qasm3StringType
 
+BRAKET_GATE_NAMES = {
+    "cx": "cnot",
+    "sdg": "si",
+    "tdg": "ti",
+    "sx": "v",
+    "sxdg": "vi",
+    "p": "phaseshift",
+    "cp": "cphaseshift",
+}
+
 
 def transform_notation(qasm3: str) -> str:
     """
@@ -41,28 +67,99 @@ def transform_notation(qasm3: str) -> str:
     an external tool to make it compatible with Amazon Braket.
 
     """
-    replacements = {
-        "cx": "cnot",
-        "sdg": "si",
-        "tdg": "ti",
-        "sx": "v",
-        "sxdg": "vi",
-        "p": "phaseshift",
-        "cp": "cphaseshift",
-    }
-
     qasm3 = remove_stdgates_include(qasm3)
-    qasm3 = replace_gate_names(qasm3, replacements)
+    qasm3 = replace_gate_names(qasm3, BRAKET_GATE_NAMES)
     qasm3 = convert_qasm_pi_to_decimal(qasm3)
     return qasm3
 
 
+def _measurement_indices(statement: QuantumMeasurementStatement) -> Optional[list[int]]:
+    """Return the classical bit indices written by a measurement, as assigned by Braket."""
+    target = statement.target
+    if target is None:
+        return []
+    if (
+        not isinstance(target, IndexedIdentifier)
+        or len(target.indices) != 1
+        or len(target.indices[0]) != 1
+    ):
+        return None
+    index = fold_expression(target.indices[0][0])
+    return [index] if isinstance(index, int) and index >= 0 else None
+
+
+# pylint: disable-next=too-many-return-statements
+def _build_braket_circuit(program: Program) -> Optional[braket.circuits.Circuit]:
+    """Build a Braket circuit directly from an OpenQASM 3 syntax tree.
+
+    Supports qubit and bit declarations, Braket built-in gates without modifiers and with
+    constant parameters, and measurements, with register operands expanded as Braket does.
+
+    Returns:
+        Optional[braket.circuits.Circuit]: The circuit, or None if the program contains
+            a construct that is not supported, in which case Braket's own OpenQASM
+            interpreter should be used instead.
+    """
+    registers: dict[str, tuple[int, int]] = {}
+    num_qubits = 0
+    circuit = braket_circuits.Circuit()
+
+    for statement in program.statements:
+        if isinstance(statement, QubitDeclaration):
+            size = expression_value_option(statement.size)
+            size = 1 if size is None else size
+            registers[statement.qubit.name] = (num_qubits, size)
+            num_qubits += size
+        elif isinstance(statement, Include) and statement.filename == "stdgates.inc":
+            continue
+        elif (
+            isinstance(statement, ClassicalDeclaration)
+            and isinstance(statement.type, BitType)
+            and statement.init_expression is None
+        ):
+            continue
+        elif isinstance(statement, QuantumGate):
+            name = statement.name.name
+            gate_type = braket_translations.BRAKET_GATES.get(BRAKET_GATE_NAMES.get(name, name))
+            if gate_type is None or statement.modifiers or not statement.qubits:
+                return None
+            params = [fold_expression(argument) for argument in statement.arguments]
+            operands = [_qubit_indices(qubit, registers) for qubit in statement.qubits]
+            if None in params or any(isinstance(q, str) for op in operands for q in op):
+                return None
+            widths = {len(operand) for operand in operands if len(operand) > 1}
+            if len(widths) > 1:
+                return None
+            for i in range(widths.pop() if widths else 1):
+                target = [operand[i if len(operand) > 1 else 0] for operand in operands]
+                circuit.add_instruction(braket_circuits.Instruction(gate_type(*params), target))
+        elif isinstance(statement, QuantumMeasurementStatement):
+            qubits = _qubit_indices(statement.measure.qubit, registers)
+            indices = _measurement_indices(statement)
+            if indices is None or any(isinstance(qubit, str) for qubit in qubits):
+                return None
+            if indices and len(indices) != len(qubits):
+                return None
+            for i, qubit in enumerate(qubits):
+                measure = braket_measure.Measure(index=indices[i] if indices else i)
+                circuit.add_instruction(braket_circuits.Instruction(measure, qubit))
+        else:
+            return None
+
+    return circuit
+
+
 @weight(1)
-def qasm3_to_braket(qasm: Qasm3StringType) -> braket.circuits.Circuit:
+def qasm3_to_braket(qasm: Union[Qasm3StringType, Program]) -> braket.circuits.Circuit:
     """Converts an OpenQASM 3.0 string to a ``braket.circuits.Circuit``.
 
+    Programs made up of declarations, Braket built-in gates with constant parameters, and
+    measurements are converted by walking the parsed program directly. Other programs, e.g.
+    those with gate definitions, gate modifiers, or input parameters, are converted with
+    Braket's OpenQASM interpreter.
+
     Args:
-        qasm: OpenQASM 3 string
+        qasm: OpenQASM 3 string or parsed program
 
     Returns:
         The Amazon Braket circuit equivalent to the input OpenQASM 3.0 string
@@ -71,7 +168,17 @@ def qasm3_to_braket(qasm: Qasm3StringType) -> braket.circuits.Circuit:
         ProgramConversionError: If qasm to braket conversion fails
 
     """
-    qasm = transform_notation(qasm)
+    try:
+        program = openqasm3.parse(qasm) if isinstance(qasm, str) else qasm
+        circuit = _build_braket_circuit(program)
+    except Exception as err:  # pylint: disable=broad-exception-caught
+        logger.debug("Falling back to Braket OpenQASM interpreter: %s", err)
+        circuit = None
+
+    if circuit is not None:
+        return circuit
+
+    qasm = transform_notation(qasm if isinstance(qasm, str) else openqasm3.dumps(qasm))
 
     try:
         program = braket_openqasm.Program(source=qasm)
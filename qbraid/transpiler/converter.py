@@ -14,6 +14,7 @@ Module for transpiling quantum programs between different quantum programming la
 """
 from __future__ import annotations
 
+import os
 import warnings
 from copy import deepcopy
 from typing import TYPE_CHECKING, Optional
@@ -24,6 +25,7 @@ from qbraid._logging import logger
 from qbraid.programs import QPROGRAM_ALIASES
 from qbraid.programs.alias_manager import _get_program_type_alias, get_program_type_alias
 
+from .cache import conversion_graph_key, default_graph_key, get_transpile_cache
 from .exceptions import ConversionPathNotFoundError, NodeNotFoundError, ProgramConversionError
 from .graph import ConversionGraph, _get_path_from_bound_methods
 
@@ -43,45 +45,79 @@ def _format_exception(err: Exception) -> str:
     return f"{type(err).__name__}: {str(err)}\n"
 
 
-def transpile(
+def _run_conversion_path(
+    program: qbraid.programs.QPROGRAM, path: list, error_messages: Optional[list[str]] = None
+) -> qbraid.programs.QPROGRAM:
+    """Apply each conversion function in the path to the program, in sequence.
+
+    Args:
+        program (qbraid.programs.QPROGRAM): The program to convert. It is not modified.
+        path (list[Callable]): The conversion functions that make up the path.
+        error_messages (Optional[list[str]]): If given, details of a failed conversion
+            are appended to this list before the exception is re-raised.
+
+    Returns:
+        qbraid.programs.QPROGRAM: The program converted along the full path.
+    """
+    temp_program = deepcopy(program)
+    for convert_func in path:
+        try:
+            temp_program = convert_func(temp_program)
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            alias = get_program_type_alias(temp_program, safe=True)
+
+            if alias == "cirq":
+                cirq_qasm_import = LazyLoader(
+                    "cirq_qasm_import", globals(), "cirq.contrib.qasm_import"
+                )
+                qasm: str = temp_program.to_qasm()  # type: ignore[attr-defined]
+                temp_program = cirq_qasm_import.circuit_from_qasm(qasm)
+                temp_program = convert_func(temp_program)  # Retry conversion
+            else:
+                if error_messages is not None:
+                    path_details = _get_path_from_bound_methods(path)
+                    error_messages.append(
+                        f"Conversion {path_details} failed due to "
+                        f"exception raised while converting from '{alias}'."
+                    )
+                    error_messages.append(_format_exception(err))
+                raise
+    return temp_program
+
+
+def _transpile_with_path(
     program: qbraid.programs.QPROGRAM,
     target: str,
     conversion_graph: Optional[ConversionGraph] = None,
     max_path_attempts: int = 3,
     max_path_depth: Optional[int] = None,
     **kwargs,
-) -> qbraid.programs.QPROGRAM:
-    """
-    Transpile a quantum program to a target language using a conversion graph.
-    This function attempts to find a conversion path from the program's current
-    format to the target format. It can limit the search to a certain number of
-    attempts and path depths.
+) -> tuple[qbraid.programs.QPROGRAM, list]:
+    """Transpile a quantum program and return it together with the conversion path used.
 
-    Args:
-        program (qbraid.programs.QPROGRAM): The quantum program to transpile.
-        target (str): The target language to transpile to.
-        conversion_graph (Optional[ConversionGraph]): The graph representing available conversions.
-            If None, a default graph is used. Defaults to None.
-        max_path_attempts (int): The maximum number of conversion paths to attempt before raising an
-            exception. This is useful to avoid excessive computations when multiple paths are
-            available. Defaults to 3.
-        max_path_depth (Optional[int]): The maximum depth of conversions within a given path to
-            allow. For example, a path with a depth of 2 would be ['cirq' -> 'qasm2' -> 'qiskit'],
-            whereas a depth  of 1 would be a direct conversion ['cirq' -> 'braket']. Defaults
-            to None, i.e. no limit set on the path depth.
+    Accepts the same arguments, and raises the same exceptions, as :func:`transpile`.
 
     Returns:
-        qbraid.programs.QPROGRAM: The transpiled quantum program.
-
-    Raises:
-        NodeNotFoundError: If the target or source package is not in the ConversionGraph.
-        ConversionPathNotFoundError: If no path is available to conversion between the
-            source and target packages.
-        ProgramConversionError: If the conversion fails through all attempted paths.
+        tuple[qbraid.programs.QPROGRAM, list[Callable]]: The transpiled program, and the
+            conversion functions that produced it (empty if no conversion was needed).
     """
     graph = conversion_graph or ConversionGraph(**kwargs)
     graph_type = "Default" if conversion_graph is None else "Provided"
+    return _transpile_on_graph(
+        program, target, graph, graph_type, max_path_attempts, max_path_depth
+    )
+
 
+def _transpile_on_graph(  # pylint: disable=too-many-arguments
+    program: qbraid.programs.QPROGRAM,
+    target: str,
+    graph: ConversionGraph,
+    graph_type: str,
+    max_path_attempts: int,
+    max_path_depth: Optional[int],
+) -> tuple[qbraid.programs.QPROGRAM, list]:
+    """Transpile a quantum program over the given conversion graph, and return it together
+    with the conversion path used."""
     if not graph.has_node(target):
         raise NodeNotFoundError(graph_type, target, graph.nodes())
 
@@ -94,7 +130,7 @@ def transpile(
         raise ConversionPathNotFoundError(source, target)
 
     if source == target:
-        return program
+        return program, []
 
     _warn_if_unsupported(source, "from")
     _warn_if_unsupported(target, "to")
@@ -110,32 +146,10 @@ def transpile(
 
     for path in paths:
         path_details = _get_path_from_bound_methods(path)
-        temp_program = deepcopy(program)
         try:
-            for convert_func in path:
-                try:
-                    temp_program = convert_func(temp_program)
-                except Exception as err:  # pylint: disable=broad-exception-caught
-                    alias = get_program_type_alias(temp_program, safe=True)
-
-                    if alias == "cirq":
-                        cirq_qasm_import = LazyLoader(
-                            "cirq_qasm_import", globals(), "cirq.contrib.qasm_import"
-                        )
-                        qasm: str = temp_program.to_qasm()  # type: ignore[attr-defined]
-                        temp_program = cirq_qasm_import.circuit_from_qasm(qasm)
-                        temp_program = convert_func(temp_program)  # Retry conversion
-                    else:
-                        error_detail = (
-                            f"Conversion {path_details} failed due to "
-                            f"exception raised while converting from '{alias}'."
-                        )
-                        error_messages.append(error_detail)
-                        error_messages.append(_format_exception(err))
-                        raise
-
+            temp_program = _run_conversion_path(program, path, error_messages)
             logger.info("Successfully transpiled using conversions: %s", path_details)
-            return temp_program
+            return temp_program, path
         except Exception as err:  # pylint: disable=broad-exception-caught
             logger.info("Failed to transpile using conversions: %s", path_details)
             formatted_error = _format_exception(err)
@@ -151,3 +165,72 @@ def transpile(
             else "."
         )
     )
+
+
+def transpile(
+    program: qbraid.programs.QPROGRAM,
+    target: str,
+    conversion_graph: Optional[ConversionGraph] = None,
+    max_path_attempts: int = 3,
+    max_path_depth: Optional[int] = None,
+    **kwargs,
+) -> qbraid.programs.QPROGRAM:
+    """
+    Transpile a quantum program to a target language using a conversion graph.
+    This function attempts to find a conversion path from the program's current
+    format to the target format. It can limit the search to a certain number of
+    attempts and path depths. If a cache has been enabled with
+    :func:`~qbraid.transpiler.enable_transpile_cache`, a copy of the earlier result is
+    returned for programs that have already been transpiled to the same target.
+
+    Args:
+        program (qbraid.programs.QPROGRAM): The quantum program to transpile.
+        target (str): The target language to transpile to.
+        conversion_graph (Optional[ConversionGraph]): The graph representing available conversions.
+            If None, a default graph is used. Defaults to None.
+        max_path_attempts (int): The maximum number of conversion paths to attempt before raising an
+            exception. This is useful to avoid excessive computations when multiple paths are
+            available. Defaults to 3.
+        max_path_depth (Optional[int]): The maximum depth of conversions within a given path to
+            allow. For example, a path with a depth of 2 would be ['cirq' -> 'qasm2' -> 'qiskit'],
+            whereas a depth  of 1 would be a direct conversion ['cirq' -> 'braket']. Defaults
+            to None, i.e. no limit set on the path depth.
+
+    Returns:
+        qbraid.programs.QPROGRAM: The transpiled quantum program.
+
+    Raises:
+        NodeNotFoundError: If the target or source package is not in the ConversionGraph.
+        ConversionPathNotFoundError: If no path is available to conversion between the
+            source and target packages.
+        ProgramConversionError: If the conversion fails through all attempted paths.
+    """
+    graph = conversion_graph
+    graph_type = "Default" if conversion_graph is None else "Provided"
+
+    cache = get_transpile_cache()
+    key = None
+    if cache is not None and os.getenv("DISABLE_CACHE") != "1":
+        # identify the graph without building the default one, which is only needed on a miss
+        graph_key = default_graph_key(**kwargs) if graph is None else conversion_graph_key(graph)
+        if graph_key is None:
+            graph = ConversionGraph(**kwargs)
+            graph_key = conversion_graph_key(graph)
+        key = cache.key(program, target, graph_key, max_path_attempts, max_path_depth)
+        if key is not None:
+            cached_program = cache.get(key)
+            if cached_program is not None:
+                logger.info("Returning cached transpiled program for target '%s'.", target)
+                return cached_program
+
+    if graph is None:
+        graph = ConversionGraph(**kwargs)
+
+    program, path = _transpile_on_graph(
+        program, target, graph, graph_type, max_path_attempts, max_path_depth
+    )
+
+    if key is not None and path:
+        cache.put(key, program)
+
+    return program
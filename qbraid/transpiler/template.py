@@ -0,0 +1,321 @@
+# Copyright (C) 2024 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Module providing "compile once, bind many" transpilation of parametric quantum programs.
+
+A :class:`ConversionTemplate` converts a program with free parameters to the target
+type once, and then produces a bound program for each set of parameter values without
+searching the conversion graph or re-running the conversion again.
+
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, Iterable, Mapping, NamedTuple, Optional, Union
+
+from openqasm3 import dumps, parse
+from openqasm3.ast import (
+    FloatLiteral,
+    Identifier,
+    IntegerLiteral,
+    IODeclaration,
+    IOKeyword,
+    QuantumGateDefinition,
+)
+from openqasm3.visitor import QASMTransformer
+from qbraid_core._import import LazyLoader
+
+from qbraid._logging import logger
+from qbraid.programs.alias_manager import _get_program_type_alias
+
+from .converter import _run_conversion_path, _transpile_with_path
+from .exceptions import ProgramConversionError
+
+if TYPE_CHECKING:
+    import qbraid.programs
+    from qbraid.transpiler.graph import ConversionGraph
+
+cirq = LazyLoader("cirq", globals(), "cirq")
+
+Number = Union[int, float]
+
+
+class ParameterBinder(NamedTuple):
+    """Functions used to inspect and bind the free parameters of one program type.
+
+    Attributes:
+        parameters (Callable): Returns the names of the free parameters of a program.
+        bind (Callable): Returns a copy of a program with the given parameter values
+            substituted. It must not modify the program it is given.
+    """
+
+    parameters: Callable[[qbraid.programs.QPROGRAM], Iterable[str]]
+    bind: Callable[[qbraid.programs.QPROGRAM, Mapping[str, Number]], qbraid.programs.QPROGRAM]
+
+
+_PARAMETER_BINDERS: dict[str, ParameterBinder] = {}
+
+
+def register_parameter_binder(
+    alias: str,
+    parameters: Callable[[qbraid.programs.QPROGRAM], Iterable[str]],
+    bind: Callable[[qbraid.programs.QPROGRAM, Mapping[str, Number]], qbraid.programs.QPROGRAM],
+    overwrite: bool = False,
+) -> None:
+    """Register functions to inspect and bind the free parameters of a program type.
+
+    Args:
+        alias (str): The program type alias, e.g. ``"qiskit"``.
+        parameters (Callable): Function returning the names of a program's free parameters.
+        bind (Callable): Function returning a bound copy of a program, given a mapping
+            from parameter name to value.
+        overwrite (bool): Whether to replace an existing binder for the same alias.
+
+    Raises:
+        ValueError: If a binder for the alias is already registered and overwrite is False.
+    """
+    if alias in _PARAMETER_BINDERS and not overwrite:
+        raise ValueError(f"Parameter binder for '{alias}' is already registered.")
+    _PARAMETER_BINDERS[alias] = ParameterBinder(parameters, bind)
+
+
+def get_parameter_binders() -> dict[str, ParameterBinder]:
+    """Return a copy of the registry of parameter binders, keyed by program type alias."""
+    return dict(_PARAMETER_BINDERS)
+
+
+class _InputSubstituter(QASMTransformer):
+    """Replaces references to bound input parameters with literals."""
+
+    def __init__(self, values: Mapping[str, Number]):
+        self.values = values
+
+    def visit_IODeclaration(self, node: IODeclaration) -> Optional[IODeclaration]:
+        """Drop the declarations of the inputs that are being bound."""
+        if node.io_identifier == IOKeyword.input and node.identifier.name in self.values:
+            return None
+        return node
+
+    def visit_QuantumGateDefinition(self, node: QuantumGateDefinition) -> QuantumGateDefinition:
+        """Leave gate bodies unchanged, as gate arguments shadow outer names."""
+        return node
+
+    def visit_Identifier(self, node: Identifier) -> Union[Identifier, FloatLiteral, IntegerLiteral]:
+        """Replace an identifier that names a bound input with its value."""
+        if node.name not in self.values:
+            return node
+        value = self.values[node.name]
+        if isinstance(value, int) and not isinstance(value, bool):
+            return IntegerLiteral(value=value)
+        return FloatLiteral(value=float(value))
+
+
+def _qasm3_parameters(program: str) -> list[str]:
+    """Return the names of the input variables declared in an OpenQASM 3 program."""
+    return [
+        statement.identifier.name
+        for statement in parse(program).statements
+        if isinstance(statement, IODeclaration) and statement.io_identifier == IOKeyword.input
+    ]
+
+
+def _qasm3_bind(program: str, values: Mapping[str, Number]) -> str:
+    """Substitute values for input variables in an OpenQASM 3 program."""
+    parsed = _InputSubstituter(values).visit(parse(program))
+    return dumps(parsed)
+
+
+def _qiskit_bind(circuit, values: Mapping[str, Number]):
+    """Assign values to the parameters of a Qiskit circuit, by parameter name."""
+    mapping = {param: values[param.name] for param in circuit.parameters}
+    return circuit.assign_parameters(mapping, inplace=False)
+
+
+def _cirq_parameter_names(circuit: cirq.Circuit) -> set[str]:
+    """Return the parameter names of a Cirq circuit, importing cirq on first use."""
+    return cirq.parameter_names(circuit)
+
+
+register_parameter_binder("qasm3", _qasm3_parameters, _qasm3_bind)
+register_parameter_binder(
+    "qiskit", lambda circuit: [param.name for param in circuit.parameters], _qiskit_bind
+)
+register_parameter_binder(
+    "braket",
+    lambda circuit: [param.name for param in circuit.parameters],
+    lambda circuit, values: circuit.make_bound_circuit(dict(values)),
+)
+register_parameter_binder(
+    "cirq",
+    _cirq_parameter_names,
+    lambda circuit, values: cirq.resolve_parameters(circuit, dict(values)),
+)
+
+
+class ConversionTemplate:
+    """A parametric program converted once to a target type, ready to be bound many times.
+
+    If a parameter binder is registered for the target type and the conversion preserves
+    the free parameters, the program is converted once and each call to :meth:`bind` only
+    substitutes values into the converted program. Otherwise, the values are bound in the
+    source program and the conversion path found on construction is replayed, skipping
+    the graph search.
+
+    Example usage:
+
+    .. code-block:: python
+
+        template = ConversionTemplate(qasm3_with_inputs, "qiskit")
+        circuits = template.bind_many({"theta": theta} for theta in np.linspace(0, np.pi, 100))
+
+    Args:
+        program (qbraid.programs.QPROGRAM): The quantum program with free parameters.
+        target (str): The target language to transpile to.
+        conversion_graph (Optional[ConversionGraph]): The graph representing available
+            conversions. If None, a default graph is used.
+        max_path_attempts (int): The maximum number of conversion paths to attempt.
+        max_path_depth (Optional[int]): The maximum depth of conversions within a path.
+
+    Raises:
+        ValueError: If no parameter binder is registered for the source or target type, or
+            if the parameters are lost in conversion and cannot be bound in the source.
+        NodeNotFoundError: If the target or source package is not in the ConversionGraph.
+        ConversionPathNotFoundError: If no path is available between source and target.
+        ProgramConversionError: If the conversion fails through all attempted paths.
+    """
+
+    def __init__(
+        self,
+        program: qbraid.programs.QPROGRAM,
+        target: str,
+        conversion_graph: Optional[ConversionGraph] = None,
+        max_path_attempts: int = 3,
+        max_path_depth: Optional[int] = None,
+        **kwargs,
+    ):
+        self._source = _get_program_type_alias(program)
+        self._target = target
+        self._program = program
+
+        source_binder = _PARAMETER_BINDERS.get(self._source)
+        target_binder = _PARAMETER_BINDERS.get(target)
+
+        if source_binder is None and target_binder is None:
+            raise ValueError(
+                f"Cannot bind parameters of '{self._source}' or '{target}' programs. "
+                f"Parameter binders are registered for: {set(_PARAMETER_BINDERS)}"
+            )
+
+        source_params = (
+            frozenset(source_binder.parameters(program)) if source_binder is not None else None
+        )
+        transpile_kwargs = {
+            "conversion_graph": conversion_graph,
+            "max_path_attempts": max_path_attempts,
+            "max_path_depth": max_path_depth,
+            **kwargs,
+        }
+
+        if target_binder is not None:
+            try:
+                compiled, path = _transpile_with_path(program, target, **transpile_kwargs)
+            except ProgramConversionError:
+                if source_binder is None:
+                    raise
+            else:
+                params = frozenset(target_binder.parameters(compiled))
+                if source_params is None or params == source_params:
+                    self._compiled, self._path = compiled, path
+                    self._binder, self._bind_target = target_binder, True
+                    self._parameters = params
+                    return
+
+        if source_binder is None:
+            raise ValueError(
+                f"Free parameters of '{self._source}' program could not be "
+                f"preserved when converting to '{target}'."
+            )
+
+        logger.info(
+            "Parameters cannot be bound after conversion from '%s' to '%s'; "
+            "binding before replaying the conversion path instead.",
+            self._source,
+            target,
+        )
+        probe = source_binder.bind(program, dict.fromkeys(source_params, 0.0))
+        _, self._path = _transpile_with_path(probe, target, **transpile_kwargs)
+        self._compiled = None
+        self._binder, self._bind_target = source_binder, False
+        self._parameters = source_params
+
+    @property
+    def source(self) -> str:
+        """Return the program type alias of the parametric program."""
+        return self._source
+
+    @property
+    def target(self) -> str:
+        """Return the program type alias of the bound programs."""
+        return self._target
+
+    @property
+    def parameters(self) -> list[str]:
+        """Return the sorted names of the free parameters that must be bound."""
+        return sorted(self._parameters)
+
+    @property
+    def path(self) -> list[Callable]:
+        """Return the conversion functions used to convert from source to target."""
+        return list(self._path)
+
+    def _validate(self, values: Mapping[str, Number]) -> None:
+        """Check that values are given for exactly the free parameters of the template."""
+        missing = self._parameters.difference(values)
+        if missing:
+            raise ValueError(f"Missing values for parameters: {sorted(missing)}")
+        unknown = set(values).difference(self._parameters)
+        if unknown:
+            raise ValueError(f"Unknown parameters: {sorted(unknown)}")
+
+    def bind(self, values: Mapping[str, Number]) -> qbraid.programs.QPROGRAM:
+        """Return the target program with the given parameter values substituted.
+
+        Args:
+            values (Mapping[str, int | float]): Value for each free parameter, by name.
+
+        Returns:
+            qbraid.programs.QPROGRAM: The bound program of the target type.
+
+        Raises:
+            ValueError: If values are missing for some parameters, or given for
+                parameters that the template does not have.
+        """
+        self._validate(values)
+        if self._bind_target:
+            return self._binder.bind(self._compiled, values)
+        bound = self._binder.bind(self._program, values)
+        return _run_conversion_path(bound, self._path)
+
+    def bind_many(self, values: Iterable[Mapping[str, Number]]) -> list[qbraid.programs.QPROGRAM]:
+        """Return a bound target program for each set of parameter values.
+
+        Args:
+            values (Iterable[Mapping[str, int | float]]): Sets of parameter values.
+
+        Returns:
+            list[qbraid.programs.QPROGRAM]: The bound programs, in the same order.
+        """
+        return [self.bind(params) for params in values]
+
+    def __repr__(self) -> str:
+        return (
+            f"ConversionTemplate(source='{self._source}', target='{self._target}', "
+            f"parameters={self.parameters})"
+        )
@@ -11,11 +11,35 @@
 """
 Takes in OpenQASM 3 code and outputs an ASCII circuit representation
 
+The program is parsed once into gates, which are packed into moments in a single
+pass. The character grid is allocated once, with a width bounded by the moment
+widths, and any window of its columns can be rendered.
+
 """
 
+from __future__ import annotations
+
 import re
+from typing import Optional
 
 import numpy as np
+from openqasm3.ast import (
+    AliasStatement,
+    BitType,
+    ClassicalDeclaration,
+    Expression,
+    Identifier,
+    IndexExpression,
+    QuantumGate,
+    QuantumMeasurementStatement,
+    QubitDeclaration,
+    RangeDefinition,
+    Span,
+)
+from openqasm3.parser import parse
+
+from qbraid._logging import logger
+from qbraid.passes.qasm.analyze import _broadcast, _qubit_indices, expression_value_option
 
 controlled_gates = [
     "cx",
@@ -131,6 +155,18 @@ class Gate:
         self.qregs = self.parse_qregs(line)
         self.cregs = self.parse_cregs(line)
 
+    @classmethod
+    def from_operation(cls, gate_type, params, registers, num_registers):
+        """Creates a gate from its type, parameters, (qregs, cregs) register indices and
+        (num_qregs, num_cregs) register counts"""
+        gate = cls.__new__(cls)
+        gate.gate_type = gate_type
+        gate.params = params
+        gate.num_qregs, gate.num_cregs = num_registers
+        gate.qregs = list(registers[0])
+        gate.cregs = list(registers[1])
+        return gate
+
     def parse_qregs(self, line):
         """Gets the quantum registers associated with the gate"""
         matches = re.findall(r"q\[.*?\]", line)
@@ -241,51 +277,56 @@ class Gate:
         return mat
 
 
-def get_collision(circuit, g):
-    """Gets the collision position of a gate"""
-    pos = circuit.shape[1] - 1
-    collision = False
+def get_collision(row_end, g):
+    """Gets the collision position of a gate from the last drawn column of each row"""
     reg_idxes = range(3 * min(g.qregs), 3 * (g.get_height() + min(g.qregs)))
-    while not collision and pos > 0:
-        for reg_idx in reg_idxes:
-            if circuit[reg_idx][pos] != " ":
-                collision = True
-                break
-        if collision:
-            break
-        pos -= 1
+    pos = int(row_end[reg_idxes.start : reg_idxes.stop].max(initial=-1))
 
-    if pos != 0:
-        pos += 3
+    if pos > 0:
+        return pos + 3, reg_idxes
 
-    return pos, reg_idxes
+    return 0, reg_idxes
 
 
 def add_gate(circuit, g, pos, reg_idxes):
     """Adds a gate to the circuit"""
+    circuit[reg_idxes.start : reg_idxes.stop, pos : pos + g.get_width()] = g.mat()
 
-    while pos + g.get_width() >= circuit.shape[1]:
-        circuit = np.concatenate(
-            [circuit, np.full((circuit.shape[0], circuit.shape[1]), " ", dtype=str)], axis=1
-        )
+    return circuit
 
-    circuit[reg_idxes, pos : pos + g.get_width()] = g.mat()
 
-    return circuit
+def update_row_end(circuit, row_end, reg_idxes, start, stop):
+    """Updates the last drawn column of the rows a gate was drawn over"""
+    rows = slice(reg_idxes.start, reg_idxes.stop)
+    drawn = circuit[rows, start:stop] != " "
+    has_drawn = drawn.any(axis=1)
+    last_drawn = start + drawn.shape[1] - 1 - np.argmax(drawn[:, ::-1], axis=1)
+    ends = row_end[rows]
+    row_end[rows] = np.where(ends >= stop, ends, np.where(has_drawn, last_drawn, ends))
+
+    # a gate drawn over an earlier gate of the same moment may have blanked its last column
+    for row in np.flatnonzero(~has_drawn & (ends >= start) & (ends < stop)) + reg_idxes.start:
+        earlier = np.flatnonzero(circuit[row, :start] != " ")
+        row_end[row] = earlier[-1] if earlier.size else -1
 
+    return row_end
 
-def add_moment(circuit, moment):
+
+def add_moment(circuit, row_end, moment):
     """Adds a moment to the circuit"""
-    collisions = [get_collision(circuit, g)[0] for g in moment]
+    collisions = [get_collision(row_end, g)[0] for g in moment]
     pos = max(collisions)
     widths = [g.get_width() for g in moment]
     max_w = max(widths)
 
     for g in moment:
-        _, reg_idxes = get_collision(circuit, g)
+        _, reg_idxes = get_collision(row_end, g)
         centered_moment_pos = pos + int((max_w - g.get_width()) / 2)
         circuit = add_gate(circuit, g, centered_moment_pos, reg_idxes)
         circuit = add_wires(circuit, g, g.num_qregs, centered_moment_pos)
+        row_end = update_row_end(
+            circuit, row_end, reg_idxes, centered_moment_pos, centered_moment_pos + g.get_width()
+        )
 
     return circuit
 
@@ -351,61 +392,155 @@ def extend_qregs(circuit, num_qregs, end_pos):
     """Extends the quantum registers to the end of the circuit"""
     for qreg in range(num_qregs):
         eol_regex = re.search(r"(\S)\s*$", "".join(circuit[3 * qreg + 1]))
-        eol_pos = eol_regex.regs[1][1]
+        eol_pos = eol_regex.regs[1][1] if eol_regex else 0
         circuit[3 * qreg + 1, eol_pos:end_pos] = ["-"] * (end_pos - eol_pos)
 
     return circuit
 
 
-def can_add_gate(m_qregs, m_cregs, gate):
-    """Checks if a gate can be added to a moment"""
-    if len(gate.qregs) != 0:
-        min_qreg = min(gate.qregs)
-        max_qreg = max(gate.qregs) if gate.gate_type not in q_c_reg_gates else gate.num_qregs
-        for qreg in range(min_qreg, max_qreg + 1):
-            if qreg in m_qregs:
-                return False
+def get_moments(gates):
+    """Splits up the circuit into moments in a single pass over the gates.
 
-    if len(gate.cregs) != 0:
-        min_creg = min(gate.cregs) if gate.gate_type not in q_c_reg_gates else 0
-        max_creg = max(gate.cregs)
-        for creg in range(min_creg, max_creg + 1):
-            if creg in m_cregs:
-                return False
+    Each gate goes in the moment after the latest earlier gate acting on a register
+    within its span, which packs gates like a greedy scan of the remaining gates.
+    """
+    moments = []
+    qreg_moments = {}
+    creg_moments = {}
+    for gate in gates:
+        moment_idx = 0
+        if len(gate.qregs) != 0:
+            min_qreg = min(gate.qregs)
+            max_qreg = max(gate.qregs) if gate.gate_type not in q_c_reg_gates else gate.num_qregs
+            for qreg in range(min_qreg, max_qreg + 1):
+                moment_idx = max(moment_idx, qreg_moments.get(qreg, -1) + 1)
+
+        if len(gate.cregs) != 0:
+            min_creg = min(gate.cregs) if gate.gate_type not in q_c_reg_gates else 0
+            max_creg = max(gate.cregs)
+            for creg in range(min_creg, max_creg + 1):
+                moment_idx = max(moment_idx, creg_moments.get(creg, -1) + 1)
+
+        for qreg in gate.qregs:
+            qreg_moments[qreg] = moment_idx
+        for creg in gate.cregs:
+            creg_moments[creg] = moment_idx
+
+        if moment_idx == len(moments):
+            moments.append([])
+        moments[moment_idx].append(gate)
+    return moments
 
-    return True
 
+def _statement_text(lines: list[str], span: Span) -> str:
+    """Returns the source text of a statement"""
+    if span.start_line == span.end_line:
+        return lines[span.start_line - 1][span.start_column : span.end_column + 1]
+    return "\n".join(
+        [lines[span.start_line - 1][span.start_column :]]
+        + lines[span.start_line : span.end_line - 1]
+        + [lines[span.end_line - 1][: span.end_column + 1]]
+    )
+
+
+def _alias_register(
+    value: Expression, registers: dict[str, tuple[int, int]]
+) -> Optional[tuple[int, int]]:
+    """Returns the offset and size of an alias of a register or a contiguous slice of one"""
+    if isinstance(value, Identifier):
+        return registers.get(value.name)
+    if not isinstance(value, IndexExpression) or not isinstance(value.collection, Identifier):
+        return None
+    if value.collection.name not in registers:
+        return None
+    if not isinstance(value.index, list) or len(value.index) != 1:
+        return None
+    if not isinstance(value.index[0], RangeDefinition):
+        return None
+
+    offset, size = registers[value.collection.name]
+    index = value.index[0]
+    start = 0 if index.start is None else expression_value_option(index.start)
+    end = size - 1 if index.end is None else expression_value_option(index.end)
+    step = 1 if index.step is None else expression_value_option(index.step)
+    if step != 1 or start is None or end is None or not 0 <= start <= end < size:
+        return None
+    return offset + start, end - start + 1
+
+
+def _gates_from_program(qasm_str: str) -> Optional[tuple[list[Gate], int, int]]:
+    """Gets the gates and register counts of a program from its syntax tree.
+
+    Returns None if the program cannot be parsed, or uses operands that cannot be
+    resolved statically.
+    """
+    try:
+        program = parse(qasm_str)
+    except Exception as err:  # pylint: disable=broad-exception-caught
+        logger.debug("Drawing OpenQASM program line by line: %s", err)
+        return None
+
+    lines = qasm_str.split("\n")
+    qubits: dict[str, tuple[int, int]] = {}
+    bits: dict[str, tuple[int, int]] = {}
+    num_qregs = 0
+    num_cregs = 0
+    operations = []
+    for statement in program.statements:
+        if isinstance(statement, QubitDeclaration):
+            size = 1 if statement.size is None else expression_value_option(statement.size)
+            if size is None:
+                return None
+            qubits[statement.qubit.name] = (num_qregs, size)
+            num_qregs += size
+
+        elif isinstance(statement, ClassicalDeclaration) and isinstance(statement.type, BitType):
+            size = (
+                1 if statement.type.size is None else expression_value_option(statement.type.size)
+            )
+            if size is None:
+                return None
+            bits[statement.identifier.name] = (num_cregs, size)
+            num_cregs += size
+
+        elif isinstance(statement, AliasStatement):
+            register = _alias_register(statement.value, qubits)
+            if register is None:
+                return None
+            qubits[statement.target.name] = register
+
+        elif isinstance(statement, QuantumGate):
+            gate_type = statement.name.name
+            if statement.modifiers or gate_type not in all_gates:
+                continue
+            params = None
+            if statement.arguments:
+                params = re.search(r"\(.*\)", _statement_text(lines, statement.span))[0][1:-1]
+            operands = [_qubit_indices(qubit, qubits) for qubit in statement.qubits]
+            for _, _, qregs in _broadcast(gate_type, (), operands):
+                operations.append((gate_type, params, qregs, ()))
+
+        elif isinstance(statement, QuantumMeasurementStatement):
+            if statement.target is None:
+                return None
+            qregs = _qubit_indices(statement.measure.qubit, qubits)
+            cregs = _qubit_indices(statement.target, bits)
+            if len(qregs) != len(cregs):
+                return None
+            operations.extend(("m", None, (qreg,), (creg,)) for qreg, creg in zip(qregs, cregs))
 
-def get_moments(gates):
-    """Splits up the circuit into moments"""
-    moments = []
-    while gates != []:
-        gate = gates.pop(0)
-        moment = [gate]
-        m_qregs = list(gate.qregs)
-        m_cregs = list(gate.cregs)
-        gate_idx = 0
-        while gate_idx < len(gates):
-            gate = gates[gate_idx]
-            if can_add_gate(m_qregs, m_cregs, gate):
-                moment.append(gates.pop(gate_idx))
-                gate_idx -= 1
-
-            for qreg in gate.qregs:
-                m_qregs.append(qreg)
-            for creg in gate.cregs:
-                m_cregs.append(creg)
-
-            gate_idx += 1
-        moments.append(moment)
-    return moments
+    gates = []
+    for gate_type, params, qregs, cregs in operations:
+        if any(isinstance(reg, str) for reg in qregs + cregs):
+            return None
+        gates.append(Gate.from_operation(gate_type, params, (qregs, cregs), (num_qregs, num_cregs)))
 
+    return gates, num_qregs, num_cregs
 
-def _qasm3_drawer(qasm_str: str) -> str:
-    """Iterates over the input string and returns the gates"""
+
+def _gates_from_lines(qasm_str: str) -> tuple[list[Gate], int, int]:
+    """Gets the gates and register counts of a program line by line"""
     num_qregs, num_cregs = get_circuit_height(qasm_str)
-    height = (num_qregs + num_cregs) * 3
-    circuit = np.full((height, 50), " ", dtype=str)
 
     gates = []
     for line in qasm_str.split("\n"):
@@ -415,27 +550,42 @@ def _qasm3_drawer(qasm_str: str) -> str:
             g = Gate(line, num_qregs, num_cregs)
             gates.append(g)
 
+    return gates, num_qregs, num_cregs
+
+
+def _qasm3_grid(qasm_str: str) -> tuple[np.ndarray, int, int]:
+    """Draws the circuit into a character grid trimmed to the drawn columns"""
+    program = _gates_from_program(qasm_str)
+    gates, num_qregs, num_cregs = program if program is not None else _gates_from_lines(qasm_str)
+
     moments = get_moments(gates)
-    for moment in moments:
-        circuit = add_moment(circuit, moment)
 
-    #    circuit, pos = add_gate(circuit, g)
-    #    circuit = add_wires(circuit, g, num_qregs, pos)
+    # every moment starts at most 3 columns after the end of the moments before it
+    width = sum(max(g.get_width() for g in moment) + 2 for moment in moments) + 1
+    height = (num_qregs + num_cregs) * 3
+    circuit = np.full((height, width), " ", dtype=str)
+    row_end = np.full(height, -1)
+
+    for moment in moments:
+        circuit = add_moment(circuit, row_end, moment)
 
-    end_pos = circuit.shape[1]
-    while np.all(circuit[:, end_pos - 1] == [" "] * circuit.shape[0]):
-        end_pos -= 1
-    end_pos += 1
+    end_pos = int(row_end.max(initial=-1)) + 2
+    circuit = circuit[:, :end_pos]
 
     circuit = add_cregs(circuit, num_cregs, end_pos)
     circuit = extend_qregs(circuit, num_qregs, end_pos)
 
+    return circuit, num_qregs, num_cregs
+
+
+def _render(circuit, num_qregs, start=0, stop=None):
+    """Renders the columns start to stop of a character grid, with register labels"""
     padding = 5
 
-    out = ""
+    out = []
     reg_idx = 0
     is_q_reg = True
-    for row_idx, _ in enumerate(circuit):
+    for row_idx, row in enumerate(circuit[:, start:stop]):
         line = ""
         if row_idx % 3 == 1:
             if reg_idx < num_qregs and is_q_reg:
@@ -449,13 +599,44 @@ def _qasm3_drawer(qasm_str: str) -> str:
             reg_idx += 1
         else:
             line += " " * padding
-        line += "".join(circuit[row_idx]).rstrip() + "\n"
+        line += "".join(row).rstrip()
         if line.strip() != "":
-            out += line
-
-    return out[:-1]
-
-
-def qasm3_drawer(qasm_str: str) -> None:
-    """Draws the circuit from the input string"""
-    print(_qasm3_drawer(qasm_str))
+            out.append(line)
+
+    return "\n".join(out)
+
+
+def _qasm3_drawer(qasm_str: str, start: int = 0, stop: Optional[int] = None) -> str:
+    """Returns the drawing of the circuit, or of its columns start to stop"""
+    circuit, num_qregs, _ = _qasm3_grid(qasm_str)
+    return _render(circuit, num_qregs, start, stop)
+
+
+def qasm3_drawer(
+    qasm_str: str,
+    start: int = 0,
+    stop: Optional[int] = None,
+    page_width: Optional[int] = None,
+) -> None:
+    """Draws the circuit from the input string
+
+    Args:
+        qasm_str (str): The OpenQASM 3 program.
+        start (int): First column of the circuit to draw, not counting register labels.
+        stop (Optional[int]): Column at which to stop drawing. Defaults to the circuit end.
+        page_width (Optional[int]): If given, draws the columns in pages of this width.
+    """
+    if page_width is None:
+        print(_qasm3_drawer(qasm_str, start, stop))
+        return
+
+    if page_width < 1:
+        raise ValueError(f"Page width must be a positive integer, got {page_width}.")
+
+    circuit, num_qregs, _ = _qasm3_grid(qasm_str)
+    stop = circuit.shape[1] if stop is None else min(stop, circuit.shape[1])
+    pages = (
+        _render(circuit, num_qregs, page_start, min(page_start + page_width, stop))
+        for page_start in range(start, stop, page_width)
+    )
+    print("\n\n".join(pages))
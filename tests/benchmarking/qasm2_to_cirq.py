@@ -0,0 +1,72 @@
+# Copyright (C) 2024 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Benchmarking OpenQASM 2 to Cirq parsing throughput (lines per second)
+
+Compares the hand-written recursive-descent front end against the PLY-based QasmParser.
+
+"""
+from time import perf_counter
+
+import numpy as np
+
+from qbraid.transpiler.conversions.qasm2 import cirq_qasm_fast_parser
+from qbraid.transpiler.conversions.qasm2.cirq_qasm_parser import QasmParser
+
+
+def random_qasm2(num_qubits: int, num_lines: int, seed: int = 0) -> str:
+    """Return an OpenQASM 2 program of random one- and two-qubit gates and measurements."""
+    rng = np.random.default_rng(seed)
+    lines = [
+        "OPENQASM 2.0;",
+        'include "qelib1.inc";',
+        f"qreg q[{num_qubits}];",
+        f"creg c[{num_qubits}];",
+    ]
+    for _ in range(num_lines):
+        choice = rng.random()
+        if choice < 0.3:
+            control, target = rng.choice(num_qubits, size=2, replace=False)
+            lines.append(f"cx q[{control}],q[{target}];")
+        elif choice < 0.6:
+            gate = rng.choice(["rx", "ry", "rz"])
+            numerator, denominator = rng.integers(1, 8, size=2)
+            lines.append(f"{gate}({numerator}*pi/{denominator}) q[{rng.integers(num_qubits)}];")
+        elif choice < 0.95:
+            gate = rng.choice(["h", "x", "s", "t", "sdg"])
+            lines.append(f"{gate} q[{rng.integers(num_qubits)}];")
+        else:
+            qubit = rng.integers(num_qubits)
+            lines.append(f"measure q[{qubit}] -> c[{qubit}];")
+    return "\n".join(lines)
+
+
+def lines_per_second(func, qasm: str, repeat: int = 3) -> float:
+    """Return the best throughput of func over several runs."""
+    num_lines = qasm.count("\n") + 1
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        func(qasm)
+        best = min(best, perf_counter() - start)
+    return num_lines / best
+
+
+for lines in [100, 1000, 10000]:
+    program_qasm = random_qasm2(num_qubits=20, num_lines=lines)
+
+    fast = lines_per_second(cirq_qasm_fast_parser.parse, program_qasm)
+    ply = lines_per_second(lambda qasm: QasmParser().parse(qasm), program_qasm)
+
+    print(
+        f"{lines:>6} lines: {fast:>10.0f} lines/s (recursive descent), "
+        f"{ply:>10.0f} lines/s (PLY), speedup {fast / ply:.1f}x"
+    )
@@ -0,0 +1,80 @@
+# Copyright (C) 2024 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Benchmarking OpenQASM to IonQ JSON conversion throughput (gates per second)
+
+Compares the single-pass AST converter against the previous approach, which parsed the
+program several times and evaluated each rotation angle from its text with regular
+expressions.
+
+"""
+from time import perf_counter
+
+import numpy as np
+from openqasm3.ast import QuantumGate
+
+from qbraid.passes.qasm.analyze import has_measurements
+from qbraid.passes.qasm.compat import convert_qasm_pi_to_decimal
+from qbraid.programs import load_program
+from qbraid.transpiler.conversions.openqasm3.openqasm3_to_ionq import (
+    extract_params,
+    openqasm3_to_ionq,
+)
+
+
+def random_qasm3(num_qubits: int, num_gates: int, seed: int = 0) -> str:
+    """Return an OpenQASM 3 program of random rotations and CNOTs written in terms of pi."""
+    rng = np.random.default_rng(seed)
+    lines = ["OPENQASM 3.0;", 'include "stdgates.inc";', f"qubit[{num_qubits}] q;"]
+    for _ in range(num_gates):
+        if rng.random() < 0.3:
+            control, target = rng.choice(num_qubits, size=2, replace=False)
+            lines.append(f"cx q[{control}], q[{target}];")
+        else:
+            gate = rng.choice(["rx", "ry", "rz"])
+            numerator, denominator = rng.integers(1, 8, size=2)
+            qubit = rng.integers(num_qubits)
+            lines.append(f"{gate}({numerator} * pi / {denominator}) q[{qubit}];")
+    return "\n".join(lines)
+
+
+def previous_path(qasm: str) -> list[float]:
+    """Repeat the parsing work done per program by the previous converter."""
+    has_measurements(qasm)
+    program = load_program(qasm)
+    _ = program.num_qubits
+    return [
+        float(convert_qasm_pi_to_decimal(extract_params(statement)[0]))
+        for statement in program.parsed().statements
+        if isinstance(statement, QuantumGate) and statement.arguments
+    ]
+
+
+def gates_per_second(func, qasm: str, num_gates: int, repeat: int = 3) -> float:
+    """Return the best throughput of func over several runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        func(qasm)
+        best = min(best, perf_counter() - start)
+    return num_gates / best
+
+
+for num_gates in [100, 1000, 5000]:
+    program_qasm = random_qasm3(num_qubits=20, num_gates=num_gates)
+
+    current = gates_per_second(openqasm3_to_ionq, program_qasm, num_gates)
+    previous = gates_per_second(previous_path, program_qasm, num_gates)
+
+    print(
+        f"{num_gates:>6} gates: {current:>10.0f} gates/s (single pass), "
+        f"{previous:>10.0f} gates/s (previous), speedup {current / previous:.1f}x"
+    )
@@ -250,3 +250,48 @@ h q[1];
 """
     qasm_out = unfold_qasm2(qasm_in)
     assert strings_equal(qasm_out, expected_out)
+
+
+def test_unfold_qasm2_compound_param_values():
+    """Test unfolding gate with compound parameter values and custom qubit and register names"""
+
+    qasm_in = """
+OPENQASM 2.0;
+include "qelib1.inc";
+gate g(a,b) x,y { rz(a*b) x; u3(a,-b,2*a) y; }
+qreg r[2];
+g(pi/2,0.1+0.2) r[0],r[1];
+"""
+    expected_out = """
+OPENQASM 2.0;
+include "qelib1.inc";
+qreg r[2];
+rz((pi/2)*(0.1+0.2)) r[0];
+u3(pi/2,-(0.1+0.2),2*(pi/2)) r[1];
+"""
+    qasm_out = unfold_qasm2(qasm_in)
+    assert strings_equal(qasm_out, expected_out)
+
+
+def test_unfold_qasm2_parameter_name_prefix():
+    """Test that unfolding only substitutes whole parameter and qubit names"""
+
+    qasm_in = """
+OPENQASM 2.0;
+include "qelib1.inc";
+gate g(p,p1) q1,q10 { rz(p1) q10; rx(p) q1; }
+qreg q[11];
+g(0.5,1.5) q[10],q[1];
+g(0.5,1.5) q[2],q[3];
+"""
+    expected_out = """
+OPENQASM 2.0;
+include "qelib1.inc";
+qreg q[11];
+rz(1.5) q[1];
+rx(0.5) q[10];
+rz(1.5) q[3];
+rx(0.5) q[2];
+"""
+    qasm_out = unfold_qasm2(qasm_in)
+    assert strings_equal(qasm_out, expected_out)
@@ -18,12 +18,20 @@ Unit tests for QASM transform to basic gates
 from unittest.mock import MagicMock
 
 import pytest
-from openqasm3 import ast
+from openqasm3 import ast, dumps
 from openqasm3.parser import parse
 
 from qbraid.passes.exceptions import CompilationError, QasmDecompositionError
 from qbraid.passes.qasm.compat import normalize_qasm_gate_params
-from qbraid.passes.qasm.decompose import assert_gates_in_basis, decompose_qasm3, rebase
+from qbraid.passes.qasm.decompose import (
+    assert_gates_in_basis,
+    decompose,
+    decompose_qasm3,
+    get_decomposition_rules,
+    rebase,
+    register_decomposition_rule,
+    unregister_decomposition_rule,
+)
 from qbraid.programs.gate_model.qasm3 import OpenQasm3Program
 
 
@@ -248,3 +256,114 @@ def test_transform_from_device_gateset(qasm_crx_program: str, qasm_crx_decompose
     program.transform(device=device)
     expected = normalize_qasm_gate_params(qasm_crx_decomposed).strip()
     assert program.program == expected
+
+
+def _decompose_swap(gate: ast.QuantumGate) -> list[ast.Statement]:
+    """Decompose a swap gate into three cx gates."""
+    a, b = gate.qubits
+    return [
+        ast.QuantumGate(modifiers=[], name=ast.Identifier("cx"), arguments=[], qubits=[a, b]),
+        ast.QuantumGate(modifiers=[], name=ast.Identifier("cx"), arguments=[], qubits=[b, a]),
+        ast.QuantumGate(modifiers=[], name=ast.Identifier("cx"), arguments=[], qubits=[a, b]),
+    ]
+
+
+def test_register_decomposition_rule():
+    """Test that user-registered decomposition rules are applied by rebase."""
+    qasm = """
+OPENQASM 3.0;
+include "stdgates.inc";
+qubit[2] q;
+swap q[0], q[1];
+"""
+    expected = """OPENQASM 3.0;
+include "stdgates.inc";
+qubit[2] q;
+cx q[0], q[1];
+cx q[1], q[0];
+cx q[0], q[1];
+"""
+    register_decomposition_rule("swap", _decompose_swap)
+    try:
+        assert "swap" in get_decomposition_rules()
+        assert rebase(qasm, {"cx"}) == expected
+        with pytest.raises(ValueError):
+            register_decomposition_rule("swap", _decompose_swap)
+    finally:
+        unregister_decomposition_rule("swap")
+
+    assert "swap" not in get_decomposition_rules()
+
+
+def test_decomposition_rule_cached_per_template():
+    """Test that a rule runs once per (gate, parameters) signature and substitutes qubits."""
+    rule = MagicMock(side_effect=_decompose_swap)
+    register_decomposition_rule("swap", rule)
+    try:
+        program = parse(
+            """
+OPENQASM 3.0;
+include "stdgates.inc";
+qubit[3] q;
+swap q[0], q[1];
+swap q[1], q[2];
+swap q[2], q[0];
+"""
+        )
+        decomposed = decompose(program, {"cx"})
+    finally:
+        unregister_decomposition_rule("swap")
+
+    assert rule.call_count == 1
+    qubit_indices = [
+        [qubit.indices[0][0].value for qubit in gate.qubits] for gate in decomposed.statements[2:]
+    ]
+    assert qubit_indices == [
+        [0, 1], [1, 0], [0, 1], [1, 2], [2, 1], [1, 2], [2, 0], [0, 2], [2, 0]
+    ]  # fmt: skip
+
+
+def test_decomposition_cache_distinguishes_parameters():
+    """Test that gates with different parameter expressions get separate decompositions."""
+    program = parse(
+        """
+OPENQASM 3.0;
+include "stdgates.inc";
+qubit[2] q;
+crz(pi) q[0], q[1];
+crz(pi / 2) q[1], q[0];
+crz(pi) q[1], q[0];
+"""
+    )
+    decomposed = dumps(decompose(program, {"rz", "cx"}))
+    assert decomposed.count("rz(pi / 2) q[1];") == 1
+    assert decomposed.count("rz(pi / 2 / 2) q[0];") == 1
+    assert decomposed.count("rz(pi / 2) q[0];") == 1
+
+
+def test_decomposition_cache_does_not_share_argument_nodes():
+    """Test that gates instantiated from a cached template own their argument expressions."""
+    program = parse(
+        """
+OPENQASM 3.0;
+include "stdgates.inc";
+qubit[2] q;
+crz(pi) q[0], q[1];
+crz(pi) q[1], q[0];
+"""
+    )
+    decomposed = decompose(program, {"rz", "cx"})
+    arguments = [
+        id(argument)
+        for statement in decomposed.statements
+        if isinstance(statement, ast.QuantumGate)
+        for argument in statement.arguments
+    ]
+    assert len(arguments) == 4
+    assert len(set(arguments)) == len(arguments)
+    assert all(
+        id(argument) not in set(arguments)
+        for statement in program.statements
+        if isinstance(statement, ast.QuantumGate)
+        for argument in statement.arguments
+    )
@@ -0,0 +1,119 @@
+# Copyright (C) 2024 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Unit tests for safe constant folding of OpenQASM expressions
+
+"""
+import math
+
+import pytest
+from openqasm3.parser import parse
+
+from qbraid.passes.qasm.compat import convert_qasm_pi_to_decimal, simplify_arithmetic_expressions
+from qbraid.passes.qasm.expressions import _evaluate_cached, evaluate_expression, fold_expression
+
+
+@pytest.mark.parametrize(
+    "expression, expected",
+    [
+        ("3 * pi / 4", 3 * math.pi / 4),
+        ("-pi", -math.pi),
+        ("2 ** 3", 8),
+        ("1 + 2 * 3", 7),
+        ("7 % 4", 3),
+        ("tau / 2", math.pi),
+        ("π", math.pi),
+        ("sin(pi / 2)", 1.0),
+        ("sqrt(4) + arccos(1)", 2.0),
+        ("pow(2, 10)", 1024),
+        ("euler", math.e),
+    ],
+)
+def test_evaluate_expression(expression, expected):
+    """Test evaluating supported constant expressions."""
+    assert evaluate_expression(expression) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "__import__('os').system('echo unsafe')",
+        "theta / 2",
+        "(1).__class__",
+        "[1, 2]",
+        "1 / 0",
+        "(-1) ** 0.5",
+        "9 ** 9 ** 9",
+        "sqrt(-1)",
+        "1*",
+        "True + 1",
+        "'pi'",
+    ],
+)
+def test_evaluate_expression_rejects_unsupported(expression):
+    """Test that unsupported or unsafe expressions raise ValueError without being executed."""
+    with pytest.raises(ValueError):
+        evaluate_expression(expression)
+
+
+def test_evaluate_expression_is_memoized():
+    """Test that repeated expression strings are served from the memo table."""
+    _evaluate_cached.cache_clear()
+    evaluate_expression("pi / 8")
+    evaluate_expression("pi / 8")
+    info = _evaluate_cached.cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+
+
+@pytest.mark.parametrize(
+    "expression, expected",
+    [
+        ("pi / 2 + 0.5 * 2", math.pi / 2 + 1),
+        ("-cos(pi)", 1.0),
+        ("2 ** -1", 0.5),
+        ("theta * 2", None),
+        ("rand(1)", None),
+        ("1 / 0", None),
+    ],
+)
+def test_fold_expression(expression, expected):
+    """Test folding constant openqasm3 AST expressions."""
+    program = parse(f"OPENQASM 3.0;\nqubit q;\ninput float theta;\nrz({expression}) q;")
+    value = fold_expression(program.statements[-1].arguments[0])
+    if expected is None:
+        assert value is None
+    else:
+        assert value == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    "qasm, expected",
+    [
+        ("primeN*pi/4", f"primeN*{math.pi / 4}"),
+        ("3*2-pi", f"3*2-{math.pi}"),
+        ("1/2*pi", f"1/2*{math.pi}"),
+        ("2**pi/4", f"2**{math.pi}/4"),
+        ("x-pi+2", f"x-{math.pi}+2"),
+        ("1-2*pi", f"1-{2 * math.pi}"),
+        ("pi_gate q[0];", "pi_gate q[0];"),
+        ("x2pi q[0];", "x2pi q[0];"),
+    ],
+)
+def test_convert_qasm_pi_to_decimal_preserves_precedence(qasm, expected):
+    """Test that pi conversion only folds arithmetic when operator precedence allows it."""
+    assert convert_qasm_pi_to_decimal(qasm) == expected
+
+
+def test_simplify_arithmetic_expressions_division_by_zero():
+    """Test that parenthesized expressions that cannot be evaluated are left unchanged."""
+    assert simplify_arithmetic_expressions("rx(1/0) q[0];") == "rx(1/0) q[0];"
+    assert simplify_arithmetic_expressions("rx(1+2) q[0];") == "rx(3) q[0];"
@@ -0,0 +1,134 @@
+# Copyright (C) 2024 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Unit tests for the QASM AST pass manager
+
+"""
+import pytest
+from openqasm3 import parse
+from openqasm3.ast import Program, QuantumGate
+
+from qbraid.passes.qasm import QasmPassManager, register_qasm_pass
+from qbraid.passes.qasm.pipeline import _QASM_PASSES, get_qasm_passes
+
+QASM3_PROGRAM = """
+OPENQASM 3.0;
+include "stdgates.inc";
+qubit[2] q;
+bit[2] c;
+rx(pi/2 + 0.5*2) q[0];
+barrier q;
+cnot q[0], q[1];
+if (c[0]) {
+  barrier q;
+  rz(-pi) q[1];
+}
+c = measure q;
+"""
+
+
+def _strip(qasm: str) -> str:
+    """Remove all whitespace from a QASM string."""
+    return "".join(qasm.split())
+
+
+def test_pass_manager_runs_passes_in_sequence():
+    """Test that registered passes are applied in order to a single parsed program."""
+    manager = QasmPassManager(["remove_barriers", "fold_gate_params", "remove_measurements"])
+    manager.append("replace_gate_names", gate_mappings={"cnot": "cx"})
+
+    expected = """
+    OPENQASM 3.0;
+    include "stdgates.inc";
+    qubit[2] q;
+    bit[2] c;
+    rx(2.5707963267948966) q[0];
+    cx q[0], q[1];
+    if (c[0]) {
+      rz(-3.141592653589793) q[1];
+    }
+    """
+    assert _strip(manager.run(QASM3_PROGRAM)) == _strip(expected)
+    assert manager.passes == [
+        "remove_barriers",
+        "fold_gate_params",
+        "remove_measurements",
+        "replace_gate_names",
+    ]
+
+
+def test_pass_manager_reports_timings():
+    """Test that the time spent in parsing, each pass, and dumping is recorded."""
+    manager = QasmPassManager()
+    assert manager.report() == "No passes have been run."
+
+    manager.append("remove_barriers").append(lambda program: None, name="noop")
+    manager.run(QASM3_PROGRAM)
+
+    assert list(manager.timings) == ["parse", "remove_barriers", "noop", "dump"]
+    assert all(elapsed >= 0 for elapsed in manager.timings.values())
+    report = manager.report()
+    for name in ("parse", "remove_barriers", "noop", "dump", "total"):
+        assert name in report
+
+
+def test_pass_manager_qasm2_declarations():
+    """Test that OpenQASM 2 programs are dumped with qreg and creg declarations."""
+    qasm2 = 'OPENQASM 2.0;\ninclude "qelib1.inc";\nqreg q[2];\nu3(pi, -pi/2, 2*pi) q[0];'
+    qasm_out = QasmPassManager(["fold_gate_params"]).run(qasm2)
+    assert "qreg q[2];" in qasm_out
+    assert "u3(3.141592653589793, -1.5707963267948966, 6.283185307179586) q[0];" in qasm_out
+
+
+def test_fold_gate_params_keeps_symbolic_expressions():
+    """Test that gate arguments referencing non-constant identifiers are left unchanged."""
+    qasm3 = """
+    OPENQASM 3.0;
+    qubit q;
+    input float theta;
+    gate g(a) x { rz(a * 2) x; }
+    rz(theta / 2) q;
+    """
+    qasm_out = QasmPassManager(["fold_gate_params"]).run(qasm3)
+    assert "rz(a * 2) x;" in qasm_out
+    assert "rz(theta / 2) q;" in qasm_out
+
+
+def test_pass_manager_accepts_parsed_program_and_returned_programs():
+    """Test running passes that return new programs on an already parsed program."""
+
+    def drop_gates(program: Program) -> Program:
+        statements = [stmt for stmt in program.statements if not isinstance(stmt, QuantumGate)]
+        return Program(statements=statements, version=program.version)
+
+    manager = QasmPassManager([drop_gates])
+    program = manager.run_ast(parse(QASM3_PROGRAM))
+    assert not any(isinstance(stmt, QuantumGate) for stmt in program.statements)
+    assert "parse" not in manager.timings
+
+
+def test_register_qasm_pass():
+    """Test registering a custom pass and rejecting duplicate names."""
+    register_qasm_pass("test_noop", lambda program: None)
+    try:
+        assert "test_noop" in get_qasm_passes()
+        assert QasmPassManager(["test_noop"]).passes == ["test_noop"]
+        with pytest.raises(ValueError):
+            register_qasm_pass("test_noop", lambda program: None)
+        register_qasm_pass("test_noop", lambda program: program, overwrite=True)
+    finally:
+        _QASM_PASSES.pop("test_noop", None)
+
+
+def test_pass_manager_unregistered_pass():
+    """Test that referencing an unregistered pass name raises a ValueError."""
+    with pytest.raises(ValueError):
+        QasmPassManager(["not_a_pass"])
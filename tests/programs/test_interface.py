@@ -12,12 +12,17 @@
 Unit tests for interfacing quantum programs
 
 """
+import numpy as np
 import pytest
 
 from qbraid._version import __version__
 from qbraid.interface import circuits_allclose, random_circuit
 from qbraid.interface.random.cirq_random import _cirq_random
-from qbraid.interface.random.qasm3_random import _qasm3_random
+from qbraid.interface.random.qasm3_random import (
+    _qasm3_random,
+    qasm3_random_batch,
+    qasm3_random_stream,
+)
 from qbraid.interface.random.qiskit_random import _qiskit_random
 from qbraid.programs.exceptions import QbraidError
 from qbraid.transpiler import ConversionGraph, transpile
@@ -75,6 +80,41 @@ def test_qasm3_zero_value_raises_for_max_operands(param):
         _qasm3_random(max_operands=0)
 
 
+def test_qasm3_random_stream_matches_program():
+    """Test that the streamed chunks join to the same program as _qasm3_random."""
+    chunks = list(qasm3_random_stream(num_qubits=5, depth=4, max_operands=3, seed=7, measure=True))
+    assert len(chunks) == 4 + 3
+    assert "".join(chunks) == _qasm3_random(5, 4, max_operands=3, seed=7, measure=True)
+
+
+def test_qasm3_random_does_not_use_global_state():
+    """Test that seeded generation is reproducible and leaves the global numpy state alone."""
+    np.random.seed(0)
+    state = np.random.get_state()
+    first = _qasm3_random(seed=123)
+    assert np.array_equal(np.random.get_state()[1], state[1])
+    np.random.seed(1)
+    assert _qasm3_random(seed=123) == first
+
+
+def test_qasm3_random_batch():
+    """Test that each program in a batch matches _qasm3_random with its recorded seed."""
+    batch = qasm3_random_batch(4, num_qubits=3, depth=5, max_operands=2, seed=11, measure=True)
+    assert batch == qasm3_random_batch(
+        4, num_qubits=3, depth=5, max_operands=2, seed=11, measure=True
+    )
+    assert len(set(batch)) == 4
+    for program in batch:
+        seed = int(program.split("seed = ")[1].split()[0])
+        assert program == _qasm3_random(3, 5, max_operands=2, seed=seed, measure=True)
+
+
+def test_qasm3_random_batch_raises_for_bad_size():
+    """Test that a negative number of circuits raises a ValueError."""
+    with pytest.raises(ValueError):
+        qasm3_random_batch(-1)
+
+
 @pytest.mark.parametrize("package", ["qiskit", "cirq"])
 def test_random_circuit_raises_for_bad_params(package: str, available_targets):
     """Test that _cirq_random raises a QbraidError for invalid parameters."""
@@ -173,10 +173,10 @@ def ahs_fixture(request):
     raise ValueError("Unsupported fixture")
 
 
-@pytest.fixture
-def encoder() -> BraketAHSEncoder:
-    """Return a BraketAHSEncoder object."""
-    return BraketAHSEncoder()
+@pytest.fixture(params=[False, True], ids=["decimal", "numeric"])
+def encoder(request) -> BraketAHSEncoder:
+    """Return a BraketAHSEncoder object for the decimal string and numeric array encodings."""
+    return BraketAHSEncoder(numeric=request.param)
 
 
 @pytest.fixture
@@ -223,6 +223,17 @@ def test_ahs_serialization(
     assert ahs_fixture.to_ir() == ahs_reconstructed.to_ir()
 
 
+def test_numeric_encoding_dtypes(ahs_program_local_detuning):
+    """Test that the numeric encoding stores float64 coordinates and an int8 filling."""
+    data = BraketAHSEncoder(numeric=True).encode_ahs(ahs_program_local_detuning)
+    register = data["register"]
+    assert register["sites"].dtype == np.float64 and register["sites"].shape == (3, 2)
+    assert register["filling"].dtype == np.int8
+    magnitude = data["hamiltonian"]["localDetuning"][0]["magnitude"]
+    assert magnitude["time_series"]["times"].dtype == np.float64
+    assert magnitude["pattern"].dtype == np.float64
+
+
 def test_decode_time_series_raises_for_length_mismatch(decoder: BraketAHSDecoder):
     """Test that decoding a TimeSeries with mismatched lengths raises a ValueError."""
     with pytest.raises(ValueError):
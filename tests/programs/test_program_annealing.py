@@ -15,6 +15,7 @@ Unit tests for qbraid.programs.annealing module.
 import json
 from unittest.mock import Mock
 
+import numpy as np
 import pytest
 
 try:
@@ -27,6 +28,7 @@ try:
         ProblemEncoder,
         ProblemType,
         QuboProblem,
+        SparseProblem,
     )
     from qbraid.programs.annealing.cpp_pyqubo import PyQuboModel
     from qbraid.programs.annealing.qubo import QuboProgram
@@ -301,3 +303,156 @@ def test_pyqubo_model_transform(pyqubo_model):
     program = PyQuboModel(pyqubo_model)
     program.transform(device=Mock())
     assert program.program == pyqubo_model
+
+
+def test_sparse_problem_round_trip():
+    """Test that a SparseProblem indexes variables by first appearance and converts back."""
+    problem = Problem(
+        problem_type=ProblemType.ISING,
+        linear={"b": 1.0, "a": -0.5},
+        quadratic={("a", "c"): 0.25, ("c", "b"): 2.0},
+    )
+    sparse = SparseProblem.from_problem(problem)
+
+    assert sparse.labels == ("b", "a", "c")
+    assert sparse.index == {"b": 0, "a": 1, "c": 2}
+    assert sparse.num_variables() == problem.num_variables() == 3
+    assert sparse.quadratic_row.tolist() == [1, 2]
+    assert sparse.quadratic_col.tolist() == [2, 0]
+    assert sparse.to_problem() == problem
+    assert sparse.to_json() == json.dumps(problem, cls=ProblemEncoder)
+    assert json.dumps(sparse, cls=ProblemEncoder) == sparse.to_json()
+
+
+@pytest.mark.parametrize(
+    "problem",
+    [
+        Problem(problem_type=ProblemType.QUBO),
+        Problem(problem_type=ProblemType.QUBO, linear={"x": 1.5}),
+        QuboProblem({("x", "x"): -1.0, ("x", "y\u00e9"): 0.1}),
+    ],
+)
+def test_sparse_problem_to_json_matches_encoder(problem):
+    """Test that the sparse JSON payload matches the ProblemEncoder payload."""
+    assert SparseProblem.from_problem(problem).to_json() == json.dumps(problem, cls=ProblemEncoder)
+
+
+@pytest.mark.parametrize(
+    "coefficients, fragment",
+    [
+        ({("a", "b"): 2, ("a", "a"): -1}, ": 2, "),
+        ({("a", "b"): float("inf"), ("b", "b"): float("nan"), ("a", "a"): 3}, ": NaN, "),
+    ],
+)
+def test_annealing_program_to_json_matches_encoder(coefficients, fragment):
+    """Test that program payloads keep integer and non-finite coefficients as json encodes them."""
+    payload = QuboProgram(coefficients).to_json()
+    assert payload == json.dumps(QuboProblem(coefficients), cls=ProblemEncoder)
+    assert fragment in payload
+    assert json.loads(payload)["problem_type"] == "qubo"
+
+
+def test_sparse_problem_to_json_non_finite():
+    """Test that non-finite sparse coefficients are written as valid JSON for the json module."""
+    problem = QuboProblem({("a", "b"): float("inf"), ("b", "b"): float("-inf"), ("a", "a"): 2})
+    sparse = SparseProblem.from_problem(problem)
+    payload = sparse.to_json()
+    assert payload == json.dumps(sparse.to_problem(), cls=ProblemEncoder)
+    assert "Infinity" in payload and "-Infinity" in payload
+    assert (
+        json.loads(payload)["quadratic"]
+        == json.loads(json.dumps(problem, cls=ProblemEncoder))["quadratic"]
+    )
+
+
+def test_sparse_problem_energies(pyqubo_model):
+    """Test that batched energies match the pyqubo energy of each sample, up to the offset."""
+    sparse = PyQuboModel(pyqubo_model).to_sparse()
+    _, offset = pyqubo_model.to_qubo()
+    rng = np.random.default_rng(0)
+    samples = rng.integers(0, 2, size=(20, sparse.num_variables()))
+
+    energies = sparse.energies(samples, chunk_size=7)
+    expected = [
+        pyqubo_model.energy(dict(zip(sparse.labels, sample.tolist())), vartype="BINARY") - offset
+        for sample in samples
+    ]
+    assert np.allclose(energies, expected)
+    assert sparse.energies(samples[3]) == energies[3]
+
+    with pytest.raises(ValueError):
+        sparse.energies(samples[:, :2])
+
+
+def test_pyqubo_model_caches_problem(pyqubo_model):
+    """Test that the compiled problem and its sparse form are reused."""
+    program = PyQuboModel(pyqubo_model)
+    problem = program.to_problem()
+    sparse = program.to_sparse()
+
+    assert program.to_problem() is problem
+    assert program.to_sparse() is sparse
+    assert program.num_qubits == 4
+    assert program.to_problem(feed_dict={}) is not problem
+
+
+def test_qubo_program_caches_problem():
+    """Test that the problem of a QuboProgram and its sparse form are reused."""
+    program = QuboProgram({("x1", "x2"): 0.5, ("x2", "x3"): 1.0})
+    problem = program.to_problem()
+    sparse = program.to_sparse()
+
+    assert program.to_problem() is problem
+    assert program.to_sparse() is sparse
+    assert program.num_qubits == 3
+
+
+def test_num_qubits_does_not_build_sparse_problem():
+    """Test that num_qubits does not build a SparseProblem when none is cached."""
+    program = QuboProgram({("x1", "x2"): 0.5, ("x2", "x3"): 1.0})
+    assert program.num_qubits == 3
+    assert getattr(program, "_sparse_problem", None) is None
+
+
+def test_problem_canonical_form():
+    """Test that symmetric quadratic terms are merged and all terms sorted by label."""
+    problem = Problem(
+        problem_type=ProblemType.ISING,
+        linear={"b": 1.0, "a": -0.5},
+        quadratic={("c", "a"): 0.25, ("b", "a"): 1.0, ("a", "b"): 0.5},
+    )
+    canonical = problem.canonical()
+
+    assert canonical.linear == {"a": -0.5, "b": 1.0}
+    assert list(canonical.quadratic.items()) == [(("a", "b"), 1.5), (("a", "c"), 0.25)]
+    assert canonical == problem
+    assert problem.to_canonical_json() == json.dumps(
+        {
+            "problem_type": "ising",
+            "linear": {"a": -0.5, "b": 1.0},
+            "quadratic": {'["a", "b"]': 1.5, '["a", "c"]': 0.25},
+        }
+    )
+
+
+def test_problem_hash_independent_of_term_order():
+    """Test that equal problems have equal hashes and fingerprints, and deduplicate in sets."""
+    problem1 = QuboProblem({("x1", "x2"): 0.5, ("x3", "x4"): -0.3})
+    problem2 = QuboProblem({("x4", "x3"): -0.3, ("x2", "x1"): 0.5})
+    problem3 = QuboProblem({("x1", "x2"): 0.5, ("x3", "x4"): 0.3})
+
+    assert problem1 == problem2
+    assert hash(problem1) == hash(problem2)
+    assert problem1.fingerprint() == problem2.fingerprint() != problem3.fingerprint()
+    assert len({problem1, problem2, problem3}) == 2
+
+
+def test_annealing_program_hash(mock_annealing_program):
+    """Test that annealing programs with equal problems deduplicate by hash and fingerprint."""
+    program1 = QuboProgram({("x1", "x2"): 0.5})
+    program2 = QuboProgram({("x2", "x1"): 0.5})
+
+    assert program1 == program2
+    assert len({program1, program2}) == 1
+    assert program1.fingerprint() == program2.fingerprint()
+    assert program1.fingerprint() == mock_annealing_program(program2.to_problem()).fingerprint()
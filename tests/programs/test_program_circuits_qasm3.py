@@ -522,6 +522,53 @@ h q[0];
     assert qprogram._get_unused_qubit_indices() == {"q": set()}
 
 
+def test_get_unused_qubits_prefixed_register_names():
+    """Test that registers whose names prefix each other are analysed separately"""
+    program = """
+OPENQASM 3.0;
+include "stdgates.inc";
+qubit[3] q;
+qubit[12] qr;
+bit[1] c;
+h qr[11];
+if (c[0]) { x q[2]; }
+for int i in [0:1] { h qr[i]; }
+"""
+    qprogram = OpenQasm3Program(program)
+    assert qprogram._get_unused_qubit_indices() == {"q": {0, 1}, "qr": set()}
+
+
+def test_remove_idle_qubits_rewrites_operands_only():
+    """Test that remove_idle_qubits remaps multi-digit operands in nested blocks, but not
+    comments or gate definitions"""
+    qasm_str = """
+OPENQASM 3.0;
+include "stdgates.inc";
+gate g q { x q; }
+qubit[12] q;
+bit[2] c;
+cx q[10], q [3];
+c[0] = measure q[10];
+if (c[0]) { g q[11]; }
+// x q[10];
+"""
+    expected = """
+OPENQASM 3.0;
+include "stdgates.inc";
+gate g q { x q; }
+qubit[3] q;
+bit[2] c;
+cx q[1], q[0];
+c[0] = measure q[1];
+if (c[0]) { g q[2]; }
+// x q[10];
+"""
+    qprogram = OpenQasm3Program(qasm_str)
+    qprogram.remove_idle_qubits()
+    assert qprogram.program == expected
+    assert qprogram.num_qubits == 3
+
+
 @pytest.mark.parametrize(
     "program, expected_depth",
     [
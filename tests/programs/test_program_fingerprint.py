@@ -0,0 +1,103 @@
+# Copyright (C) 2024 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Unit tests for structural fingerprints of gate-model programs
+
+"""
+import cirq
+import pytest
+import sympy
+
+from qbraid.passes.qasm.analyze import gate_signatures
+from qbraid.programs import load_program
+from qbraid.programs.gate_model._model import _normalize_parameter
+from qbraid.transpiler import transpile
+
+
+def _cirq_circuit(theta: float, target: int = 1) -> cirq.Circuit:
+    """Return a small parametrized circuit."""
+    q = cirq.LineQubit.range(2)
+    return cirq.Circuit(
+        cirq.H(q[0]), cirq.rx(theta).on(q[target]), cirq.CNOT(q[0], q[1]), cirq.measure(q[0])
+    )
+
+
+def _fingerprint(program) -> str:
+    """Return the fingerprint of a program."""
+    return load_program(program).fingerprint()
+
+
+@pytest.mark.parametrize("target", ["cirq", "qiskit", "braket", "pytket", "qasm2", "qasm3"])
+def test_fingerprint_structural_equality(target):
+    """Test that fingerprints match within tolerance and differ on parameters or qubits."""
+    circuit = transpile(_cirq_circuit(0.5), target)
+    assert _fingerprint(circuit) == _fingerprint(circuit)
+    assert _fingerprint(circuit) == _fingerprint(transpile(_cirq_circuit(0.5 + 1e-13), target))
+    assert _fingerprint(circuit) != _fingerprint(transpile(_cirq_circuit(0.6), target))
+    assert _fingerprint(circuit) != _fingerprint(transpile(_cirq_circuit(0.5, 0), target))
+
+
+def test_fingerprint_ionq():
+    """Test that IonQ program fingerprints ignore gate key order."""
+    circuit = {
+        "qubits": 2,
+        "circuit": [{"gate": "h", "target": 0}, {"gate": "rx", "rotation": 0.5, "target": 1}],
+    }
+    reordered = {
+        "qubits": 2,
+        "circuit": [{"target": 0, "gate": "h"}, {"target": 1, "rotation": 0.5, "gate": "rx"}],
+    }
+    assert _fingerprint(circuit) == _fingerprint(reordered)
+    reordered["circuit"][1]["rotation"] = 0.6
+    assert _fingerprint(circuit) != _fingerprint(reordered)
+
+
+def test_fingerprint_qasm3_formatting_and_broadcast():
+    """Test that OpenQASM 3 fingerprints ignore formatting and gate broadcasting."""
+    broadcast = 'OPENQASM 3.0; include "stdgates.inc"; qubit[2] q; h q; rz(pi/2) q[-1];'
+    expanded = """
+    OPENQASM 3.0;
+    include "stdgates.inc";
+    qubit[2] q;
+    // expanded form
+    h q[0];
+    h q[1];
+    rz(1.5707963267948966) q[1];
+    """
+    assert _fingerprint(broadcast) == _fingerprint(expanded)
+    assert _fingerprint(broadcast) != _fingerprint(broadcast.replace("q[-1]", "q[0]"))
+
+
+def test_gate_signatures_multiple_registers():
+    """Test that qubits of several registers are given global indices."""
+    qasm = """
+    OPENQASM 3.0;
+    include "stdgates.inc";
+    qubit[2] a;
+    qubit[1] b;
+    bit[1] c;
+    ctrl @ x a[1], b[0];
+    c[0] = measure b[0];
+    """
+    program = load_program(qasm)
+    assert list(gate_signatures(program.parsed())) == [
+        ("ctrl@x", (), (1, 2)),
+        ("measure", ("c[0]",), (2,)),
+    ]
+
+
+def test_normalize_parameter():
+    """Test normalization of gate parameters."""
+    assert _normalize_parameter(-0.0, 10) == 0.0
+    assert _normalize_parameter(0.1 + 0.2, 10) == 0.3
+    assert _normalize_parameter([1 + 1e-12j, (2,)], 10) == ((1.0, 0.0), (2,))
+    assert _normalize_parameter(float("nan"), 10) == "nan"
+    assert _normalize_parameter(sympy.Symbol("theta"), 10) == "theta"
@@ -13,10 +13,12 @@ Unit tests for the typer module
 
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch
 
 import pytest
 
+from qbraid.programs import load_program
 from qbraid.programs.exceptions import QasmError
 from qbraid.programs.typer import (
     BaseQasmInstanceMeta,
@@ -167,6 +169,58 @@ def test_ionq_isinstance_valid_instance():
     assert isinstance(circuit, IonQDict)
 
 
+def test_ionq_isinstance_revalidates_validated_dict():
+    """Test that a validated IonQ dict is validated again on later checks."""
+    program = {"qubits": 2, "circuit": [{"gate": "h", "target": 0}]}
+    assert isinstance(program, IonQDict)
+    program["circuit"][0] = {"gate": "h", "target": "0"}
+    assert not isinstance(program, IonQDict)
+    program["circuit"][0] = {"gate": "h", "target": 0}
+    assert isinstance(program, IonQDict)
+    program["circuit"][0]["target"] = "0"
+    assert not isinstance(program, IonQDict)
+
+
+def test_ionq_isinstance_reuse_checks():
+    """Test that checks within reuse_checks validate each IonQ dict once."""
+    program = {"qubits": 2, "circuit": [{"gate": "cnot", "control": 0, "target": 1}]}
+    other = {"qubits": 2, "circuit": [{"gate": "cnot", "control": 0, "target": 1}]}
+    with IonQDictInstanceMeta.reuse_checks():
+        assert isinstance(program, IonQDict)
+        with patch.object(IonQDictInstanceMeta, "_validate_field", side_effect=AssertionError):
+            with IonQDictInstanceMeta.reuse_checks():
+                assert isinstance(program, IonQDict)
+            assert isinstance(program, IonQDict)
+            with pytest.raises(AssertionError):
+                isinstance(other, IonQDict)
+    with patch.object(IonQDictInstanceMeta, "_validate_field", side_effect=AssertionError):
+        with pytest.raises(AssertionError):
+            isinstance(program, IonQDict)
+
+
+def test_ionq_isinstance_reuse_checks_is_thread_local():
+    """Test that dicts remembered in one thread are validated again in other threads."""
+    program = {"qubits": 2, "circuit": [{"gate": "h", "target": 0}]}
+    with IonQDictInstanceMeta.reuse_checks():
+        assert isinstance(program, IonQDict)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            with patch.object(IonQDictInstanceMeta, "_validate_field", side_effect=AssertionError):
+                future = executor.submit(isinstance, program, IonQDict)
+                with pytest.raises(AssertionError):
+                    future.result()
+
+
+def test_load_program_validates_ionq_dict_once():
+    """Test that loading an IonQ dict validates its gates once."""
+    program = {"qubits": 2, "circuit": [{"gate": "h", "target": 0}]}
+    validate_field = IonQDictInstanceMeta._validate_field
+    with patch.object(
+        IonQDictInstanceMeta, "_validate_field", side_effect=validate_field
+    ) as mock_validate:
+        load_program(program)
+    assert mock_validate.call_count == 2
+
+
 @pytest.mark.parametrize(
     "invalid_instance",
     [
@@ -24,7 +24,12 @@ from qbraid.programs.alias_manager import (
     get_qasm_type_alias,
 )
 from qbraid.programs.exceptions import ProgramTypeError, QasmError
-from qbraid.programs.registry import derive_program_type_alias
+from qbraid.programs.registry import (
+    _TYPE_ALIAS_INDEX,
+    derive_program_type_alias,
+    register_program_type,
+    unregister_program_type,
+)
 
 from ..fixtures import packages_bell
 
@@ -298,3 +303,47 @@ def test_get_ionq_program_type_alias():
         ],
     }
     assert _get_program_type_alias(circuit) == "ionq"
+
+
+class _SubclassedList(list):
+    """List subclass used to test the program type index."""
+
+
+def test_type_index_memoizes_and_invalidates_on_register():
+    """Test that aliases are indexed per type and the index is reset on (un)registration."""
+    program = _SubclassedList()
+    with pytest.raises(ProgramTypeError):
+        _get_program_type_alias(program)
+    assert _SubclassedList in _TYPE_ALIAS_INDEX
+
+    register_program_type(list, "list")
+    try:
+        assert _SubclassedList not in _TYPE_ALIAS_INDEX
+        assert _get_program_type_alias(program) == "list"
+    finally:
+        unregister_program_type("list")
+
+    assert not _TYPE_ALIAS_INDEX
+    with pytest.raises(ProgramTypeError):
+        _get_program_type_alias(program)
+
+
+def test_type_index_checks_content_of_meta_types():
+    """Test that dict aliases still depend on the content of each dict instance."""
+    qubo = {("a", "b"): 1.0, ("a", "a"): -0.5}
+    ionq = {"qubits": 1, "circuit": [{"gate": "h", "target": 0}]}
+    assert _get_program_type_alias(qubo) == "qubo"
+    assert _get_program_type_alias(ionq) == "ionq"
+    assert _get_program_type_alias(qubo) == "qubo"
+    with pytest.raises(ProgramTypeError):
+        _get_program_type_alias({"not": "a program"})
+
+
+def test_type_index_respects_overridden_class():
+    """Test that programs overriding __class__ are matched with isinstance."""
+    program = Mock(spec=_SubclassedList)
+    register_program_type(_SubclassedList, "subclassed_list")
+    try:
+        assert _get_program_type_alias(program) == "subclassed_list"
+    finally:
+        unregister_program_type("subclassed_list")
@@ -32,12 +32,20 @@ from qbraid._caching import cache_disabled
 from qbraid.programs import (
     ExperimentType,
     ProgramSpec,
+    load_program,
     register_program_type,
     unregister_program_type,
 )
 from qbraid.programs.exceptions import ProgramTypeError
 from qbraid.programs.typer import IonQDict, QuboCoefficientsDict
-from qbraid.runtime import DeviceStatus, JobStatus, ProgramValidationError, Result, TargetProfile
+from qbraid.runtime import (
+    DeviceStatus,
+    JobStatus,
+    ProgramValidationError,
+    Result,
+    TargetProfile,
+    ValidationLevel,
+)
 from qbraid.runtime.exceptions import QbraidRuntimeError, ResourceNotFoundError
 from qbraid.runtime.native import QbraidDevice, QbraidJob, QbraidProvider
 from qbraid.runtime.native.provider import get_program_spec_lambdas
@@ -657,6 +665,56 @@ def test_validate_quera_device_qasm_validator(mock_quera_device, valid_qasm2):
         mock_quera_device.validate([valid_qasm2])
 
 
+def test_validate_skips_repeated_programs(mock_quera_device, valid_qasm2_no_meas):
+    """Test that identical programs in a batch are validated once."""
+    batch = [valid_qasm2_no_meas] * 3 + ["".join(valid_qasm2_no_meas)]
+    with patch.object(
+        mock_quera_device, "_validation_issues", wraps=mock_quera_device._validation_issues
+    ) as validation_issues:
+        mock_quera_device.validate(batch, suppress_device_warning=True)
+    validation_issues.assert_called_once()
+    assert validation_issues.call_args.args[0].program == valid_qasm2_no_meas
+
+
+def test_run_loads_each_program_once(mock_quera_device, valid_qasm2_no_meas):
+    """Test that validation and the auxiliary payload share one loaded program wrapper."""
+    with patch("qbraid.runtime.context.load_program", wraps=load_program) as loader:
+        with patch.object(mock_quera_device, "submit") as submit:
+            mock_quera_device.run(valid_qasm2_no_meas, shots=10)
+
+    loader.assert_called_once_with(valid_qasm2_no_meas)
+    payload = submit.call_args.kwargs["run_input"]
+    assert payload["circuitNumQubits"] == 2
+    assert payload["circuitDepth"] == 3
+
+
+@pytest.mark.parametrize("max_workers", [1, 4, None])
+def test_validate_reports_issues_in_batch_order(
+    mock_quera_device, valid_qasm2, valid_qasm2_no_meas, max_workers
+):
+    """Test that sequential and pooled validation report the same issues, in batch order."""
+    batch = [valid_qasm2_no_meas, valid_qasm2, valid_qasm2_no_meas.replace("q[2]", "q[101]")]
+
+    with pytest.raises(ProgramValidationError) as excinfo:
+        mock_quera_device.validate(batch, suppress_device_warning=True, max_workers=max_workers)
+    assert isinstance(excinfo.value.__cause__, ValueError)
+
+    mock_quera_device.set_options(validate=ValidationLevel.WARN)
+    with pytest.warns(UserWarning) as record:
+        mock_quera_device.validate(batch, suppress_device_warning=True, max_workers=max_workers)
+    messages = [str(warning.message) for warning in record]
+    assert "measurement" in messages[0]
+    assert messages[1].startswith("Number of qubits in the circuit (101)")
+
+
+def test_validate_is_sequential_by_default(mock_quera_device, valid_qasm2_no_meas):
+    """Test that a batch of distinct programs is validated without a thread pool by default."""
+    batch = [valid_qasm2_no_meas, valid_qasm2_no_meas.replace("q[2]", "q[3]")]
+    with patch("qbraid.runtime.device.ThreadPoolExecutor") as executor:
+        mock_quera_device.validate(batch, suppress_device_warning=True)
+    executor.assert_not_called()
+
+
 @pytest.mark.parametrize(
     "status, status_text",
     [("FAILED", "Custom status text"), (JobStatus.FAILED, "Different custom status text")],
@@ -0,0 +1,180 @@
+# Copyright (C) 2024 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Unit tests for the process-wide HTTP connection pool, against a local stub HTTP server
+
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock
+
+import pytest
+from qbraid_core.sessions import Session
+
+from qbraid.runtime import (
+    ConnectionPool,
+    QbraidProvider,
+    disable_connection_pool,
+    enable_connection_pool,
+    get_connection_pool,
+)
+from qbraid.runtime.ionq import IonQJob, IonQProvider, IonQSession
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serves IonQ-like job and result payloads, recording the client port of each request."""
+
+    protocol_version = "HTTP/1.1"
+    failures_left = 0
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Respond to GET requests."""
+        self.server.client_ports.append(self.client_address[1])
+        if StubHandler.failures_left > 0:
+            StubHandler.failures_left -= 1
+            self._respond(503, {"error": "unavailable"})
+        elif self.path.endswith("/results"):
+            self._respond(200, {"0": 0.5, "3": 0.5})
+        else:
+            job_id = self.path.rsplit("/", 1)[-1]
+            self._respond(
+                200,
+                {
+                    "id": job_id,
+                    "status": "completed",
+                    "target": "simulator",
+                    "qubits": 2,
+                    "shots": 10,
+                    "results_url": f"/v0.3/jobs/{job_id}/results",
+                },
+            )
+
+    def _respond(self, status: int, data: dict):
+        body = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Silence request logging."""
+
+
+@pytest.fixture
+def stub_server():
+    """Run a local HTTP server in a background thread."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.client_ports = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    StubHandler.failures_left = 0
+
+
+@pytest.fixture(autouse=True)
+def reset_connection_pool():
+    """Disable the process-wide connection pool after each test."""
+    yield
+    disable_connection_pool()
+
+
+def ionq_session(server, connection_pool=None) -> IonQSession:
+    """Return an IonQ session pointed at the stub server."""
+    session = IonQSession(api_key="fake-api-key", connection_pool=connection_pool)
+    session.base_url = f"http://127.0.0.1:{server.server_port}/v0.3"
+    return session
+
+
+def test_enable_disable_connection_pool():
+    """Test enabling, replacing and disabling the process-wide connection pool."""
+    assert get_connection_pool() is None
+    pool = enable_connection_pool(pool_maxsize=4)
+    assert get_connection_pool() is pool
+    assert repr(pool) == "ConnectionPool(pool_connections=10, pool_maxsize=4)"
+    assert enable_connection_pool() is not pool
+    disable_connection_pool()
+    assert get_connection_pool() is None
+
+
+def test_sessions_use_process_wide_pool():
+    """Test that provider sessions are mounted on the active pool only when one is enabled."""
+    session = IonQSession(api_key="fake-api-key")
+    pool = enable_connection_pool()
+    pooled = IonQProvider(api_key="fake-api-key").session
+    assert pooled.adapters["https://"] is pool.adapter
+    assert session.adapters["https://"] is not pool.adapter
+
+
+def test_explicit_pool_overrides_process_wide_pool():
+    """Test that a pool passed to a provider takes precedence over the process-wide pool."""
+    enable_connection_pool()
+    pool = ConnectionPool()
+    session = IonQProvider(api_key="fake-api-key", connection_pool=pool).session
+    assert session.adapters["http://"] is pool.adapter
+
+
+def test_qbraid_provider_mounts_client_session():
+    """Test that the session of the client of a QbraidProvider is mounted on the pool."""
+    pool = ConnectionPool()
+    client = Mock()
+    client.session = Session()
+    provider = QbraidProvider(client=client, connection_pool=pool)
+    assert provider.client.session.adapters["https://"] is pool.adapter
+
+
+def test_qbraid_provider_without_pool_ignores_client_session():
+    """Test that clients without a session are accepted when no pool is enabled."""
+    client = Mock(spec=["search_devices"])
+    provider = QbraidProvider(client=client)
+    assert provider.client is client
+
+
+def test_qbraid_provider_mounts_process_wide_pool_lazily():
+    """Test that the client session is mounted on the process-wide pool on first access."""
+    client = Mock()
+    client.session = Session()
+    provider = QbraidProvider(client=client)
+    pool = enable_connection_pool()
+    assert client.session.adapters["https://"] is not pool.adapter
+    assert provider.client.session.adapters["https://"] is pool.adapter
+
+
+def test_status_and_result_requests_reuse_connection(stub_server):
+    """Test that sessions sharing a pool reuse one keep-alive connection for all requests."""
+    pool = ConnectionPool()
+    sessions = [ionq_session(stub_server, pool) for _ in range(3)]
+
+    for i, session in enumerate(sessions):
+        job = IonQJob(f"job-{i}", session=session)
+        assert job.status().name == "COMPLETED"
+        assert job.result().data.get_counts() == {"00": 5, "11": 5}
+
+    assert len(stub_server.client_ports) >= 6
+    assert len(set(stub_server.client_ports)) == 1
+
+
+def test_unpooled_sessions_open_separate_connections(stub_server):
+    """Test that sessions without a shared pool each open their own connection."""
+    for session in [ionq_session(stub_server) for _ in range(3)]:
+        session.get_job("job")
+    assert len(set(stub_server.client_ports)) == 3
+
+
+def test_pool_retries_on_server_error(stub_server):
+    """Test that the retry policy of the pool applies to the mounted sessions."""
+    StubHandler.failures_left = 1
+    session = ionq_session(stub_server, ConnectionPool(backoff_factor=0))
+    assert session.get_job("job")["status"] == "completed"
+    assert len(stub_server.client_ports) == 2
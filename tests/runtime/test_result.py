@@ -21,8 +21,10 @@ import numpy as np
 import pytest
 
 from qbraid.programs import ExperimentType
+from qbraid.programs.annealing import QuboProblem
 from qbraid.runtime.native.result import NECVectorAnnealerResultData, QbraidQirSimulatorResultData
 from qbraid.runtime.postprocess import (
+    ahs_state_counts,
     format_counts,
     normalize_batch_bit_lengths,
     normalize_bit_lengths,
@@ -545,6 +547,62 @@ def test_annealing_result_data_get_result_experiment_type(annealing_result_data)
     assert annealing_result_data.experiment_type == ExperimentType.ANNEALING
 
 
+@pytest.fixture
+def ranked_annealing_result_data() -> AnnealingResultData:
+    """Fixture to create an AnnealingResultData object with repeated solutions."""
+    spins = [(1, 1), (1, 0), (0, 0), (1, 0), (0, 1)]
+    return AnnealingResultData(
+        solutions=[{"spin": {"x2": x2, "x1": x1}, "energy": 0} for x1, x2 in spins]
+    )
+
+
+@pytest.fixture
+def qubo_problem() -> QuboProblem:
+    """Fixture to create a two-variable QUBO problem."""
+    return QuboProblem({("x1", "x1"): -1.0, ("x1", "x2"): 3.0, ("x2", "x2"): -2.0})
+
+
+def test_annealing_result_data_energies(ranked_annealing_result_data, qubo_problem):
+    """Test scoring annealing solutions against a problem."""
+    samples = ranked_annealing_result_data.get_samples(["x1", "x2"])
+    assert samples.tolist() == [[1, 1], [1, 0], [0, 0], [1, 0], [0, 1]]
+    assert ranked_annealing_result_data.energies(qubo_problem).tolist() == [
+        0.0,
+        -1.0,
+        0.0,
+        -1.0,
+        -2.0,
+    ]
+    assert np.array_equal(
+        ranked_annealing_result_data.energies(qubo_problem.to_sparse()),
+        ranked_annealing_result_data.energies(qubo_problem),
+    )
+
+
+def test_annealing_result_data_aggregate(ranked_annealing_result_data):
+    """Test merging identical annealing solutions."""
+    samples, counts = ranked_annealing_result_data.aggregate(["x1", "x2"])
+    assert samples.tolist() == [[0, 0], [0, 1], [1, 0], [1, 1]]
+    assert counts.tolist() == [1, 1, 2, 1]
+
+    samples, counts = AnnealingResultData(solutions=None).aggregate()
+    assert samples.shape == (0, 0)
+    assert counts.size == 0
+
+
+def test_annealing_result_data_top_k(ranked_annealing_result_data, qubo_problem):
+    """Test re-ranking annealing solutions by energy."""
+    assert ranked_annealing_result_data.top_k(qubo_problem, k=2) == [
+        {"spin": {"x1": 0, "x2": 1}, "energy": -2.0, "num_occurrences": 1},
+        {"spin": {"x1": 1, "x2": 0}, "energy": -1.0, "num_occurrences": 2},
+    ]
+
+    ranked = ranked_annealing_result_data.top_k(qubo_problem, unique=False)
+    assert [solution["energy"] for solution in ranked] == [-2.0, -1.0, -1.0, 0.0, 0.0]
+    assert all(solution["num_occurrences"] == 1 for solution in ranked)
+    assert not ranked_annealing_result_data.top_k(qubo_problem, k=0)
+
+
 def test_annealing_result_data_to_dict(annealing_result_data):
     """Test AnnealingResultData to_dict."""
     result_dict = annealing_result_data.to_dict()
@@ -734,3 +792,30 @@ def test_ahs_result_data_from_dict_valid_data():
     assert len(result.measurements) == 1
     assert result.measurements[0].success is True
     assert result.get_counts() == {"00": 5, "01": 3}
+
+
+def test_ahs_state_counts():
+    """Test aggregating AHS state counts over successful shots, in order of first occurrence."""
+    success = np.array([True, True, False, True])
+    pre = np.array([[1, 1, 0], [1, 0, 1], [1, 1, 1], [1, 1, 0]])
+    post = np.array([[0, 1, 0], [1, 0, 0], [0, 0, 0], [0, 1, 0]])
+    assert ahs_state_counts(success, pre, post) == {"rge": 2, "ger": 1}
+    assert ahs_state_counts(np.zeros(4, dtype=bool), pre, post) is None
+
+
+def test_ahs_result_data_from_arrays():
+    """Test that array-backed AHS results compute counts and per-shot results on demand."""
+    success = [True, False, True]
+    pre = [[1, 1], [1, 0], [1, 1]]
+    post = [[0, 1], [0, 0], [0, 1]]
+    result_data = AhsResultData.from_arrays(success, pre, post)
+
+    assert result_data.get_counts() == {"rg": 2}
+    assert result_data.measurements[1] == AhsShotResult(
+        success=False, pre_sequence=np.array([1, 0]), post_sequence=np.array([0, 0])
+    )
+
+    shots = AhsResultData(measurements=result_data.measurements).get_shots()
+    assert shots[0].tolist() == success
+    assert shots[1].dtype == shots[2].dtype == np.int8
+    assert shots[1].tolist() == pre and shots[2].tolist() == post
@@ -0,0 +1,190 @@
+# Copyright (C) 2024 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+# pylint: disable=redefined-outer-name
+
+"""
+Unit tests for the on-disk job result cache
+
+"""
+import os
+import time
+
+import pytest
+
+from qbraid.runtime import (
+    GateModelResultData,
+    QuantumJob,
+    Result,
+    ResultCache,
+    disable_result_cache,
+    enable_result_cache,
+    get_result_cache,
+)
+from qbraid.runtime.cache import cached_result
+from qbraid.runtime.enums import JobStatus
+
+
+class MockJob(QuantumJob):
+    """Mock job that counts the number of times its result is fetched."""
+
+    def __init__(self, job_id: str, final_status: JobStatus = JobStatus.COMPLETED, **kwargs):
+        super().__init__(job_id, **kwargs)
+        self._final_status = final_status
+        self.fetch_count = 0
+
+    def status(self) -> JobStatus:
+        self._cache_metadata["status"] = self._final_status
+        return self._final_status
+
+    @cached_result
+    def result(self) -> Result:
+        self.status()
+        self.fetch_count += 1
+        data = GateModelResultData(measurement_counts={"00": 10, "11": 6})
+        return Result(device_id="mock_device", job_id=self.id, success=True, data=data)
+
+    def cancel(self) -> None:
+        return None
+
+
+@pytest.fixture
+def result_cache(tmp_path, monkeypatch):
+    """Enable the result cache in a temporary directory for the duration of a test."""
+    monkeypatch.setenv("DISABLE_CACHE", "0")
+    cache = enable_result_cache(directory=tmp_path)
+    yield cache
+    disable_result_cache()
+
+
+def test_result_cache_disabled_by_default():
+    """Test that jobs refetch results when the cache has not been enabled."""
+    assert get_result_cache() is None
+    job = MockJob("job_1")
+    job.result()
+    job.result()
+    assert job.fetch_count == 2
+
+
+def test_result_cache_hit_for_terminal_job(result_cache):
+    """Test that results of terminal jobs are served from disk, also across job instances."""
+    job = MockJob("job_1")
+    result = job.result()
+    assert job.fetch_count == 1
+    assert len(result_cache) == 1
+
+    other_job = MockJob("job_1")
+    cached = other_job.result()
+    assert other_job.fetch_count == 0
+    assert cached.job_id == result.job_id
+    assert cached.data.get_counts() == result.data.get_counts()
+
+
+def test_result_cache_skips_non_terminal_job(result_cache):
+    """Test that results of jobs that are not in a terminal state are not stored."""
+    job = MockJob("job_1", final_status=JobStatus.RUNNING)
+    job.result()
+    job.result()
+    assert job.fetch_count == 2
+    assert len(result_cache) == 0
+
+
+def test_result_cache_key_depends_on_job_class_and_id():
+    """Test that cache keys are unique per job class and job ID."""
+
+    class OtherJob(MockJob):
+        """Mock job of a different class."""
+
+    assert ResultCache.key(MockJob("a")) == ResultCache.key(MockJob("a"))
+    assert ResultCache.key(MockJob("a")) != ResultCache.key(MockJob("b"))
+    assert ResultCache.key(MockJob("a")) != ResultCache.key(OtherJob("a"))
+
+
+def test_result_cache_lru_eviction(tmp_path):
+    """Test that the least-recently-used entries are evicted when the size limit is exceeded."""
+    cache = ResultCache(directory=tmp_path, max_bytes=10**6)
+    data = GateModelResultData(measurement_counts={"0": 1})
+    for key in ("a", "b", "c"):
+        cache.put(key, Result(device_id="mock", job_id=key, success=True, data=data))
+
+    entry_size = cache.size() // 3
+    now = time.time() - 100
+    for offset, key in enumerate(("b", "a", "c")):
+        os.utime(tmp_path / f"{key}.pkl", (now + offset, now + offset))
+
+    cache.get("b")
+    cache._max_bytes = 2 * entry_size
+    cache.evict()
+
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
+    assert cache.get("c") is not None
+
+
+def test_result_cache_discards_corrupt_entry(tmp_path):
+    """Test that unreadable cache entries are treated as misses and removed."""
+    cache = ResultCache(directory=tmp_path)
+    path = tmp_path / "corrupt.pkl"
+    path.write_bytes(b"not a pickle")
+    assert cache.get("corrupt") is None
+    assert not path.exists()
+
+
+def test_result_cache_put_leaves_no_temporary_files(tmp_path):
+    """Test that atomic writes do not leave temporary files behind."""
+    cache = ResultCache(directory=tmp_path)
+    data = GateModelResultData(measurement_counts={"0": 1})
+    cache.put("a", Result(device_id="mock", job_id="a", success=True, data=data))
+    assert sorted(os.listdir(tmp_path)) == ["a.pkl"]
+    cache.clear()
+    assert len(cache) == 0
+
+
+posix_only = pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions")
+
+
+@posix_only
+def test_result_cache_creates_private_directory(tmp_path):
+    """Test that a new cache directory is created with owner-only permissions."""
+    directory = tmp_path / "results"
+    cache = ResultCache(directory=directory)
+    cache.put("a", {"value": 1})
+    assert directory.stat().st_mode & 0o777 == 0o700
+    assert cache.get("a") == {"value": 1}
+
+
+@posix_only
+def test_result_cache_ignores_shared_directory(tmp_path):
+    """Test that entries are neither written to nor loaded from a group-writable directory."""
+    cache = ResultCache(directory=tmp_path)
+    cache.put("a", {"value": 1})
+    tmp_path.chmod(0o770)
+    try:
+        assert cache.get("a") is None
+        cache.put("b", {"value": 2})
+        assert not (tmp_path / "b.pkl").exists()
+    finally:
+        tmp_path.chmod(0o700)
+    assert cache.get("a") == {"value": 1}
+
+
+@posix_only
+def test_result_cache_ignores_writable_entry(tmp_path):
+    """Test that an entry writable by others is not loaded."""
+    cache = ResultCache(directory=tmp_path)
+    cache.put("a", {"value": 1})
+    (tmp_path / "a.pkl").chmod(0o666)
+    assert cache.get("a") is None
+
+
+def test_result_cache_invalid_max_bytes():
+    """Test that a non-positive size limit raises a ValueError."""
+    with pytest.raises(ValueError):
+        ResultCache(max_bytes=0)
@@ -12,17 +12,25 @@
 Unit tests for converting Braket circuits to/from OpenQASM
 
 """
+import importlib
 import textwrap
 
 import numpy as np
+import openqasm3
+import pytest
 import qiskit
 from braket.circuits import Circuit
+from braket.ir.openqasm import Program
 
 from qbraid.interface import circuits_allclose
 from qbraid.transpiler.conversions.braket import braket_to_qasm3
 from qbraid.transpiler.conversions.qasm3 import qasm3_to_braket
 from qbraid.transpiler.conversions.qiskit import qiskit_to_qasm3
 
+qasm3_to_braket_module = importlib.import_module(
+    "qbraid.transpiler.conversions.qasm3.qasm3_to_braket"
+)
+
 
 def test_braket_to_qasm3_bell_circuit():
     """Test converting braket bell circuit to OpenQASM 3.0 string"""
@@ -106,3 +114,69 @@ def test_qiskit_to_qasm3_to_braket():
     qasm3_str = qiskit_to_qasm3(qc)
     circuit = qasm3_to_braket(qasm3_str)
     assert circuits_allclose(qc, circuit)
+
+
+QASM3_BRAKET_HEADER = """
+OPENQASM 3.0;
+include "stdgates.inc";
+qubit[2] q;
+qubit[1] r;
+bit[2] b;
+bit[3] c;
+h q;
+cx q[0], r[0];
+"""
+
+
+def _interpreted(qasm: str) -> Circuit:
+    """Convert an OpenQASM 3 string with the Braket OpenQASM interpreter."""
+    program = Program(source=qasm3_to_braket_module.transform_notation(qasm))
+    return Circuit.from_ir(source=program.source, inputs=program.inputs)
+
+
+def _measure_indices(circuit: Circuit) -> list:
+    """Return the classical bit index of each measurement in a Braket circuit."""
+    return [getattr(instr.operator, "_target_index", None) for instr in circuit.instructions]
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        "rz(3 * pi / 4) q[1]; sdg r[0]; p(-0.2) q[-1];",
+        "U(0.1, 0.2, 0.3) q[0]; gpi(0.1) r[0]; ms(0.1, 0.2, 0.1) q[0], q[1];",
+        "cp(0.1) q, r; swap q[0], q[1]; ccnot q[0], q[1], r[0];",
+        "c[2] = measure q[0]; b[1] = measure q[1];",
+        "c[1] = measure r[0]; b[0] = measure q[0];",
+        "measure q;",
+    ],
+)
+def test_qasm3_to_braket_native_matches_interpreter(body):
+    """Test that programs built from the syntax tree equal those built by Braket."""
+    qasm = QASM3_BRAKET_HEADER + body
+    native = qasm3_to_braket_module._build_braket_circuit(openqasm3.parse(qasm))
+    expected = _interpreted(qasm)
+    assert native is not None
+    assert native == expected
+    assert _measure_indices(native) == _measure_indices(expected)
+    assert qasm3_to_braket(openqasm3.parse(qasm)) == expected
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        "ctrl @ x q[0], q[1];",
+        "gate g a { h a; } g q[0];",
+        "input float theta; rx(theta) q[0];",
+        "c[1:2] = measure q;",
+        "b = measure q;",
+        "barrier q;",
+    ],
+)
+def test_qasm3_to_braket_falls_back_to_interpreter(body):
+    """Test that unsupported constructs are converted with the Braket interpreter."""
+    qasm = QASM3_BRAKET_HEADER + body
+    assert qasm3_to_braket_module._build_braket_circuit(openqasm3.parse(qasm)) is None
+    expected = _interpreted(qasm)
+    circuit = qasm3_to_braket(qasm)
+    assert circuit == expected
+    assert _measure_indices(circuit) == _measure_indices(expected)
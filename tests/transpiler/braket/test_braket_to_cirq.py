@@ -33,6 +33,7 @@ from cirq import LineQubit
 from cirq import ops as cirq_ops
 
 from qbraid.interface import circuits_allclose
+from qbraid.interface.random import random_unitary_matrix
 from qbraid.transpiler.conversions.braket import braket_to_cirq
 from qbraid.transpiler.conversions.braket.braket_to_cirq import (
     _from_braket_instruction,
@@ -345,3 +346,14 @@ def test_from_braket_instruction_three_qubit():
     instr.operator.to_matrix = lambda: np.eye(8)
     cirq_instr = _from_braket_instruction(instr, qubit_mapping)
     assert isinstance(cirq_instr[0].gate, cirq.MatrixGate)
+
+
+def test_repeated_unitary_gates_share_cirq_gate():
+    """Test that identical Braket unitaries are converted to a single Cirq matrix gate"""
+    matrix = random_unitary_matrix(4)
+    circuit = BKCircuit().unitary([0, 1], matrix).unitary([1, 2], matrix).unitary([0, 2], matrix)
+    cirq_circuit = braket_to_cirq(circuit)
+    gates = [op.gate for op in cirq_circuit.all_operations()]
+    assert len(gates) == 3
+    assert gates[0] is gates[1] is gates[2]
+    assert circuits_allclose(circuit, cirq_circuit)
@@ -392,3 +392,28 @@ def test_braket_custom_gate():
     custom_gate = C(sub_gate=Gate(1, "a"), targets=QubitSet([0, 1]))
     instr = custom_gate.c(QubitSet([0, 1]), sub_gate=Gate(1, "a"))
     assert isinstance(instr, Instruction)
+
+
+def test_repeated_gates_translated_once():
+    """Test that equal gates are translated once per conversion and reused on every qubit"""
+    qubits = LineQubit.range(3)
+    phased_x = ops.PhasedXPowGate(phase_exponent=0.3, exponent=0.7)
+    matrix_gate = ops.MatrixGate(cirq.unitary(ops.CZ**0.3))
+    cirq_circuit = Circuit(
+        [phased_x.on(q) for q in qubits]
+        + [matrix_gate.on(qubits[0], qubits[1]), matrix_gate.on(qubits[1], qubits[2])]
+    )
+    with patch(
+        "qbraid.transpiler.conversions.cirq.cirq_to_braket.kak_decomposition",
+        wraps=cirq.kak_decomposition,
+    ) as mock_kak:
+        braket_circuit = cirq_to_braket(cirq_circuit)
+    assert mock_kak.call_count == 1
+    assert circuits_allclose(braket_circuit, cirq_circuit)
+
+
+def test_subclassed_gate_uses_parent_translation():
+    """Test that gate lookup falls back to the closest registered parent class"""
+    q0, q1 = LineQubit.range(2)
+    braket_circuit = cirq_to_braket(Circuit(ops.X.on(q0), ops.CNOT(q0, q1)))
+    assert [instr.operator.name for instr in braket_circuit.instructions] == ["X", "CNot"]
@@ -0,0 +1,101 @@
+# Copyright (C) 2024 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Unit tests for the hand-written OpenQASM 2 to Cirq front end
+
+"""
+from unittest.mock import patch
+
+import cirq
+import numpy as np
+import pytest
+from cirq.contrib.qasm_import import QasmException
+
+from qbraid.transpiler.conversions.qasm2 import cirq_qasm_fast_parser
+from qbraid.transpiler.conversions.qasm2.cirq_qasm_parser import QasmParser
+
+HEADER = """// header comment
+OPENQASM 2.0;
+include "qelib1.inc";
+qreg q[3];
+qreg r[3];
+creg c[3];
+"""
+
+PROGRAMS = [
+    "h q[0]; cx q[0], q[1]; ccx q[0], q[1], q[2];",
+    "rx(pi / 2) q[0]; u3(0.1, -0.2e-1, 3 * pi ^ 2) q[1]; u2(.5, 1.) q[2];",
+    "p(-3 * 5 + 2) q[0]; rz(2 / -3 * 4) q[1]; ry(3^2^(-2)) q[2]; rx(-2 ^ 2) q[0];",
+    "u1(cos(pi) + sqrt(4) - ln(exp(1))) q[0]; cu1(atan(0.2)) q[0], q[1];",
+    "h q; cx q[0], r; swap q, r; rzz(0.3) q, r;",
+    "measure q[0] -> c[2]; measure r -> c;",
+    "x q[0]; rx(0.5) q[0]; rx(0.5) q[1]; rx(0.5) q[2]; measure q -> c;",
+]
+
+
+def _assert_same_result(qasm: str):
+    """Assert that the fast and PLY parsers return identical results."""
+    expected = QasmParser().parse(qasm)
+    with patch.object(cirq_qasm_fast_parser, "QasmParser", side_effect=AssertionError):
+        parsed = cirq_qasm_fast_parser.parse(qasm)
+    # qBraid's custom cirq gates have no value equality, so compare diagrams and unitaries
+    assert str(parsed.circuit) == str(expected.circuit)
+    assert np.allclose(
+        cirq.unitary(cirq.drop_terminal_measurements(parsed.circuit)),
+        cirq.unitary(cirq.drop_terminal_measurements(expected.circuit)),
+    )
+    assert parsed.qregs == expected.qregs
+    assert parsed.cregs == expected.cregs
+    assert parsed.qelib1Include == expected.qelib1Include
+    assert parsed.supportedFormat == expected.supportedFormat
+
+
+@pytest.mark.parametrize("body", PROGRAMS)
+def test_fast_parser_matches_ply_parser(body):
+    """Test that supported programs are parsed without the PLY parser, with equal results."""
+    _assert_same_result(HEADER + body)
+
+
+def test_fast_parser_basic_gates_without_include():
+    """Test parsing the built-in U and CX gates before qelib1.inc is included."""
+    _assert_same_result("OPENQASM 2.0;\nqreg q[2];\nU(0.1, 0.2, 0.3) q[0];\nCX q[0], q[1];")
+
+
+@pytest.mark.parametrize(
+    "qasm",
+    [
+        "qreg q[1];",
+        "OPENQASM 2.1;",
+        "OPENQASM 2.0;\nqreg q[1];\nx q[0];",
+        HEADER + "x q[3];",
+        HEADER + "cx q[0], q[0];",
+        HEADER + "cx q, c;",
+        HEADER + "rx(nonexistent(1)) q[0];",
+        HEADER + "measure q -> c[0];",
+        HEADER + "qreg q[1];",
+        HEADER + "h q[0]",
+    ],
+)
+def test_fast_parser_errors_match_ply_parser(qasm):
+    """Test that invalid programs raise the same errors as the PLY parser."""
+    with pytest.raises(QasmException) as expected:
+        QasmParser().parse(qasm)
+    with pytest.raises(QasmException) as err:
+        cirq_qasm_fast_parser.parse(qasm)
+    assert str(err.value) == str(expected.value)
+
+
+def test_fast_parser_reuses_parameterized_gates():
+    """Test that gates with equal parameters are built once per program."""
+    parsed = cirq_qasm_fast_parser.parse(HEADER + "rx(0.5) q[0]; rx(0.5) q[1]; rx(0.25) q[2];")
+    gates = [op.gate for op in parsed.circuit.all_operations()]
+    assert gates[0] is gates[1]
+    assert gates[2] == cirq.rx(0.25)
@@ -70,5 +70,5 @@ def test_raise_error():
     """Test raising an error when converting an unsupported gate."""
     with pytest.raises(ProgramConversionError):
         pytket_circuit = TKCircuit(2)
-        pytket_circuit.ISWAPMax(0, 1)
+        pytket_circuit.Sycamore(0, 1)
         transpile(pytket_circuit, "cirq", require_native=True)
@@ -12,6 +12,8 @@
 Unit tests for qasm2 to qasm3 transpilation
 
 """
+import io
+
 import pytest
 from qiskit.circuit import QuantumCircuit
 from qiskit.qasm2 import dumps as qasm2_dumps
@@ -21,7 +23,11 @@ from qbraid._logging import logger
 from qbraid.interface import circuits_allclose
 from qbraid.interface.random import random_circuit
 from qbraid.programs import load_program
-from qbraid.transpiler.conversions.qasm2.qasm2_to_qasm3 import _get_qasm3_gate_defs, qasm2_to_qasm3
+from qbraid.transpiler.conversions.qasm2.qasm2_to_qasm3 import (
+    _get_qasm3_gate_defs,
+    qasm2_to_qasm3,
+    qasm2_to_qasm3_lines,
+)
 
 gate_def_qasm3 = _get_qasm3_gate_defs()
 
@@ -362,3 +368,75 @@ def test_invalid_qasm2():
     """
     with pytest.raises(ValueError):
         qasm2_to_qasm3(invalid_qasm2)
+
+
+QASM2_WITH_CUSTOM_GATE = """
+OPENQASM 2.0;
+include "qelib1.inc";
+qreg q[3];
+creg c[3];
+gate mine a, b
+{
+  cu1(0.2) a, b;
+  h b;
+}
+mine q[0], q[1];
+rzz(0.3) q[1], q[2];
+measure q -> c;
+"""
+
+
+def test_qasm2_to_qasm3_includes_only_used_gate_defs():
+    """Test that only the qelib gate definitions used by the program are emitted"""
+    qasm3_str = qasm2_to_qasm3(QASM2_WITH_CUSTOM_GATE)
+    assert qasm3_str.count("gate cu1") == 1
+    assert qasm3_str.count("gate rzz") == 1
+    for name in ["u0", "cu3", "rccx", "c3x", "c4x"]:
+        assert f"gate {name}" not in qasm3_str
+    assert qasm3_str.index("gate cu1") < qasm3_str.index("gate mine")
+    assert qasm3_str.index("gate rzz") < qasm3_str.index("rzz(0.3) q[1], q[2];")
+    circuit_orig = QuantumCircuit.from_qasm_str(QASM2_WITH_CUSTOM_GATE)
+    assert circuits_allclose(circuit_orig, qasm3_loads(qasm3_str))
+
+
+def test_qasm2_to_qasm3_lines_from_file_object():
+    """Test converting an OpenQASM 2 program streamed from a file object"""
+    chunks = list(qasm2_to_qasm3_lines(io.StringIO(QASM2_WITH_CUSTOM_GATE)))
+    assert all(chunk.endswith("\n") for chunk in chunks)
+    assert "".join(chunks).strip() == qasm2_to_qasm3(QASM2_WITH_CUSTOM_GATE)
+
+
+def test_qasm2_to_qasm3_keeps_user_gate_redefinition():
+    """Test that a program's own definition of a qelib gate is not duplicated"""
+    qasm2_str = """
+OPENQASM 2.0;
+include "qelib1.inc";
+qreg q[2];
+gate rzz(theta) a, b { cx a,b; u1(theta) b; cx a,b; }
+rzz(0.5) q[0], q[1];
+"""
+    assert qasm2_to_qasm3(qasm2_str).count("gate rzz") == 1
+
+
+def test_qasm2_to_qasm3_removes_unused_user_gates():
+    """Test that gates defined but not used by the program are removed"""
+    qasm2_str = """
+OPENQASM 2.0;
+include "qelib1.inc";
+qreg q[2];
+gate inner a { h a; }
+gate outer a { inner a; }
+gate used a, b { cx a,b; }
+used q[0], q[1];
+"""
+    qasm3_str = qasm2_to_qasm3(qasm2_str)
+    assert "gate used" in qasm3_str
+    assert "gate outer" not in qasm3_str
+    assert "gate inner" not in qasm3_str
+    assert "gate outer" in "".join(qasm2_to_qasm3_lines(qasm2_str.splitlines()))
+
+
+def test_qasm2_to_qasm3_lines_invalid_version():
+    """Test that streaming a program with a non-2.0 version header raises an error"""
+    with pytest.raises(ValueError):
+        list(qasm2_to_qasm3_lines(["OPENQASM 3.0;", "qubit[2] q;"]))
@@ -472,3 +472,38 @@ def test_ionq_ms_gate_wrong_number_params(program_text):
     with pytest.raises(ValueError) as excinfo:
         _ = _parse_gates(program)
     assert "Invalid number of parameters" in str(excinfo.value)
+
+
+def test_openqasm3_to_ionq_evaluates_parameter_expressions():
+    """Test that gate parameters are evaluated as constant expressions."""
+    qasm = """
+    OPENQASM 3.0;
+    include "stdgates.inc";
+    qubit[2] q;
+    rx(-pi / 4 + 0.5) q[0];
+    rz(2 * τ) q[1];
+    ry(cos(0) ** 2) q;
+    """
+    program = parse(qasm)
+    expected = [
+        {"gate": "rx", "target": 0, "rotation": -0.7853981633974483 + 0.5},
+        {"gate": "rz", "target": 1, "rotation": 4 * 3.141592653589793},
+        {"gate": "ry", "target": 0, "rotation": 1.0},
+        {"gate": "ry", "target": 1, "rotation": 1.0},
+    ]
+    assert openqasm3_to_ionq(qasm)["circuit"] == expected
+    assert openqasm3_to_ionq(program) == openqasm3_to_ionq(qasm)
+    assert _parse_gates(OpenQasm3Program(qasm)) == expected
+
+
+def test_openqasm3_to_ionq_non_constant_rotation_raises():
+    """Test that a rotation angle that is not a constant expression raises a ValueError."""
+    qasm = """
+    OPENQASM 3.0;
+    include "stdgates.inc";
+    input float theta;
+    qubit[1] q;
+    rx(theta) q[0];
+    """
+    with pytest.raises(ValueError, match="Invalid rotation value 'theta'"):
+        openqasm3_to_ionq(qasm)
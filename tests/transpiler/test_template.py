@@ -0,0 +1,137 @@
+# Copyright (C) 2024 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+"""
+Unit tests for compile-once, bind-many conversion templates
+
+"""
+import unittest.mock
+
+import braket.circuits
+import numpy as np
+import pytest
+
+from qbraid.programs import load_program
+from qbraid.transpiler import ConversionTemplate, register_parameter_binder, transpile
+from qbraid.transpiler.template import _PARAMETER_BINDERS, get_parameter_binders
+
+QASM3_PARAMETRIC = """
+OPENQASM 3.0;
+include "stdgates.inc";
+input float theta;
+input float phi;
+qubit[2] q;
+rx(theta) q[0];
+rz(phi / 2) q[1];
+cx q[0], q[1];
+"""
+
+VALUES = {"theta": 0.3, "phi": -1.2}
+
+
+def _bound_qasm3(values: dict[str, float]) -> str:
+    """Return the parametric program with the values written in as literals."""
+    return f"""
+    OPENQASM 3.0;
+    include "stdgates.inc";
+    qubit[2] q;
+    rx({values['theta']}) q[0];
+    rz({values['phi']} / 2) q[1];
+    cx q[0], q[1];
+    """
+
+
+def _unitary(program) -> np.ndarray:
+    """Return the unitary of a program, in big-endian qubit order."""
+    return load_program(program).unitary()
+
+
+@pytest.mark.parametrize("target", ["qiskit", "braket", "cirq", "ionq"])
+def test_template_bind_matches_transpile(target):
+    """Test that binding a template gives the same program as transpiling bound QASM."""
+    template = ConversionTemplate(QASM3_PARAMETRIC, target)
+    assert template.source == "qasm3"
+    assert template.target == target
+    assert template.parameters == ["phi", "theta"]
+
+    bound = template.bind(VALUES)
+    expected = transpile(_bound_qasm3(VALUES), target)
+    if target == "ionq":
+        assert bound == expected
+    else:
+        assert np.allclose(_unitary(bound), _unitary(expected))
+
+
+def test_template_binds_target_without_reconverting():
+    """Test that parameters preserved by the conversion are bound without re-running it."""
+    template = ConversionTemplate(QASM3_PARAMETRIC, "braket")
+    assert template._bind_target
+    assert len(template.path) == 1
+
+    with unittest.mock.patch("qbraid.transpiler.template._run_conversion_path") as mock_run:
+        circuits = template.bind_many([{"theta": theta, "phi": 0.0} for theta in (0.1, 0.2)])
+    mock_run.assert_not_called()
+
+    assert [circuit.instructions[0].operator.angle for circuit in circuits] == [0.1, 0.2]
+    assert all(isinstance(circuit, braket.circuits.Circuit) for circuit in circuits)
+    assert not any(circuit.parameters for circuit in circuits)
+
+
+def test_template_replays_path_when_parameters_are_lost():
+    """Test binding at the source when the target cannot represent free parameters."""
+    template = ConversionTemplate(QASM3_PARAMETRIC, "ionq")
+    assert not template._bind_target
+
+    with unittest.mock.patch(
+        "qbraid.transpiler.graph.ConversionGraph.find_top_shortest_conversion_paths"
+    ) as mock_search:
+        program = template.bind(VALUES)
+    mock_search.assert_not_called()
+
+    rotations = [gate["rotation"] for gate in program["circuit"] if "rotation" in gate]
+    assert rotations == [0.3, -0.6]
+
+
+def test_template_qasm3_to_qasm3():
+    """Test that OpenQASM 3 inputs are substituted and their declarations removed."""
+    template = ConversionTemplate(QASM3_PARAMETRIC, "qasm3")
+    assert not template.path
+    qasm = template.bind({"theta": 1, "phi": 0.5})
+    assert "input" not in qasm
+    assert "rx(1) q[0];" in qasm
+    assert "rz(0.5 / 2) q[1];" in qasm
+
+
+@pytest.mark.parametrize(
+    "values", [{"theta": 0.1}, {"theta": 0.1, "phi": 0.2, "lambda": 0.3}], ids=["missing", "extra"]
+)
+def test_template_bind_validates_parameter_names(values):
+    """Test that values must be given for exactly the template's parameters."""
+    template = ConversionTemplate(QASM3_PARAMETRIC, "qiskit")
+    with pytest.raises(ValueError):
+        template.bind(values)
+
+
+def test_template_requires_parameter_binder():
+    """Test that a ValueError is raised if neither source nor target supports binding."""
+    circuit = braket.circuits.Circuit().h(0)
+    with unittest.mock.patch.dict(_PARAMETER_BINDERS, clear=True):
+        with pytest.raises(ValueError):
+            ConversionTemplate(circuit, "cirq")
+
+
+def test_register_parameter_binder():
+    """Test registering a parameter binder and rejecting duplicates."""
+    with unittest.mock.patch.dict(_PARAMETER_BINDERS):
+        register_parameter_binder("test_alias", lambda program: [], lambda program, values: None)
+        assert "test_alias" in get_parameter_binders()
+        with pytest.raises(ValueError):
+            register_parameter_binder("qiskit", lambda program: [], lambda program, values: None)
+    assert "test_alias" not in get_parameter_binders()
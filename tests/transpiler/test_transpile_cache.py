@@ -0,0 +1,187 @@
+# Copyright (C) 2024 qBraid
+#
+# This file is part of the qBraid-SDK
+#
+# The qBraid-SDK is free software released under the GNU General Public License v3
+# or later. You can redistribute and/or modify it under the terms of the GPL v3.
+# See the LICENSE file in the project root or <https://www.gnu.org/licenses/gpl-3.0.html>.
+#
+# THERE IS NO WARRANTY for the qBraid-SDK, as per Section 15 of the GPL v3.
+
+# pylint: disable=redefined-outer-name
+
+"""
+Unit tests for the transpile result cache
+
+"""
+import unittest.mock
+
+import braket.circuits
+import pytest
+
+from qbraid.transpiler import (
+    Conversion,
+    ConversionGraph,
+    TranspileCache,
+    disable_transpile_cache,
+    enable_transpile_cache,
+    get_transpile_cache,
+    transpile,
+)
+from qbraid.transpiler.cache import (
+    conversion_graph_key,
+    default_graph_key,
+    fingerprint_program,
+    graph_signature,
+)
+
+QASM2_BELL = """
+OPENQASM 2.0;
+include "qelib1.inc";
+qreg q[2];
+h q[0];
+cx q[0],q[1];
+"""
+
+
+@pytest.fixture
+def transpile_cache(monkeypatch):
+    """Enable an in-memory transpile cache for the duration of a test."""
+    monkeypatch.setenv("DISABLE_CACHE", "0")
+    cache = enable_transpile_cache(maxsize=2)
+    yield cache
+    disable_transpile_cache()
+
+
+def test_transpile_cache_disabled_by_default():
+    """Test that no transpile cache is active unless it has been enabled."""
+    assert get_transpile_cache() is None
+
+
+def test_transpile_cache_hit_skips_conversion(transpile_cache):
+    """Test that transpiling an identical program again does not run the conversion."""
+    first = transpile(QASM2_BELL, "braket")
+    with unittest.mock.patch("qbraid.transpiler.converter._run_conversion_path") as mock_run:
+        second = transpile("// comment\n" + QASM2_BELL.replace("\n", "\n  "), "braket")
+    mock_run.assert_not_called()
+
+    assert second == first
+    assert second is not first
+    info = transpile_cache.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+def test_transpile_cache_returns_copies(transpile_cache):
+    """Test that modifying a returned program does not modify the cached entry."""
+    circuit = transpile(QASM2_BELL, "braket")
+    circuit.add_instruction(braket.circuits.Instruction(braket.circuits.Gate.X(), 0))
+    assert len(transpile(QASM2_BELL, "braket").instructions) == 2
+    assert transpile_cache.cache_info().hits == 1
+
+
+def test_transpile_cache_key_depends_on_target_and_graph(transpile_cache):
+    """Test that results for different targets and conversion graphs are stored separately."""
+    transpile(QASM2_BELL, "braket")
+    transpile(QASM2_BELL, "qasm3")
+    assert transpile_cache.cache_info().misses == 2
+
+    graph = ConversionGraph(
+        conversions=[Conversion("qasm2", "braket", lambda qasm: braket.circuits.Circuit())]
+    )
+    assert transpile(QASM2_BELL, "braket", conversion_graph=graph) == braket.circuits.Circuit()
+    assert transpile_cache.cache_info().misses == 3
+
+
+def test_transpile_cache_lru_eviction(transpile_cache):
+    """Test that the least-recently-used entry is evicted when the cache is full."""
+    programs = [QASM2_BELL.replace("h q[0]", f"rx({i}) q[0]") for i in range(3)]
+    for program in programs:
+        transpile(program, "braket")
+    assert len(transpile_cache) == 2
+
+    transpile(programs[0], "braket")
+    transpile(programs[2], "braket")
+    info = transpile_cache.cache_info()
+    assert (info.hits, info.misses) == (1, 4)
+
+
+def test_transpile_cache_disk_tier(tmp_path):
+    """Test that entries are served from disk after they are no longer in memory."""
+    cache = TranspileCache(maxsize=1, directory=tmp_path)
+    circuit = braket.circuits.Circuit().h(0)
+    cache.put("a", circuit)
+    cache.put("b", braket.circuits.Circuit())
+    assert len(cache) == 1
+    assert len(cache.disk) == 2
+
+    other = TranspileCache(directory=tmp_path)
+    assert other.get("a") == circuit
+    assert other.cache_info().disk_hits == 1
+    assert other.get("missing") is None
+
+    other.clear()
+    assert len(cache.disk) == 0
+    assert other.cache_info() == (0, 0, 0, 1024, 0)
+
+
+def test_fingerprint_program():
+    """Test that fingerprints ignore QASM formatting but distinguish program contents."""
+    assert fingerprint_program(QASM2_BELL) == fingerprint_program(
+        "/* bell */ " + " ".join(QASM2_BELL.split())
+    )
+    assert fingerprint_program(QASM2_BELL) != fingerprint_program(QASM2_BELL.replace("h", "x"))
+    assert fingerprint_program(braket.circuits.Circuit().h(0)) == fingerprint_program(
+        braket.circuits.Circuit().h(0)
+    )
+    assert fingerprint_program(braket.circuits.Circuit().h(0)) != fingerprint_program(
+        braket.circuits.Circuit().h(1)
+    )
+    assert fingerprint_program({"b": 1, "a": [0]}) == fingerprint_program({"a": [0], "b": 1})
+    assert fingerprint_program(lambda: None) is None
+
+
+def test_graph_signature():
+    """Test that graph signatures change when conversions are added."""
+    graph = ConversionGraph()
+    assert graph_signature(graph) == graph_signature(ConversionGraph())
+    graph.add_conversion(Conversion("qasm2", "alice", lambda qasm: qasm))
+    assert graph_signature(graph) != graph_signature(ConversionGraph())
+
+
+def test_transpile_cache_hit_skips_graph_construction(transpile_cache):
+    """Test that cache hits for the default graph do not build the conversion graph."""
+    first = transpile(QASM2_BELL, "braket")
+    with unittest.mock.patch(
+        "qbraid.transpiler.converter.ConversionGraph", side_effect=AssertionError
+    ):
+        second = transpile(QASM2_BELL, "braket")
+    assert second == first
+    assert transpile_cache.cache_info().hits == 1
+
+
+def test_default_graph_key():
+    """Test that default graph keys depend on the graph options only."""
+    assert default_graph_key() == default_graph_key()
+    assert default_graph_key(nodes=["qasm2", "braket"]) == default_graph_key(
+        nodes={"braket", "qasm2"}
+    )
+    assert default_graph_key(require_native=True) != default_graph_key()
+    assert default_graph_key(conversions=[]) is None
+
+
+def test_conversion_graph_key_tracks_changes():
+    """Test that memoized graph keys are recomputed when conversions change."""
+    graph = ConversionGraph()
+    key = conversion_graph_key(graph)
+    assert conversion_graph_key(graph) == key == graph_signature(graph)
+    graph.add_conversion(Conversion("qasm2", "alice", lambda qasm: qasm))
+    added = conversion_graph_key(graph)
+    assert added != key
+    graph.add_conversion(Conversion("qasm2", "alice", lambda qasm: qasm), overwrite=True)
+    assert conversion_graph_key(graph) not in (key, added)
+
+
+def test_transpile_cache_invalid_maxsize():
+    """Test that a non-positive maximum size raises a ValueError."""
+    with pytest.raises(ValueError):
+        TranspileCache(maxsize=0)
@@ -178,3 +178,40 @@ def test_is_not_valid_gate():
     """Tests the is_valid_gate function with invalid gate."""
     assert not is_valid_gate("d")
     assert not is_valid_gate("//anything")
+
+
+@pytest.mark.parametrize("window", [(0, 10), (7, 19), (25, None)])
+def test_circuit_drawer_window(window):
+    """Tests drawing a window of columns of the circuit."""
+    start, stop = window
+    labels = 5
+    rows = []
+    for line in qasm_str_4_output.split("\n"):
+        row = line[:labels] + line[labels:][start:stop]
+        if row.strip() != "":
+            rows.append(row.rstrip())
+    assert _qasm3_drawer(qasm_str_4, start, stop) == "\n".join(rows)
+
+
+def test_circuit_print_pages(capsys):
+    """Tests printing the circuit in pages of columns."""
+    qasm3_drawer(qasm_str_1, page_width=15)
+    pages = [_qasm3_drawer(qasm_str_1, start, start + 15) for start in range(0, 39, 15)]
+    assert capsys.readouterr().out == "\n\n".join(pages) + "\n"
+
+
+def test_circuit_print_invalid_page_width():
+    """Tests that pages must be at least one column wide."""
+    with pytest.raises(ValueError):
+        qasm3_drawer(qasm_str_1, page_width=0)
+
+
+def test_circuit_drawer_register_names():
+    """Tests that gates are drawn on registers of any name, and across registers."""
+    renamed = (
+        qasm_str_1.replace("b[", "c[")
+        .replace("q[", "r[")
+        .replace("r[3]", "s[0]")
+        .replace("qreg r[4];", "qreg r[3];\nqreg s[1];")
+    )
+    assert _qasm3_drawer(renamed) == qasm_str_1_output